@@ -4,26 +4,68 @@ Advanced anti-bot scraper with multiple strategies
 """
 
 import requests
-from bs4 import BeautifulSoup
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import os
+import threading
 import time
 import random
 import logging
 from urllib.parse import urlparse
 from fake_useragent import UserAgent
 import re
+from backend.async_fetcher import AsyncFetcher
+from backend.block_detector import classify_response
+from backend.html_parser import parse_html
+from backend.politeness import get_default_scheduler, host_key
+from backend.selector_registry import SelectorRegistry
+from backend.strategy_stats import StrategyStats
 
 # Setup logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Title/price selectors per platform in priority order, compiled once at import
+PRODUCT_SELECTORS = SelectorRegistry.from_platform_configs({
+    'daraz': {
+        'selectors': {
+            'title': ['h1.pdp-product-name', '.pdp-product-name', 'h1', '.product-title'],
+            'price': ['.pdp-price', '.price-current', '.price', '.product-price']
+        }
+    },
+    'amazon': {
+        'selectors': {
+            'title': ['span#productTitle', '.a-size-large.product-title-word-break', 'h1.a-size-large', 'h1'],
+            'price': ['.a-price-whole', '.a-offscreen', '#priceblock_dealprice', '#priceblock_ourprice']
+        }
+    }
+})
+
 class AdvancedAntiBotScraper:
-    def __init__(self):
+    # Minimum (jittered) gap to the previous hit on the same host, per strategy.
+    # Measured from the last contact, so nothing waits for an idle host.
+    STEALTH_INTERVAL = (2, 5)
+    DELAYED_INTERVAL = (15, 25)
+    PROXY_INTERVAL = (15, 20)
+
+    def __init__(self, race=None, hedge_delay=None):
         self.session = requests.Session()
         self.ua = UserAgent()
+        self.politeness = get_default_scheduler()
+        # Race mode launches strategies concurrently with staggered (hedged)
+        # starts instead of one after another; off unless asked for
+        self.race = os.getenv('ADVANCED_RACE_STRATEGIES', '0') == '1' if race is None else race
+        self.hedge_delay = float(os.getenv('ADVANCED_HEDGE_DELAY', '2')) if hedge_delay is None else hedge_delay
+        # Priors (latency seconds, success rate) reflect each strategy's built-in pacing
+        self.strategy_stats = StrategyStats(priors={
+            'stealth': (4.0, 0.5),
+            'delayed': (20.0, 0.5),
+            'rotated': (5.0, 0.4),
+            'proxy': (18.0, 0.4)
+        })
         self.setup_stealth_session()
         
-    def setup_stealth_session(self):
-        """Setup session with maximum stealth"""
+    def build_stealth_headers(self):
+        """Browser-like header set with a randomly chosen realistic user agent"""
         # Rotate between realistic user agents
         user_agents = [
             'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
@@ -31,7 +73,7 @@ class AdvancedAntiBotScraper:
             'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
         ]
         
-        self.session.headers.update({
+        return {
             'User-Agent': random.choice(user_agents),
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.9',
@@ -47,64 +89,144 @@ class AdvancedAntiBotScraper:
             'Sec-CH-UA': '"Not_A Brand";v="8", "Chromium";v="120", "Google Chrome";v="120"',
             'Sec-CH-UA-Mobile': '?0',
             'Sec-CH-UA-Platform': '"Windows"'
-        })
+        }
+    
+    def new_stealth_session(self):
+        """Independent session for a strategy that must not share cookies or headers"""
+        session = requests.Session()
+        session.headers.update(self.build_stealth_headers())
+        return session
+    
+    def setup_stealth_session(self):
+        """Setup session with maximum stealth"""
+        self.session.headers.update(self.build_stealth_headers())
+        
+        # Async twin of the session for scrape_with_stealth_requests_async
+        self.async_fetcher = AsyncFetcher(
+            headers={k: v for k, v in self.session.headers.items() if k != 'Accept-Encoding'},
+            scheduler=self.politeness,
+            user_agent_factory=lambda: self.ua.random
+        )
         
         logger.info("Advanced anti-bot scraper initialized")
     
-    def scrape_with_multiple_strategies(self, url):
-        """Try multiple scraping strategies"""
+    def scrape_with_multiple_strategies(self, url, race=None):
+        """Try multiple scraping strategies, cheapest-for-this-domain first"""
         logger.info(f"ADVANCED SCRAPING: {url}")
         
-        # Strategy 1: Direct requests with stealth
-        result = self.scrape_with_stealth_requests(url)
-        if result[1] == "SUCCESS":
-            return result
+        if self.race if race is None else race:
+            return self.scrape_with_racing_strategies(url)
         
-        # Strategy 2: Delayed requests
-        logger.info("Trying delayed requests strategy...")
-        time.sleep(random.uniform(5, 10))
-        result = self.scrape_with_delayed_requests(url)
-        if result[1] == "SUCCESS":
-            return result
+        strategies = {
+            # Strategy 1: Direct requests with stealth
+            'stealth': self.scrape_with_stealth_requests,
+            # Strategy 2: Delayed requests
+            'delayed': self.scrape_with_delayed_requests,
+            # Strategy 3: Session rotation
+            'rotated': self.scrape_with_rotated_session,
+            # Strategy 4: Proxy-like behavior
+            'proxy': self.scrape_with_proxy_behavior
+        }
         
-        # Strategy 3: Session rotation
-        logger.info("Trying session rotation strategy...")
-        self.rotate_session()
-        result = self.scrape_with_stealth_requests(url)
-        if result[1] == "SUCCESS":
-            return result
+        domain = host_key(url)
+        for name in self.strategy_stats.order(domain, list(strategies)):
+            logger.info(f"Trying {name} strategy...")
+            started = time.monotonic()
+            result = strategies[name](url)
+            self.strategy_stats.record(domain, name, result[1] == "SUCCESS", time.monotonic() - started)
+            if result[1] == "SUCCESS":
+                return result
         
-        # Strategy 4: Proxy-like behavior
-        logger.info("Trying proxy-like behavior...")
-        result = self.scrape_with_proxy_behavior(url)
-        if result[1] == "SUCCESS":
-            return result
+        logger.warning("All strategies failed")
+        return None, "ALL_STRATEGIES_FAILED"
+    
+    def scrape_with_racing_strategies(self, url, hedge_delay=None):
+        """Race the strategies on separate sessions and keep the first SUCCESS.
+
+        Strategy k starts k * hedge_delay seconds after the first (in
+        per-domain cost order) unless a winner has already been found, so
+        worst-case latency is about the slowest single strategy plus the
+        stagger rather than the sum of all of them. Every racer also books
+        its request through the per-host politeness scheduler, so hedged
+        requests are never closer together than the host's normal pacing.
+        Losers still waiting to start are cancelled and in-flight ones have
+        their sessions closed.
+        """
+        hedge_delay = self.hedge_delay if hedge_delay is None else hedge_delay
+        # 'rotated' is left out: each racer already gets a fresh session, so it
+        # would just repeat the stealth request
+        strategies = {
+            'stealth': self.scrape_with_stealth_requests,
+            'delayed': self.scrape_with_delayed_requests,
+            'proxy': self.scrape_with_proxy_behavior
+        }
+        domain = host_key(url)
+        order = self.strategy_stats.order(domain, list(strategies))
+        finished = threading.Event()
+        sessions = []
+        sessions_lock = threading.Lock()
+        
+        def run(name, offset):
+            # Event.wait returns True if a winner was found before our start time
+            if finished.wait(offset):
+                return name, (None, "CANCELLED")
+            # The strategy's own pacing is skipped (paced=False) in favour of this slot
+            if finished.wait(self.politeness.reserve(url)):
+                return name, (None, "CANCELLED")
+            session = self.new_stealth_session()
+            with sessions_lock:
+                sessions.append(session)
+            logger.info(f"Racing {name} strategy...")
+            started = time.monotonic()
+            result = strategies[name](url, session=session, paced=False)
+            if not finished.is_set():
+                self.strategy_stats.record(domain, name, result[1] == "SUCCESS", time.monotonic() - started)
+            return name, result
+        
+        executor = ThreadPoolExecutor(max_workers=len(order))
+        futures = [executor.submit(run, name, i * hedge_delay) for i, name in enumerate(order)]
+        try:
+            for future in as_completed(futures):
+                name, result = future.result()
+                if result[1] == "SUCCESS":
+                    logger.info(f"Strategy '{name}' won the race")
+                    return result
+        finally:
+            finished.set()
+            executor.shutdown(wait=False, cancel_futures=True)
+            with sessions_lock:
+                for session in sessions:
+                    session.close()
         
         logger.warning("All strategies failed")
         return None, "ALL_STRATEGIES_FAILED"
     
-    def scrape_with_stealth_requests(self, url):
+    def scrape_with_rotated_session(self, url):
+        """Stealth requests on a freshly rotated session"""
+        self.rotate_session()
+        return self.scrape_with_stealth_requests(url)
+    
+    def scrape_with_stealth_requests(self, url, session=None, paced=True):
         """Stealth requests with maximum anti-detection"""
+        session = session or self.session
         try:
-            # Add random delay
-            time.sleep(random.uniform(2, 5))
+            # Pace against the host (no wait if it hasn't been hit recently)
+            if paced:
+                self.politeness.wait(url, self.STEALTH_INTERVAL)
             
             # Rotate user agent
-            self.session.headers.update({
+            session.headers.update({
                 'User-Agent': self.ua.random
             })
             
-            response = self.session.get(url, timeout=30)
+            response = session.get(url, timeout=30)
             logger.info(f"Stealth Response: {response.status_code}, Length: {len(response.content)}")
             
             if response.status_code == 200:
                 # Check for anti-bot content
-                content = response.text.lower()
-                if any(indicator in content for indicator in [
-                    'captcha', 'robot', 'bot detection', 'access denied',
-                    'blocked', 'suspicious activity', 'verify you are human'
-                ]):
-                    logger.warning("Anti-bot detected in stealth requests")
+                verdict = classify_response(response)
+                if verdict.blocked:
+                    logger.warning(f"Anti-bot detected in stealth requests ({verdict.reason}: {verdict.marker})")
                     return None, "ANTI_BOT"
                 
                 logger.info("SUCCESS: Stealth requests worked")
@@ -117,11 +239,32 @@ class AdvancedAntiBotScraper:
             logger.error(f"Stealth requests failed: {e}")
             return None, "ERROR"
     
-    def scrape_with_delayed_requests(self, url):
+    async def scrape_with_stealth_requests_async(self, url, session=None):
+        """Async stealth requests; the random delay no longer blocks a thread"""
+        response = await self.async_fetcher.fetch(url, session)
+        if response is None:
+            return None, "ERROR"
+        
+        logger.info(f"Async Stealth Response: {response.status_code}, Length: {len(response.content)}")
+        if response.status_code != 200:
+            logger.warning(f"HTTP {response.status_code} in async stealth requests")
+            return None, f"HTTP_{response.status_code}"
+        
+        verdict = classify_response(response)
+        if verdict.blocked:
+            logger.warning(f"Anti-bot detected in async stealth requests ({verdict.reason}: {verdict.marker})")
+            return None, "ANTI_BOT"
+        
+        logger.info("SUCCESS: Async stealth requests worked")
+        return response.text, "SUCCESS"
+    
+    def scrape_with_delayed_requests(self, url, session=None, paced=True):
         """Delayed requests to avoid rate limiting"""
+        session = session or self.session
         try:
-            # Longer delay
-            time.sleep(random.uniform(10, 15))
+            # Longer gap since this host was last contacted
+            if paced:
+                self.politeness.wait(url, self.DELAYED_INTERVAL)
             
             # Different user agent
             user_agents = [
@@ -129,18 +272,15 @@ class AdvancedAntiBotScraper:
                 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36'
             ]
             
-            self.session.headers.update({
+            session.headers.update({
                 'User-Agent': random.choice(user_agents)
             })
             
-            response = self.session.get(url, timeout=30)
+            response = session.get(url, timeout=30)
             logger.info(f"Delayed Response: {response.status_code}")
             
             if response.status_code == 200:
-                content = response.text.lower()
-                if any(indicator in content for indicator in [
-                    'captcha', 'robot', 'bot detection', 'access denied'
-                ]):
+                if classify_response(response).blocked:
                     return None, "ANTI_BOT"
                 
                 logger.info("SUCCESS: Delayed requests worked")
@@ -158,14 +298,16 @@ class AdvancedAntiBotScraper:
         self.setup_stealth_session()
         logger.info("Session rotated")
     
-    def scrape_with_proxy_behavior(self, url):
+    def scrape_with_proxy_behavior(self, url, session=None, paced=True):
         """Simulate proxy-like behavior"""
+        session = session or self.session
         try:
-            # Very long delay
-            time.sleep(random.uniform(15, 20))
+            # Very long gap since this host was last contacted
+            if paced:
+                self.politeness.wait(url, self.PROXY_INTERVAL)
             
             # Different headers
-            self.session.headers.update({
+            session.headers.update({
                 'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/118.0.0.0 Safari/537.36',
                 'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
                 'Accept-Language': 'en-US,en;q=0.5',
@@ -173,14 +315,11 @@ class AdvancedAntiBotScraper:
                 'Connection': 'keep-alive'
             })
             
-            response = self.session.get(url, timeout=30)
+            response = session.get(url, timeout=30)
             logger.info(f"Proxy Response: {response.status_code}")
             
             if response.status_code == 200:
-                content = response.text.lower()
-                if any(indicator in content for indicator in [
-                    'captcha', 'robot', 'bot detection', 'access denied'
-                ]):
+                if classify_response(response).blocked:
                     return None, "ANTI_BOT"
                 
                 logger.info("SUCCESS: Proxy behavior worked")
@@ -194,7 +333,7 @@ class AdvancedAntiBotScraper:
     
     def extract_product_data(self, content, platform):
         """Extract product data from content"""
-        soup = BeautifulSoup(content, 'html.parser')
+        soup = parse_html(content)
         
         data = {
             'title': 'Product Title Not Available',
@@ -208,71 +347,35 @@ class AdvancedAntiBotScraper:
         
         if platform == 'daraz':
             # Daraz specific extraction
-            title_selectors = [
-                'h1.pdp-product-name',
-                '.pdp-product-name',
-                'h1',
-                '.product-title'
-            ]
-            
-            for selector in title_selectors:
-                element = soup.select_one(selector)
-                if element:
-                    title = element.get_text(strip=True)
-                    if title and len(title) > 5:
-                        data['title'] = title
-                        logger.info(f"FOUND DARAZ TITLE: {title[:50]}...")
-                        break
-            
-            price_selectors = [
-                '.pdp-price',
-                '.price-current',
-                '.price',
-                '.product-price'
-            ]
+            for element in PRODUCT_SELECTORS.get('daraz', 'title').candidates(soup):
+                title = element.get_text(strip=True)
+                if title and len(title) > 5:
+                    data['title'] = title
+                    logger.info(f"FOUND DARAZ TITLE: {title[:50]}...")
+                    break
             
-            for selector in price_selectors:
-                element = soup.select_one(selector)
-                if element:
-                    price_text = element.get_text(strip=True)
-                    if price_text and any(symbol in price_text for symbol in ['₹', '$', 'PKR', 'Rs']):
-                        data['price'] = price_text
-                        logger.info(f"FOUND DARAZ PRICE: {price_text}")
-                        break
+            for element in PRODUCT_SELECTORS.get('daraz', 'price').candidates(soup):
+                price_text = element.get_text(strip=True)
+                if price_text and any(symbol in price_text for symbol in ['₹', '$', 'PKR', 'Rs']):
+                    data['price'] = price_text
+                    logger.info(f"FOUND DARAZ PRICE: {price_text}")
+                    break
         
         elif platform == 'amazon':
             # Amazon specific extraction
-            title_selectors = [
-                'span#productTitle',
-                '.a-size-large.product-title-word-break',
-                'h1.a-size-large',
-                'h1'
-            ]
-            
-            for selector in title_selectors:
-                element = soup.select_one(selector)
-                if element:
-                    title = element.get_text(strip=True)
-                    if title and len(title) > 5:
-                        data['title'] = title
-                        logger.info(f"FOUND AMAZON TITLE: {title[:50]}...")
-                        break
-            
-            price_selectors = [
-                '.a-price-whole',
-                '.a-offscreen',
-                '#priceblock_dealprice',
-                '#priceblock_ourprice'
-            ]
+            for element in PRODUCT_SELECTORS.get('amazon', 'title').candidates(soup):
+                title = element.get_text(strip=True)
+                if title and len(title) > 5:
+                    data['title'] = title
+                    logger.info(f"FOUND AMAZON TITLE: {title[:50]}...")
+                    break
             
-            for selector in price_selectors:
-                element = soup.select_one(selector)
-                if element:
-                    price_text = element.get_text(strip=True)
-                    if price_text and any(symbol in price_text for symbol in ['$', '€', '£', '₹']):
-                        data['price'] = price_text
-                        logger.info(f"FOUND AMAZON PRICE: {price_text}")
-                        break
+            for element in PRODUCT_SELECTORS.get('amazon', 'price').candidates(soup):
+                price_text = element.get_text(strip=True)
+                if price_text and any(symbol in price_text for symbol in ['$', '€', '£', '₹']):
+                    data['price'] = price_text
+                    logger.info(f"FOUND AMAZON PRICE: {price_text}")
+                    break
         
         return data
     
@@ -9,6 +9,8 @@ import logging
 from backend.scraper import ProductScraper
 from backend.sentiment_analyzer import SentimentAnalyzer
 from backend.trust_scorer import TrustScorer
+from backend.product_identity import canonical_product_key
+from backend.single_flight import SingleFlight
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -25,6 +27,8 @@ CORS(app)
 scraper = ProductScraper()
 sentiment_analyzer = SentimentAnalyzer()
 trust_scorer = TrustScorer()
+# Concurrent /analyze calls for the same product share one pipeline run
+analysis_flight = SingleFlight()
 
 @app.route('/')
 def index():
@@ -78,6 +82,47 @@ def validate_url(url):
         logger.error(f"URL validation error: {str(e)}")
         return False, "Invalid URL format"
 
+def run_analysis(product_url, netloc):
+    """Scrape -> sentiment -> trust pipeline for a single product URL"""
+    # Step 1: Scrape product data
+    product_data = scraper.scrape_product(product_url)
+    
+    if not product_data:
+        logger.warning(f"Failed to scrape product data, using fallback for {netloc}")
+        product_data = scraper.fallback_data.get('generic', {
+            'title': 'Unknown Product',
+            'price': '$0.00',
+            'rating': 0.0,
+            'review_count': 0,
+            'reviews': []
+        })
+    
+    # Step 2: Analyze sentiment (per-review features are built once for both stages)
+    reviews = product_data.get('reviews', [])
+    review_batch = trust_scorer.review_batch(reviews)
+    sentiment_results = sentiment_analyzer.analyze_reviews(reviews, batch=review_batch)
+    
+    # Step 3: Calculate trust score
+    trust_score = trust_scorer.calculate_trust_score(
+        product_data=product_data,
+        sentiment_data=sentiment_results,
+        domain=netloc,
+        review_batch=review_batch
+    )
+    
+    # Step 4: Generate recommendation
+    recommendation = trust_scorer.generate_recommendation(trust_score)
+    
+    # Step 5: Prepare response
+    return {
+        'product_info': product_data,
+        'sentiment_analysis': sentiment_results,
+        'trust_score': trust_score['overall_score'] / 100.0,  # Convert percentage to 0-1 scale
+        # Taken from this run's result rather than the scorer's shared "last" state
+        'trust_score_components': trust_score['component_scores'],
+        'recommendation': recommendation
+    }
+
 @app.route('/analyze', methods=['POST'])
 def analyze_product():
     """Analyze product URL for trust and sentiment"""
@@ -100,40 +145,12 @@ def analyze_product():
         parsed = urlparse(product_url)
         
         try:
-            # Step 1: Scrape product data
-            product_data = scraper.scrape_product(product_url)
-            
-            if not product_data:
-                logger.warning(f"Failed to scrape product data, using fallback for {parsed.netloc}")
-                product_data = scraper.fallback_data.get('generic', {
-                    'title': 'Unknown Product',
-                    'price': '$0.00',
-                    'rating': 0.0,
-                    'review_count': 0,
-                    'reviews': []
-                })
-            
-            # Step 2: Analyze sentiment
-            sentiment_results = sentiment_analyzer.analyze_reviews(product_data.get('reviews', []))
-            
-            # Step 3: Calculate trust score
-            trust_score = trust_scorer.calculate_trust_score(
-                product_data=product_data,
-                sentiment_data=sentiment_results,
-                domain=parsed.netloc
-            )
-            
-            # Step 4: Generate recommendation
-            recommendation = trust_scorer.generate_recommendation(trust_score)
-            
-            # Step 5: Prepare response
-            response = {
-                'product_info': product_data,
-                'sentiment_analysis': sentiment_results,
-                'trust_score': trust_score['overall_score'] / 100.0,  # Convert percentage to 0-1 scale
-                'trust_score_components': trust_scorer.get_score_components(),
-                'recommendation': recommendation
-            }
+            key = str(canonical_product_key(product_url))
+            response, shared = analysis_flight.do(key, run_analysis, product_url, parsed.netloc)
+            if shared:
+                logger.info(f"Served coalesced analysis for {key}")
+                # Report the URL this caller asked for, not the leader's variant
+                response = dict(response, product_info=dict(response['product_info'], url=product_url))
             
             return jsonify(response), 200
             
@@ -151,24 +168,6 @@ def analyze_product():
     except Exception as e:
         logger.error(f"Request error: {str(e)}\n{traceback.format_exc()}")
         return jsonify({'error': 'Invalid request'}), 400
-        
-        result = {
-            'product_info': {
-                'title': product_data['title'],
-                'price': product_data['price'],
-                'rating': product_data['rating'],
-                'review_count': product_data['review_count'],
-                'seller': product_data['seller']
-            },
-            'sentiment_analysis': sentiment_results,
-            'trust_score': trust_score,
-            'recommendation': recommendation
-        }
-        
-        return jsonify(result)
-        
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
 
 if __name__ == '__main__':
     app.run(debug=False, host='0.0.0.0', port=5000, use_reloader=False)
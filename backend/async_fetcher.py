@@ -0,0 +1,96 @@
+import asyncio
+import logging
+
+import aiohttp
+
+logger = logging.getLogger(__name__)
+
+
+class FetchResult:
+    """Minimal response object mirroring the bits of `requests.Response` we use"""
+
+    def __init__(self, url, status_code, content, headers, encoding=None):
+        self.url = url
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers
+        self.encoding = encoding or 'utf-8'
+
+    @property
+    def text(self):
+        return self.content.decode(self.encoding, errors='replace')
+
+    @property
+    def ok(self):
+        return 200 <= self.status_code < 400
+
+
+class AsyncFetcher:
+    """Asyncio HTTP fetch layer with bounded concurrency.
+
+    One shared `aiohttp.ClientSession` carries every request of a batch and a
+    semaphore caps how many are on the wire at once, so a single process can
+    keep hundreds of product downloads in flight without blocking threads on
+    sleeps or sockets.
+    """
+
+    def __init__(self, headers=None, max_concurrency=100, timeout=30,
+                 scheduler=None, user_agent_factory=None):
+        self.headers = dict(headers or {})
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self.scheduler = scheduler
+        self.user_agent_factory = user_agent_factory
+        self._semaphore = None
+        self._semaphore_loop = None
+
+    def create_session(self):
+        """Open a client session; must be called from inside a running loop"""
+        connector = aiohttp.TCPConnector(limit=self.max_concurrency, ttl_dns_cache=300)
+        return aiohttp.ClientSession(
+            headers=self.headers,
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=self.timeout)
+        )
+
+    def _get_semaphore(self):
+        # Semaphores are bound to the loop they are first awaited on
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._semaphore_loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._semaphore_loop = loop
+        return self._semaphore
+
+    async def fetch(self, url, session=None, headers=None):
+        """Fetch a single URL, returning a FetchResult or None on network error"""
+        if session is None:
+            async with self.create_session() as own_session:
+                return await self.fetch(url, own_session, headers)
+
+        request_headers = {'Referer': 'https://www.google.com'}
+        if self.user_agent_factory:
+            request_headers['User-Agent'] = self.user_agent_factory()
+        request_headers.update(headers or {})
+
+        # Pace per host before taking a concurrency slot so that requests
+        # waiting on a busy host don't starve fetches to other hosts
+        if self.scheduler:
+            await self.scheduler.wait_async(url)
+
+        async with self._get_semaphore():
+            try:
+                async with session.get(url, headers=request_headers) as resp:
+                    body = await resp.read()
+                    logger.info(f"Async Response Status: {resp.status} ({len(body)} bytes) for {url}")
+                    return FetchResult(str(resp.url), resp.status, body,
+                                       dict(resp.headers), resp.charset)
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                logger.warning(f"Async fetch failed for {url}: {e}")
+                return None
+
+    async def fetch_many(self, urls, session=None):
+        """Fetch many URLs concurrently; results keep the input order"""
+        if session is None:
+            async with self.create_session() as own_session:
+                return await self.fetch_many(urls, own_session)
+        return await asyncio.gather(*(self.fetch(url, session) for url in urls))
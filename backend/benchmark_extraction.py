@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Benchmark page extraction on large, real-world-sized product pages
+
+Usage: python -m backend.benchmark_extraction [--size-mb 1.5] [--repeat 5] [--parser lxml] [--workers 4]
+"""
+
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+import random
+import re
+import time
+import tracemalloc
+from backend.extraction_pool import ExtractionPool
+from backend.html_parser import ENGINES, parse_html, resolve_engine
+from backend.page_scan import scan_page
+from backend.scraper import ProductScraper
+
+
+def build_page(size_mb=1.5, reviews=40, seed=7):
+    """Synthetic Amazon-like page: deep nav/markup noise, inline scripts, reviews near the end"""
+    rng = random.Random(seed)
+    words = ['alpha', 'bravo', 'charlie', 'delta', 'echo', 'foxtrot', 'golf', 'hotel', 'india']
+    chunks = ['<html><head><title>Benchmark Product Page</title>',
+              '<script>var cfg = {' + ','.join(f'"k{i}": {i}' for i in range(2000)) + '};</script>',
+              '</head><body><div id="dp"><h1 id="productTitle">Benchmark Widget Pro</h1>',
+              '<div id="acrPopover"><i class="a-icon-alt">4.3 out of 5 stars</i></div>',
+              '<span id="acrCustomerReviewText">2,468 ratings</span>']
+    size = sum(len(c) for c in chunks)
+    target = int(size_mb * 1024 * 1024)
+    block = 0
+    while size < target * 0.9:
+        text = ' '.join(rng.choice(words) for _ in range(12))
+        chunk = (f'<div class="a-section s{block}"><ul class="nav">'
+                 + ''.join(f'<li><a href="/n/{block}/{i}"><span>{text}</span></a></li>' for i in range(5))
+                 + '</ul></div>')
+        chunks.append(chunk)
+        size += len(chunk)
+        block += 1
+    chunks.append('<div class="offer"><span class="price-label">Now $1,299.99</span></div>')
+    chunks.append('<a id="sellerProfileTriggerId">Benchmark Store</a>')
+    for i in range(reviews):
+        chunks.append(f'<div data-hook="review-body"><span>Review {i}: '
+                      + ' '.join(rng.choice(words) for _ in range(40)) + '</span></div>')
+    chunks.append('</div></body></html>')
+    return ''.join(chunks)
+
+
+def legacy_scan(soup):
+    """The separate full-tree sweeps `extract_data` used before `scan_page`"""
+    price_pattern = r'\$\s?[\d,]+\.?\d*'
+    price_texts = soup.find_all(string=re.compile(price_pattern))
+    price = re.search(price_pattern, price_texts[0]).group() if price_texts else None
+    seller = None
+    for sel_candidate in ['#sellerProfileTriggerId', '.seller-name', '.brand', '.sold-by', '.merchant-name']:
+        el = soup.select_one(sel_candidate)
+        if el and el.get_text(strip=True):
+            seller = el.get_text(strip=True)
+            break
+    reviews = [div.get_text(strip=True) for div in soup.find_all('div')
+               if div.get('data-hook') == 'review-body']
+    return price, seller, reviews
+
+
+def timed(fn, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def peak_mb(fn):
+    tracemalloc.start()
+    try:
+        fn()
+        return tracemalloc.get_traced_memory()[1] / 1024 / 1024
+    finally:
+        tracemalloc.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--size-mb', type=float, default=1.5)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--parser', default=None, help=f"one of {', '.join(ENGINES)}")
+    parser.add_argument('--workers', type=int, default=0, help="also compare threads vs an extraction pool")
+    args = parser.parse_args()
+
+    engine = resolve_engine(args.parser)
+    html = build_page(args.size_mb)
+    soup = parse_html(html, engine)
+    print(f"Page: {len(html) / 1024 / 1024:.2f} MB, parser: {engine}, best of {args.repeat}")
+
+    found = scan_page(soup)
+    assert legacy_scan(soup) == (found.price_text, found.seller, [r['text'] for r in found.reviews])
+
+    scraper = ProductScraper()
+    scraper.get_parser_engine = lambda platform: engine
+    parse_filter = scraper.parse_filters.get('amazon')
+
+    print(f"  parse:            {timed(lambda: parse_html(html, engine), args.repeat):8.1f} ms"
+          f"  (peak {peak_mb(lambda: parse_html(html, engine)):.1f} MB)")
+    if parse_filter:
+        print(f"  partial parse:    {timed(lambda: parse_html(html, engine, parse_filter), args.repeat):8.1f} ms"
+              f"  (peak {peak_mb(lambda: parse_html(html, engine, parse_filter)):.1f} MB)")
+    print(f"  legacy sweeps:    {timed(lambda: legacy_scan(soup), args.repeat):8.1f} ms")
+    print(f"  single-pass scan: {timed(lambda: scan_page(soup), args.repeat):8.1f} ms")
+    print(f"  extract_data:     {timed(lambda: scraper.extract_data(html, 'generic'), args.repeat):8.1f} ms (full)")
+    print(f"  extract_data:     {timed(lambda: scraper.extract_data(html, 'amazon'), args.repeat):8.1f} ms (amazon)")
+
+    if args.workers:
+        pages = [html] * (args.workers * 2)
+        with ThreadPoolExecutor(args.workers) as threads:
+            threaded = timed(lambda: list(threads.map(lambda p: scraper.extract_data(p, 'amazon'), pages)), 1)
+        pool = ExtractionPool(workers=args.workers)
+        try:
+            pool.warm()
+            with ThreadPoolExecutor(args.workers) as threads:
+                pooled = timed(lambda: list(threads.map(lambda p: pool.extract(p, 'amazon'), pages)), 1)
+        finally:
+            pool.close()
+        print(f"  {len(pages)} pages, {args.workers} threads:   {threaded:8.1f} ms")
+        print(f"  {len(pages)} pages, {args.workers} processes: {pooled:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+import re
+from collections import namedtuple
+
+# Phrases that only appear on challenge/block pages. Bare words like 'robot'
+# or 'verify' are deliberately absent: they occur on ordinary product pages
+# (robot vacuums, "verified purchase") and caused needless fallbacks.
+BODY_MARKERS = [
+    'verify you are human',
+    'verify you are a human',
+    'are you a robot',
+    "we just need to make sure you're not a robot",
+    'robot check',
+    'enter the characters you see below',
+    'type the characters you see in this image',
+    '/errors/validatecaptcha',
+    'captcha-delivery.com',
+    'px-captcha',
+    'cf-browser-verification',
+    'cf_chl_opt',
+    'checking your browser before accessing',
+    'unusual traffic from your computer',
+    'access to this page has been denied',
+    '_incapsula_resource',
+    'pardon our interruption',
+    'bot detection',
+    'suspicious activity from your',
+]
+
+# Block pages usually say what they are in the title, so the title may use
+# broader words than the body
+TITLE_MARKERS = [
+    'captcha', 'robot check', 'access denied', 'attention required',
+    'just a moment', 'are you a robot', 'security check', 'pardon our interruption',
+    'request blocked', 'verify you are human', 'human verification',
+]
+
+BLOCK_STATUSES = {403, 429, 503}
+
+
+def _compile(markers):
+    # One alternation per marker set so a page is scanned in a single pass
+    alternation = '|'.join(re.escape(m) for m in sorted(markers, key=len, reverse=True))
+    return re.compile(alternation, re.I), re.compile(alternation.encode('ascii'), re.I)
+
+
+_BODY_PATTERNS = _compile(BODY_MARKERS)
+_TITLE_PATTERNS = _compile(TITLE_MARKERS)
+_TITLE_TAG = (re.compile(r'<title[^>]*>(.*?)</title', re.I | re.S),
+              re.compile(rb'<title[^>]*>(.*?)</title', re.I | re.S))
+
+
+class BlockVerdict(namedtuple('BlockVerdict', ['blocked', 'reason', 'marker'])):
+    """Outcome of classifying a response.
+
+    `reason` is one of 'status', 'header', 'title' or 'body' when blocked and
+    None otherwise; `marker` is the status code, header or phrase that matched.
+    """
+    __slots__ = ()
+
+
+NOT_BLOCKED = BlockVerdict(False, None, None)
+
+
+def _search(patterns, data):
+    match = patterns[isinstance(data, (bytes, bytearray, memoryview))].search(data)
+    if match is None:
+        return None
+    marker = match.group(0)
+    return (marker.decode('ascii', 'replace') if isinstance(marker, bytes) else marker).lower()
+
+
+def _header_marker(headers):
+    lowered = {k.lower(): str(v).lower() for k, v in dict(headers).items()}
+    if lowered.get('cf-mitigated') == 'challenge':
+        return 'cf-mitigated'
+    if lowered.get('x-amzn-waf-action') in ('captcha', 'challenge', 'block'):
+        return 'x-amzn-waf-action'
+    return None
+
+
+def classify(body, status=200, headers=None):
+    """Classify a page as a block/challenge page.
+
+    `body` may be raw bytes (preferred, no decoding copy) or text such as a
+    Selenium `page_source`. Matching is case-insensitive and stops at the
+    first hit.
+    """
+    if headers:
+        marker = _header_marker(headers)
+        if marker:
+            return BlockVerdict(True, 'header', marker)
+    if status in BLOCK_STATUSES:
+        return BlockVerdict(True, 'status', status)
+    if not body:
+        return NOT_BLOCKED
+
+    title = _TITLE_TAG[isinstance(body, (bytes, bytearray, memoryview))].search(body)
+    if title:
+        marker = _search(_TITLE_PATTERNS, title.group(1))
+        if marker:
+            return BlockVerdict(True, 'title', marker)
+
+    marker = _search(_BODY_PATTERNS, body)
+    if marker:
+        return BlockVerdict(True, 'body', marker)
+    return NOT_BLOCKED
+
+
+def classify_response(response):
+    """Classify a `requests.Response` or FetchResult"""
+    return classify(response.content, response.status_code, response.headers)
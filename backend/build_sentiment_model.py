@@ -0,0 +1,215 @@
+"""Offline build of the sentiment model artifacts.
+
+Serving never trains; run this once per model change and ship the output:
+
+    python -m backend.build_sentiment_model [--output DIR] [--features tfidf|hashing] [--from-pickles DIR]
+    python -m backend.build_sentiment_model --corpus reviews.csv|reviews.jsonl [--epochs N] [--resume]
+"""
+import argparse
+import logging
+import os
+import pickle
+import pandas as pd
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.linear_model import LogisticRegression
+from sklearn.metrics import accuracy_score
+from sklearn.model_selection import train_test_split
+from backend.model_artifacts import DEFAULT_MODEL_DIR, hashing_vectorizer, save_artifacts
+from backend.stream_training import StreamingTrainer
+
+logger = logging.getLogger(__name__)
+
+# Expanded training data with more variety and better examples
+TRAINING_SAMPLES = [
+    # Positive reviews - Clear positive sentiment
+    ("This product is amazing! Highly recommend it.", "positive"),
+    ("Great quality and fast shipping.", "positive"),
+    ("Perfect product, exactly as described.", "positive"),
+    ("Excellent value for money.", "positive"),
+    ("Love it! Will buy again.", "positive"),
+    ("Good product overall.", "positive"),
+    ("Fantastic quality, exceeded expectations.", "positive"),
+    ("Best purchase I've made this year.", "positive"),
+    ("Outstanding product and service.", "positive"),
+    ("Highly satisfied with this purchase.", "positive"),
+    ("Works perfectly, no complaints.", "positive"),
+    ("Great deal, fast delivery.", "positive"),
+    ("Amazing product, will definitely buy again.", "positive"),
+    ("Superb quality and design.", "positive"),
+    ("Excellent customer service and product.", "positive"),
+    ("Wonderful product, very happy with purchase.", "positive"),
+    ("Top quality item, highly recommended.", "positive"),
+    ("Fantastic value, great quality.", "positive"),
+    ("Impressed with the quality and service.", "positive"),
+    ("Brilliant product, works exactly as expected.", "positive"),
+    ("Very pleased with this purchase.", "positive"),
+    ("Excellent product, fast shipping.", "positive"),
+    ("Great quality, would buy again.", "positive"),
+    ("Perfect fit and great quality.", "positive"),
+    ("Outstanding value for money.", "positive"),
+
+    # Neutral reviews - Clear neutral sentiment
+    ("It's okay, nothing special.", "neutral"),
+    ("Average quality product.", "neutral"),
+    ("Not bad, but could be better.", "neutral"),
+    ("It's fine, does the job.", "neutral"),
+    ("Meets expectations.", "neutral"),
+    ("Decent product.", "neutral"),
+    ("Standard quality, nothing extraordinary.", "neutral"),
+    ("It works as expected.", "neutral"),
+    ("Average product for the price.", "neutral"),
+    ("Nothing wrong with it, but nothing special.", "neutral"),
+    ("It's a decent product.", "neutral"),
+    ("Works fine, could be better.", "neutral"),
+    ("Average experience overall.", "neutral"),
+    ("It does what it's supposed to do.", "neutral"),
+    ("Standard quality product.", "neutral"),
+    ("Fair quality for the price.", "neutral"),
+    ("It's acceptable, nothing more.", "neutral"),
+    ("Average build quality.", "neutral"),
+    ("Does the job adequately.", "neutral"),
+    ("Neither good nor bad.", "neutral"),
+    ("Standard fare.", "neutral"),
+    ("It's functional.", "neutral"),
+    ("Mediocre quality.", "neutral"),
+    ("Average performance.", "neutral"),
+    ("It's okay.", "neutral"),
+
+    # Negative reviews - Clear negative sentiment
+    ("Terrible quality, waste of money.", "negative"),
+    ("Don't buy this, it's a scam.", "negative"),
+    ("Poor quality, broke after one day.", "negative"),
+    ("Worst purchase ever.", "negative"),
+    ("Completely disappointed.", "negative"),
+    ("Overpriced and low quality.", "negative"),
+    ("Fake product, not as advertised.", "negative"),
+    ("Avoid this seller at all costs.", "negative"),
+    ("This is junk, don't waste your money.", "negative"),
+    ("Very poor customer service.", "negative"),
+    ("Product arrived damaged.", "negative"),
+    ("Not worth the price.", "negative"),
+    ("Regret buying this item.", "negative"),
+    ("Awful product, avoid at all costs.", "negative"),
+    ("Cheap quality, breaks easily.", "negative"),
+    ("Waste of money, very disappointed.", "negative"),
+    ("Poor quality control.", "negative"),
+    ("Defective product, bad experience.", "negative"),
+    ("Terrible shipping and product quality.", "negative"),
+    ("Not recommended, poor value.", "negative"),
+    ("Disappointing purchase experience.", "negative"),
+    ("Low quality materials used.", "negative"),
+    ("Product doesn't work as described.", "negative"),
+    ("Very poor build quality.", "negative"),
+    ("Not worth buying, poor design.", "negative"),
+    ("Horrible product, complete waste.", "negative"),
+    ("Useless item, doesn't work.", "negative"),
+    ("Extremely disappointed with quality.", "negative"),
+    ("Bad experience, avoid this.", "negative"),
+    ("Poor value, not recommended.", "negative"),
+    ("Inferior quality product.", "negative"),
+    ("Failed to meet expectations.", "negative"),
+    ("Substandard materials used.", "negative"),
+    ("Doesn't work as advertised.", "negative"),
+    ("Poor construction quality.", "negative"),
+    ("Worst product I've ever bought.", "negative")
+]
+
+
+def make_vectorizer(features='tfidf', n_features=2 ** 18, idf=True):
+    """Unfitted feature pipeline: a vocabulary TF-IDF or fixed-width hashed n-grams"""
+    if features == 'hashing':
+        return hashing_vectorizer(n_features=n_features, idf=idf, stop_words='english', ngram_range=(1, 2))
+    if features != 'tfidf':
+        raise ValueError(f"Unknown feature pipeline: {features}")
+    return TfidfVectorizer(
+        max_features=1000,
+        stop_words='english',
+        ngram_range=(1, 2),
+        min_df=1
+    )
+
+
+def train_model(samples=TRAINING_SAMPLES, features='tfidf', n_features=2 ** 18, idf=True):
+    """Fit features + LogisticRegression on (text, label) pairs; returns (model, vectorizer, accuracy)"""
+    df = pd.DataFrame(samples, columns=['text', 'sentiment'])
+
+    vectorizer = make_vectorizer(features, n_features=n_features, idf=idf)
+    X_tfidf = vectorizer.fit_transform(df['text'])
+
+    X_train, X_test, y_train, y_test = train_test_split(
+        X_tfidf, df['sentiment'], test_size=0.2, random_state=42
+    )
+
+    model = LogisticRegression(random_state=42, max_iter=1000)
+    model.fit(X_train, y_train)
+
+    accuracy = accuracy_score(y_test, model.predict(X_test))
+    logger.info(f"Model accuracy: {accuracy:.2f}")
+    return model, vectorizer, accuracy
+
+
+def load_pickles(directory):
+    """(model, vectorizer) from the legacy sentiment_model.pkl / tfidf_vectorizer.pkl pair"""
+    with open(os.path.join(directory, 'sentiment_model.pkl'), 'rb') as f:
+        model = pickle.load(f)
+    with open(os.path.join(directory, 'tfidf_vectorizer.pkl'), 'rb') as f:
+        vectorizer = pickle.load(f)
+    return model, vectorizer
+
+
+def build(output, from_pickles=None, **options):
+    """Train (or convert legacy pickles) and write artifacts to `output`; returns the meta dict.
+
+    `options` go to `train_model` (features, n_features, idf).
+    """
+    if from_pickles:
+        model, vectorizer = load_pickles(from_pickles)
+    else:
+        model, vectorizer, _ = train_model(**options)
+    return save_artifacts(model, vectorizer, output)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Build the sentiment model artifacts')
+    parser.add_argument('--output', default=os.path.join(os.getenv('SENTIMENT_MODEL_DIR', DEFAULT_MODEL_DIR), 'sentiment'),
+                        help='artifact directory (default: $SENTIMENT_MODEL_DIR/sentiment)')
+    parser.add_argument('--features', choices=('tfidf', 'hashing'), default='tfidf',
+                        help='vocabulary TF-IDF or vocabulary-free hashed features')
+    parser.add_argument('--n-features', type=int,
+                        help='hashed feature width (default 2**18, or 2**20 with --corpus)')
+    parser.add_argument('--no-idf', action='store_true',
+                        help='skip idf weighting of hashed features')
+    parser.add_argument('--from-pickles', metavar='DIR',
+                        help='convert an existing pickled model instead of training')
+    corpus = parser.add_argument_group('streaming training (hashed features, SGD)')
+    corpus.add_argument('--corpus', metavar='PATH',
+                        help='labeled CSV or JSONL reviews, streamed in chunks instead of the built-in samples')
+    corpus.add_argument('--text-column', default='text')
+    corpus.add_argument('--label-column', default='sentiment')
+    corpus.add_argument('--chunk-size', type=int, default=10000)
+    corpus.add_argument('--epochs', type=int, default=1)
+    corpus.add_argument('--holdout', type=int, default=5, help='percent of reviews held out for evaluation')
+    corpus.add_argument('--checkpoint-every', type=int, default=50,
+                        help='chunks between checkpoints to OUTPUT.checkpoint/ (0 disables)')
+    corpus.add_argument('--resume', action='store_true', help='continue from the last checkpoint')
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+    if args.corpus:
+        trainer = StreamingTrainer(
+            n_features=args.n_features or 2 ** 20,
+            idf=not args.no_idf, holdout=args.holdout, chunk_size=args.chunk_size,
+            text_column=args.text_column, label_column=args.label_column
+        )
+        meta, accuracy = trainer.fit(args.corpus, args.output, epochs=args.epochs,
+                                     checkpoint_every=args.checkpoint_every, resume=args.resume)
+        print(f"Wrote sentiment model {meta['fingerprint']} to {args.output} "
+              f"({trainer.trained_rows} reviews, held-out accuracy {accuracy})")
+        return
+    meta = build(args.output, from_pickles=args.from_pickles, features=args.features,
+                 n_features=args.n_features or 2 ** 18, idf=not args.no_idf)
+    print(f"Wrote sentiment model {meta['fingerprint']} to {args.output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,166 @@
+import logging
+import queue
+import threading
+import time
+from contextlib import contextmanager
+
+logger = logging.getLogger(__name__)
+
+
+class DriverPoolTimeout(RuntimeError):
+    """Raised when no pooled driver becomes available in time"""
+
+
+class WebDriverPool:
+    """Bounded pool of long-lived Selenium drivers.
+
+    Drivers are created lazily through ``factory`` (or eagerly via ``warm``),
+    handed out with ``checkout``/``checkin`` and reset between uses so that
+    cookies and storage from one product page never leak into the next.
+    """
+
+    def __init__(self, factory, size=2, max_uses=50, checkout_timeout=60):
+        if size < 1:
+            raise ValueError("Driver pool size must be at least 1")
+        self.factory = factory
+        self.size = size
+        self.max_uses = max_uses
+        self.checkout_timeout = checkout_timeout
+        self._idle = queue.LifoQueue()
+        self._uses = {}
+        self._created = 0
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def warm(self, count=None):
+        """Pre-launch drivers so the first requests don't pay startup cost"""
+        target = self.size if count is None else min(count, self.size)
+        launched = 0
+        while launched < target:
+            driver = self._try_create()
+            if driver is None:
+                break
+            self._idle.put(driver)
+            launched += 1
+        logger.info(f"Driver pool warmed with {launched} driver(s)")
+        return launched
+
+    def checkout(self, timeout=None):
+        """Borrow a healthy driver, launching one if the pool is not full"""
+        if self._closed:
+            raise RuntimeError("Driver pool is closed")
+        timeout = self.checkout_timeout if timeout is None else timeout
+        deadline = time.monotonic() + timeout
+
+        while True:
+            try:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                driver = self._try_create()
+                if driver is None:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise DriverPoolTimeout(f"No driver available after {timeout}s")
+                    # Poll in short slices so capacity freed by a discarded
+                    # driver is picked up without waiting for a checkin.
+                    try:
+                        driver = self._idle.get(timeout=min(remaining, 0.5))
+                    except queue.Empty:
+                        continue
+
+            if self.is_healthy(driver):
+                return driver
+            logger.warning("Discarding unhealthy pooled driver")
+            self._destroy(driver)
+
+    def checkin(self, driver, discard=False):
+        """Return a driver to the pool, resetting its state first"""
+        if driver is None:
+            return
+        with self._lock:
+            self._uses[id(driver)] = self._uses.get(id(driver), 0) + 1
+            worn_out = self._uses[id(driver)] >= self.max_uses
+
+        if discard or worn_out or self._closed or not self.reset(driver):
+            self._destroy(driver)
+            return
+        self._idle.put(driver)
+
+    @contextmanager
+    def driver(self, timeout=None):
+        """Context manager around checkout/checkin; discards on error"""
+        driver = self.checkout(timeout)
+        failed = False
+        try:
+            yield driver
+        except Exception:
+            failed = True
+            raise
+        finally:
+            self.checkin(driver, discard=failed)
+
+    def is_healthy(self, driver):
+        """Cheap liveness probe against the browser session"""
+        try:
+            # A round-trip WebDriver command; works even with page JS disabled
+            driver.current_url
+            return True
+        except Exception:
+            return False
+
+    def reset(self, driver):
+        """Clear cookies and web storage and park the driver on a blank page"""
+        try:
+            driver.delete_all_cookies()
+            try:
+                driver.execute_script(
+                    "try { window.localStorage.clear(); } catch (e) {}"
+                    "try { window.sessionStorage.clear(); } catch (e) {}"
+                )
+            except Exception:
+                # Storage is unreachable on some pages (or with JS disabled)
+                pass
+            driver.get('about:blank')
+            return True
+        except Exception as e:
+            logger.warning(f"Failed to reset pooled driver: {e}")
+            return False
+
+    def stats(self):
+        """Return a snapshot of pool occupancy"""
+        with self._lock:
+            created = self._created
+        return {'size': self.size, 'created': created, 'idle': self._idle.qsize()}
+
+    def close(self):
+        """Quit every idle driver; drivers still checked out are quit on checkin"""
+        self._closed = True
+        while True:
+            try:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._destroy(driver)
+
+    def _try_create(self):
+        with self._lock:
+            if self._created >= self.size:
+                return None
+            self._created += 1
+        try:
+            driver = self.factory()
+        except Exception:
+            with self._lock:
+                self._created -= 1
+            raise
+        logger.info("Launched pooled Selenium driver")
+        return driver
+
+    def _destroy(self, driver):
+        try:
+            driver.quit()
+        except Exception as e:
+            logger.debug(f"Error quitting pooled driver: {e}")
+        with self._lock:
+            self._uses.pop(id(driver), None)
+            self._created -= 1
@@ -11,6 +11,9 @@ from urllib.parse import urlparse
 import time
 import random
 import logging
+from backend.async_fetcher import AsyncFetcher
+from backend.block_detector import classify, classify_response
+from backend.politeness import get_default_scheduler
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -20,7 +23,12 @@ class EnhancedScraper:
     def __init__(self):
         self.session = requests.Session()
         self.ua = UserAgent()
+        self.politeness = get_default_scheduler()
         self.setup_session()
+        # Pacing is handled by the retry loop itself, so the fetcher adds none
+        self.async_fetcher = AsyncFetcher(headers={k: v for k, v in self.session.headers.items()
+                                                   if k != 'Accept-Encoding'},
+                                          user_agent_factory=lambda: self.ua.random)
         
     def setup_session(self):
         """Initialize session with enhanced anti-bot protection"""
@@ -90,8 +98,8 @@ class EnhancedScraper:
         
         for attempt in range(max_retries):
             try:
-                # Add random delay
-                time.sleep(delay * (1 + random.uniform(-0.1, 0.1)))
+                # Pace against the host; retries back off harder
+                self.politeness.wait(url, self._retry_interval(attempt, delay))
                 
                 # Update headers
                 self.session.headers.update({
@@ -103,9 +111,9 @@ class EnhancedScraper:
                 logger.info(f"Response Status: {response.status_code}")
                 
                 if response.status_code == 200:
-                    content = response.text.lower()
-                    if any(marker in content for marker in ['robot', 'captcha', 'verify']):
-                        raise Exception("Anti-bot measures detected")
+                    verdict = classify_response(response)
+                    if verdict.blocked:
+                        raise Exception(f"Anti-bot measures detected ({verdict.reason}: {verdict.marker})")
                     
                     logger.info("SUCCESS: Requests scraping worked")
                     return response
@@ -121,20 +129,56 @@ class EnhancedScraper:
         
         return None
 
+    def _retry_interval(self, attempt, delay):
+        """Host interval for a retry; the first attempt uses the scheduler default"""
+        if attempt == 0:
+            return None
+        return (delay * 0.9, delay * 1.1)
+
+    async def scrape_with_anti_bot_async(self, url, session=None):
+        """Async version of `scrape_with_anti_bot` using non-blocking sleeps"""
+        logger.info(f"ASYNC SCRAPING WITH ANTI-BOT PROTECTION: {url}")
+        
+        delay = random.uniform(2, 4)
+        max_retries = 3
+        
+        for attempt in range(max_retries):
+            await self.politeness.wait_async(url, self._retry_interval(attempt, delay))
+            response = await self.async_fetcher.fetch(url, session)
+            
+            if response is not None and response.status_code == 200:
+                verdict = classify_response(response)
+                if verdict.blocked:
+                    logger.warning(f"Attempt {attempt + 1} failed: Anti-bot measures detected "
+                                   f"({verdict.reason}: {verdict.marker})")
+                    delay *= 2
+                    continue
+                logger.info("SUCCESS: Async requests scraping worked")
+                return response
+            
+            logger.warning(f"Attempt {attempt + 1} failed")
+            delay *= 1.5 if response is not None else 2
+        
+        logger.warning("All attempts failed, switching to Selenium")
+        return None
+
     def scrape_with_selenium(self, url):
         """Scrape using Selenium with anti-bot protection"""
         logger.info(f"SELENIUM SCRAPING: {url}")
         driver = None
         try:
             driver = self.get_selenium_driver()
+            self.politeness.wait(url)
             driver.get(url)
             time.sleep(random.uniform(3, 5))
             
-            if any(marker in driver.page_source.lower() for marker in ['robot', 'captcha']):
-                logger.error("ANTI-BOT DETECTED in Selenium")
+            page_source = driver.page_source
+            verdict = classify(page_source)
+            if verdict.blocked:
+                logger.error(f"ANTI-BOT DETECTED in Selenium ({verdict.reason}: {verdict.marker})")
                 return None
                 
-            return driver.page_source
+            return page_source
             
         except Exception as e:
             logger.error(f"Selenium error: {str(e)}")
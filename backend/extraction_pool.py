@@ -0,0 +1,69 @@
+import asyncio
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+# Per-process extractor, built once by the pool initializer
+_extractor = None
+# Shared with the parent; `warm` makes every worker wait on it at once
+_warm_barrier = None
+
+
+def _init_worker(barrier):
+    global _extractor, _warm_barrier
+    from backend.scraper import ProductScraper
+    _extractor = ProductScraper.for_extraction()
+    _warm_barrier = barrier
+
+
+def _ping(timeout):
+    # A worker runs one task at a time, so the barrier only trips once
+    # `workers` distinct processes are up and initialized
+    _warm_barrier.wait(timeout)
+    return os.getpid()
+
+
+def _extract(content, platform, url):
+    return _extractor.extract_data(content, platform, url)
+
+
+class ExtractionPool:
+    """Process pool that runs `ProductScraper.extract_data` off the GIL.
+
+    Page content (bytes or str) goes in and the plain data dict comes back,
+    so request threads only wait on the result while parsing scales with
+    cores. Workers are spawned rather than forked because the parent runs
+    server threads and browser sessions.
+    """
+
+    def __init__(self, workers=None, timeout=60):
+        self.workers = workers or os.cpu_count() or 2
+        self.timeout = timeout
+        context = multiprocessing.get_context('spawn')
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=context,
+            initializer=_init_worker,
+            initargs=(context.Barrier(self.workers),)
+        )
+
+    def warm(self):
+        """Start all `workers` processes and load their extractors; returns the worker pids"""
+        futures = [self._executor.submit(_ping, self.timeout) for _ in range(self.workers)]
+        pids = {f.result(timeout=self.timeout) for f in futures}
+        logger.info(f"Extraction pool ready with {len(pids)} worker(s)")
+        return pids
+
+    def extract(self, content, platform, url=None):
+        return self._executor.submit(_extract, content, platform, url).result(timeout=self.timeout)
+
+    async def extract_async(self, content, platform, url=None):
+        loop = asyncio.get_running_loop()
+        return await asyncio.wait_for(
+            loop.run_in_executor(self._executor, _extract, content, platform, url), self.timeout)
+
+    def close(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,47 @@
+import logging
+import os
+from bs4 import BeautifulSoup, FeatureNotFound
+
+logger = logging.getLogger(__name__)
+
+# Tree builders in order of preference: lxml is several times faster than the
+# pure-Python builders on large product pages; html5lib parses like a browser
+# and html.parser is always available.
+ENGINES = ('lxml', 'html5lib', 'html.parser')
+DEFAULT_ENGINE = 'lxml'
+
+_resolved = {}
+
+
+def resolve_engine(name=None):
+    """Return the first installed tree builder starting at `name`.
+
+    Unknown or missing engines fall through the preference order so a
+    configured 'lxml' degrades to 'html5lib' and finally 'html.parser'.
+    """
+    name = (name or os.getenv('HTML_PARSER') or DEFAULT_ENGINE).lower()
+    if name in _resolved:
+        return _resolved[name]
+    candidates = ENGINES[ENGINES.index(name):] if name in ENGINES else ENGINES
+    for engine in candidates:
+        try:
+            BeautifulSoup('', engine)
+        except FeatureNotFound:
+            continue
+        if engine != name:
+            logger.warning(f"HTML parser '{name}' unavailable, using '{engine}'")
+        _resolved[name] = engine
+        return engine
+    return 'html.parser'
+
+
+def parse_html(content, engine=None, parse_only=None):
+    """Build a BeautifulSoup tree with the configured engine.
+
+    `parse_only` limits tree construction to matching subtrees; html5lib
+    cannot honour it, so it is ignored there.
+    """
+    engine = resolve_engine(engine)
+    if engine == 'html5lib':
+        parse_only = None
+    return BeautifulSoup(content, engine, parse_only=parse_only)
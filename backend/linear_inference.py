@@ -0,0 +1,106 @@
+import numpy as np
+from collections import Counter
+from sklearn.feature_extraction.text import HashingVectorizer, TfidfVectorizer
+from sklearn.pipeline import Pipeline
+from sklearn.utils import murmurhash3_32
+
+
+class LinearSentimentModel:
+    """A fitted vectorizer + linear classifier reduced to plain arrays.
+
+    Scoring a handful of reviews through sklearn spends most of its time in
+    per-call input validation; here each review is tokenized with the
+    vectorizer's own analyzer, mapped to columns (vocabulary lookup or the
+    same murmurhash as HashingVectorizer), weighted and normalized like the
+    original, and dotted with the coefficient columns it touches.
+    """
+
+    def __init__(self, analyzer, coef, intercept, classes, vocabulary=None, n_features=None,
+                 idf=None, norm='l2', sublinear_tf=False, binary=False):
+        self.analyzer = analyzer
+        self.coef = coef
+        self.intercept = np.asarray(intercept, dtype=np.float64)
+        self.classes_ = np.asarray(classes, dtype=object)
+        self.vocabulary = vocabulary
+        self.n_features = n_features
+        self.idf = idf
+        self.norm = norm
+        self.sublinear_tf = sublinear_tf
+        self.binary = binary
+
+    @classmethod
+    def compile(cls, model, vectorizer):
+        """Build from a fitted (TF-IDF | hashing [+ TfidfTransformer]) vectorizer and linear model"""
+        params = {'coef': model.coef_, 'intercept': model.intercept_, 'classes': model.classes_}
+        if isinstance(vectorizer, TfidfVectorizer):
+            return cls(vectorizer.build_analyzer(), vocabulary=vectorizer.vocabulary_,
+                       idf=vectorizer.idf_ if vectorizer.use_idf else None, norm=vectorizer.norm,
+                       sublinear_tf=vectorizer.sublinear_tf, binary=vectorizer.binary, **params)
+        transformer = None
+        if isinstance(vectorizer, Pipeline):
+            vectorizer, transformer = vectorizer.named_steps['hashing'], vectorizer.named_steps['tfidf']
+        if not isinstance(vectorizer, HashingVectorizer) or vectorizer.alternate_sign:
+            raise TypeError(f"Cannot compile vectorizer {type(vectorizer).__name__}")
+        if transformer is None:
+            return cls(vectorizer.build_analyzer(), n_features=vectorizer.n_features,
+                       norm=vectorizer.norm, binary=vectorizer.binary, **params)
+        if vectorizer.norm is not None:
+            raise TypeError("Cannot compile a normalized hashing step followed by TfidfTransformer")
+        return cls(vectorizer.build_analyzer(), n_features=vectorizer.n_features,
+                   idf=transformer.idf_ if transformer.use_idf else None, norm=transformer.norm,
+                   sublinear_tf=transformer.sublinear_tf, binary=vectorizer.binary, **params)
+
+    def _counts(self, text):
+        if self.vocabulary is not None:
+            lookup = self.vocabulary.get
+            return Counter(column for column in map(lookup, self.analyzer(text)) if column is not None)
+        width = self.n_features
+        return Counter(abs(murmurhash3_32(term, seed=0)) % width for term in self.analyzer(text))
+
+    def decision_function(self, texts):
+        """Class scores for all texts with one gather over the touched coefficient columns"""
+        scores = np.tile(self.intercept, (len(texts), 1))
+        rows, columns, counts = [], [], []
+        for row, text in enumerate(texts):
+            found = self._counts(text)
+            rows.extend([row] * len(found))
+            columns.extend(found.keys())
+            counts.extend(found.values())
+        if not columns:
+            return scores
+
+        rows = np.asarray(rows, dtype=np.intp)
+        columns = np.asarray(columns, dtype=np.intp)
+        weights = np.asarray(counts, dtype=np.float64)
+        if self.binary:
+            weights[:] = 1.0
+        elif self.sublinear_tf:
+            weights = np.log(weights) + 1
+        if self.idf is not None:
+            weights *= self.idf[columns]
+        if self.norm in ('l1', 'l2'):
+            magnitude = np.abs(weights) if self.norm == 'l1' else weights * weights
+            totals = np.bincount(rows, weights=magnitude, minlength=len(texts))
+            weights /= (totals if self.norm == 'l1' else np.sqrt(totals))[rows]
+        # Each entry's contribution to every class, summed per review
+        contributions = self.coef[:, columns] * weights
+        for k in range(scores.shape[1]):
+            scores[:, k] += np.bincount(rows, weights=contributions[k], minlength=len(texts))
+        return scores
+
+    def predict_proba(self, texts):
+        """Same probabilities as LogisticRegression: sigmoid for two classes, softmax otherwise"""
+        scores = self.decision_function(texts)
+        if scores.shape[1] == 1:
+            positive = 1 / (1 + np.exp(-scores[:, 0]))
+            return np.column_stack([1 - positive, positive])
+        scores -= scores.max(axis=1, keepdims=True)
+        np.exp(scores, out=scores)
+        scores /= scores.sum(axis=1, keepdims=True)
+        return scores
+
+    def predict(self, texts):
+        scores = self.decision_function(texts)
+        if scores.shape[1] == 1:
+            return self.classes_[(scores[:, 0] > 0).astype(int)]
+        return self.classes_[scores.argmax(axis=1)]
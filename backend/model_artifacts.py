@@ -0,0 +1,165 @@
+import hashlib
+import json
+import os
+import shutil
+import time
+import numpy as np
+from sklearn.feature_extraction.text import HashingVectorizer, TfidfTransformer, TfidfVectorizer
+from sklearn.linear_model import LogisticRegression
+from sklearn.pipeline import Pipeline
+
+# Bump when the on-disk layout changes; older artifacts are then rebuilt
+ARTIFACT_FORMAT = 1
+
+DEFAULT_MODEL_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'models')
+
+# TfidfVectorizer parameters that affect `transform` and can be stored as JSON
+VECTORIZER_PARAMS = ('lowercase', 'stop_words', 'ngram_range', 'max_features', 'norm', 'use_idf',
+                     'smooth_idf', 'sublinear_tf', 'token_pattern', 'analyzer', 'strip_accents',
+                     'min_df', 'max_df', 'binary')
+
+# HashingVectorizer parameters; the hashed features need no vocabulary at all
+HASHING_PARAMS = ('n_features', 'alternate_sign', 'lowercase', 'stop_words', 'ngram_range', 'norm',
+                  'token_pattern', 'analyzer', 'strip_accents', 'binary')
+TRANSFORMER_PARAMS = ('norm', 'use_idf', 'smooth_idf', 'sublinear_tf')
+
+_ARRAYS = ('vocabulary', 'idf', 'coef', 'intercept', 'classes')
+
+
+def hashing_vectorizer(n_features=2 ** 18, idf=True, **params):
+    """Fixed-width hashed n-gram features, optionally reweighted by idf learned at fit time"""
+    if not idf:
+        return HashingVectorizer(n_features=n_features, alternate_sign=False, **params)
+    return Pipeline([
+        ('hashing', HashingVectorizer(n_features=n_features, alternate_sign=False, norm=None, **params)),
+        ('tfidf', TfidfTransformer())
+    ])
+
+
+def _feature_spec(vectorizer):
+    """(kind, JSON params, arrays) describing a fitted vectorizer"""
+    if isinstance(vectorizer, TfidfVectorizer):
+        params = vectorizer.get_params()
+        terms = sorted(vectorizer.vocabulary_, key=vectorizer.vocabulary_.get)
+        return 'tfidf', {name: params[name] for name in VECTORIZER_PARAMS}, {
+            'vocabulary': np.array(terms, dtype=str),
+            'idf': np.asarray(vectorizer.idf_, dtype=np.float64)
+        }
+    transformer = None
+    if isinstance(vectorizer, Pipeline):
+        vectorizer, transformer = vectorizer.named_steps['hashing'], vectorizer.named_steps['tfidf']
+    if not isinstance(vectorizer, HashingVectorizer):
+        raise TypeError(f"Unsupported vectorizer {type(vectorizer).__name__}")
+    params = vectorizer.get_params()
+    spec = {name: params[name] for name in HASHING_PARAMS}
+    arrays = {}
+    if transformer is not None:
+        params = transformer.get_params()
+        spec['transformer'] = {name: params[name] for name in TRANSFORMER_PARAMS}
+        if transformer.use_idf:
+            arrays['idf'] = np.asarray(transformer.idf_, dtype=np.float64)
+    return 'hashing', spec, arrays
+
+
+def _build_vectorizer(kind, params, arrays):
+    params = dict(params)
+    params['ngram_range'] = tuple(params['ngram_range'])
+    if kind == 'tfidf':
+        vectorizer = TfidfVectorizer(**params)
+        vectorizer.vocabulary_ = {term: index for index, term in enumerate(arrays['vocabulary'].tolist())}
+        vectorizer.idf_ = arrays['idf']
+        return vectorizer
+    transformer = params.pop('transformer', None)
+    vectorizer = HashingVectorizer(**params)
+    if transformer is None:
+        return vectorizer
+    tfidf = TfidfTransformer(**transformer)
+    if 'idf' in arrays:
+        tfidf.idf_ = arrays['idf']
+    return Pipeline([('hashing', vectorizer), ('tfidf', tfidf)])
+
+
+def fingerprint(arrays):
+    """Content hash of the model arrays; identifies a model version"""
+    digest = hashlib.sha1()
+    for name in _ARRAYS:
+        if name not in arrays:
+            continue
+        array = np.ascontiguousarray(arrays[name])
+        digest.update(name.encode('ascii'))
+        digest.update(str(array.dtype).encode('ascii'))
+        digest.update(array.tobytes())
+    return digest.hexdigest()[:16]
+
+
+def model_arrays(model, vectorizer):
+    """Plain numpy arrays holding everything inference needs"""
+    arrays = _feature_spec(vectorizer)[2]
+    arrays.update({
+        'coef': np.asarray(model.coef_, dtype=np.float64),
+        'intercept': np.asarray(model.intercept_, dtype=np.float64),
+        'classes': np.asarray(model.classes_).astype(str)
+    })
+    return arrays
+
+
+def save_artifacts(model, vectorizer, directory):
+    """Write a fitted vectorizer/model pair as .npy arrays plus meta.json; returns the meta dict"""
+    kind, params, _ = _feature_spec(vectorizer)
+    arrays = model_arrays(model, vectorizer)
+    meta = {
+        'format': ARTIFACT_FORMAT,
+        'fingerprint': fingerprint(arrays),
+        'created_at': time.time(),
+        'features': kind,
+        'vectorizer': params
+    }
+    # Write next to the target and swap in, so readers never see a partial model
+    staging = f"{directory}.tmp-{os.getpid()}"
+    aside = f"{directory}.old-{os.getpid()}"
+    shutil.rmtree(staging, ignore_errors=True)
+    shutil.rmtree(aside, ignore_errors=True)
+    os.makedirs(staging)
+    for name, array in arrays.items():
+        np.save(os.path.join(staging, f'{name}.npy'), array)
+    with open(os.path.join(staging, 'meta.json'), 'w') as f:
+        json.dump(meta, f, indent=2)
+    # Two renames leave the old model readable until the new one is in place;
+    # already mapped arrays keep working after the old files are removed
+    if os.path.isdir(directory):
+        os.replace(directory, aside)
+    os.replace(staging, directory)
+    shutil.rmtree(aside, ignore_errors=True)
+    return meta
+
+
+def load_artifacts(directory, mmap=True):
+    """Load (model, vectorizer, meta) from `save_artifacts` output.
+
+    Arrays are memory-mapped read-only by default, so every worker process
+    that loads the same files shares their pages.
+    """
+    with open(os.path.join(directory, 'meta.json')) as f:
+        meta = json.load(f)
+    if meta.get('format') != ARTIFACT_FORMAT:
+        raise ValueError(f"Unsupported model artifact format {meta.get('format')} in {directory}")
+
+    mode = 'r' if mmap else None
+    arrays = {}
+    for name in _ARRAYS:
+        path = os.path.join(directory, f'{name}.npy')
+        if os.path.exists(path):
+            arrays[name] = np.load(path, mmap_mode=mode)
+
+    if fingerprint(arrays) != meta['fingerprint']:
+        # meta.json and the arrays came from different saves (read during a swap)
+        raise ValueError(f"Model artifacts in {directory} do not match their fingerprint")
+
+    # Artifacts written before hashing features existed are all TF-IDF
+    vectorizer = _build_vectorizer(meta.get('features', 'tfidf'), meta['vectorizer'], arrays)
+
+    model = LogisticRegression()
+    model.coef_ = arrays['coef']
+    model.intercept_ = arrays['intercept']
+    model.classes_ = np.asarray(arrays['classes']).astype(object)
+    return model, vectorizer, meta
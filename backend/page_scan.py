@@ -0,0 +1,83 @@
+import re
+from bs4 import Comment, NavigableString, Tag
+
+PRICE_PATTERN = re.compile(r'\$\s?[\d,]+\.?\d*')
+
+# Seller locations in priority order, as (attribute, value) so they can be
+# matched while walking the tree instead of one CSS query each
+SELLER_SELECTORS = (
+    ('id', 'sellerProfileTriggerId'),
+    ('class', 'seller-name'),
+    ('class', 'brand'),
+    ('class', 'sold-by'),
+    ('class', 'merchant-name'),
+)
+
+# The same nodes as CSS, for building parse filters that must keep them
+SCAN_SELECTORS = [('#' if attr == 'id' else '.') + value for attr, value in SELLER_SELECTORS] + [
+    'div[data-hook="review-body"]']
+
+
+class PageCandidates:
+    """Nodes of interest collected from one traversal of a parsed page"""
+
+    def __init__(self):
+        self.title = None
+        self.price_text = None
+        self.reviews = []
+        self.sellers = {}
+
+    @property
+    def seller(self):
+        """Text of the first seller selector, in priority order, whose first match has text"""
+        for selector in SELLER_SELECTORS:
+            text = self.sellers.get(selector)
+            if text:
+                return text
+        return None
+
+
+def scan_page(soup, want_price=True):
+    """Walk the tree once and collect title, price text, seller and review nodes.
+
+    Replaces separate `find_all` sweeps; the price regex only runs until the
+    first match and not at all when `want_price` is False.
+    """
+    found = PageCandidates()
+    for node in soup.descendants:
+        if isinstance(node, Tag):
+            if node.name == 'title' and found.title is None:
+                found.title = node.string
+            attrs = node.attrs
+            if not attrs:
+                continue
+            if node.name == 'div' and attrs.get('data-hook') == 'review-body':
+                text = node.get_text(strip=True)
+                if text:
+                    found.reviews.append({'text': text})
+            node_id = attrs.get('id')
+            classes = attrs.get('class') or ()
+            for selector in SELLER_SELECTORS:
+                if selector in found.sellers:
+                    continue
+                attr, value = selector
+                if (attr == 'id' and node_id == value) or (attr == 'class' and value in classes):
+                    found.sellers[selector] = node.get_text(strip=True)
+        elif want_price and found.price_text is None and isinstance(node, NavigableString) \
+                and not isinstance(node, Comment):
+            match = PRICE_PATTERN.search(node)
+            if match:
+                found.price_text = match.group()
+    return found
+
+
+def find_raw_price(content):
+    """First price-like text in the unparsed page (str or bytes), or None.
+
+    For pages parsed with a filter that dropped the node holding the price;
+    one regex search is far cheaper than building the full tree.
+    """
+    if isinstance(content, bytes):
+        content = content.decode('utf-8', 'replace')
+    match = PRICE_PATTERN.search(content)
+    return match.group() if match else None
@@ -0,0 +1,132 @@
+import re
+from bs4 import SoupStrainer
+
+try:
+    from bs4.filter import ElementFilter
+except ImportError:  # beautifulsoup4 < 4.13
+    ElementFilter = None
+
+# Head metadata that extraction (or later stages) may read
+HEAD_TAGS = frozenset(['title', 'meta', 'link', 'base'])
+
+# tag, #id, .class and [attr] / [attr=value] parts of one compound selector;
+# pseudo-classes are ignored, which only ever makes a rule broader
+_COMPOUND = re.compile(r'^(?P<tag>[a-zA-Z][\w-]*|\*)?(?P<rest>(?:[#.][\w-]+|\[[^\]]+\]|:[\w-]+(?:\([^)]*\))?)*)$')
+_PART = re.compile(r'#(?P<id>[\w-]+)|\.(?P<cls>[\w-]+)|\[\s*(?P<attr>[\w-]+)\s*(?:[~|^$*]?=\s*["\']?(?P<value>[^"\'\]]*)["\']?)?\s*\]')
+
+
+def _compound_rule(compound):
+    match = _COMPOUND.match(compound)
+    if not match:
+        return None
+    tag = match.group('tag')
+    ids, classes, attrs = set(), set(), []
+    for part in _PART.finditer(match.group('rest')):
+        if part.group('id'):
+            ids.add(part.group('id'))
+        elif part.group('cls'):
+            classes.add(part.group('cls'))
+        elif part.group('attr'):
+            # Only exact '=' values are checked; other operators keep any value
+            exact = '=' in part.group(0) and not re.search(r'[~|^$*]=', part.group(0))
+            attrs.append((part.group('attr').lower(), part.group('value') if exact else None))
+    if tag in (None, '*') and not (ids or classes or attrs):
+        return None
+    return (tag if tag != '*' else None, frozenset(ids), frozenset(classes), tuple(attrs))
+
+
+def selector_rules(selectors):
+    """Keep-rules for the first and last compound of every CSS selector.
+
+    The first compound keeps the ancestor a descendant selector needs and
+    the last keeps the matched element itself, so selector results on the
+    strained tree are the same as on the full document.
+    """
+    rules = set()
+    for css in selectors:
+        for selector in css.split(','):
+            compounds = [c for c in re.split(r'\s*[\s>+~]\s*', selector.strip()) if c]
+            for compound in {compounds[0], compounds[-1]} if compounds else ():
+                rule = _compound_rule(compound)
+                if rule:
+                    rules.add(rule)
+    return frozenset(rules)
+
+
+def _matches(rule, name, attrs, classes):
+    tag, ids, wanted, required = rule
+    if tag and tag != name:
+        return False
+    if ids and attrs.get('id') not in ids:
+        return False
+    if wanted and not wanted.issubset(classes):
+        return False
+    for attr, expected in required:
+        if attr not in attrs or (expected is not None and attrs[attr] != expected):
+            return False
+    return True
+
+
+class KeepRules:
+    """Keep-rules indexed by id, class, tag and attribute.
+
+    The filter runs for every top-level start tag, so only the few rules
+    that could match a tag's id/classes/name are actually checked.
+    """
+
+    def __init__(self, rules):
+        self.by_id, self.by_class, self.by_tag, self.by_attr = {}, {}, {}, {}
+        for rule in rules:
+            tag, ids, classes, attrs = rule
+            if ids:
+                for value in ids:
+                    self.by_id.setdefault(value, []).append(rule)
+            elif classes:
+                self.by_class.setdefault(next(iter(classes)), []).append(rule)
+            elif tag:
+                self.by_tag.setdefault(tag, []).append(rule)
+            else:
+                self.by_attr.setdefault(attrs[0][0], []).append(rule)
+
+    def keeps(self, name, attrs):
+        """Whether a top-level tag (and so its whole subtree) is kept"""
+        attrs = attrs or {}
+        if name in HEAD_TAGS:
+            return True
+        if name == 'script':
+            return str(attrs.get('type', '')).lower() == 'application/ld+json'
+        if not attrs:
+            candidates = self.by_tag.get(name, ())
+            return any(_matches(rule, name, attrs, ()) for rule in candidates)
+        value = attrs.get('class') or ()
+        classes = value.split() if isinstance(value, str) else value
+        candidates = list(self.by_tag.get(name, ()))
+        candidates.extend(self.by_id.get(attrs.get('id'), ()))
+        for cls in classes:
+            candidates.extend(self.by_class.get(cls, ()))
+        for attr in attrs:
+            candidates.extend(self.by_attr.get(attr, ()))
+        return any(_matches(rule, name, attrs, classes) for rule in candidates)
+
+
+if ElementFilter is not None:
+    class _TagFilter(ElementFilter):
+        """Strainer that builds only kept subtrees and drops loose text"""
+
+        def __init__(self, rules):
+            super().__init__()
+            self.rules = rules
+
+        def allow_tag_creation(self, nsprefix, name, attrs):
+            return self.rules.keeps(name, attrs)
+
+        def allow_string_creation(self, string):
+            return False
+
+
+def build_parse_filter(selectors):
+    """A `parse_only` filter keeping head metadata, JSON-LD and the subtrees the selectors need"""
+    rules = KeepRules(selector_rules(selectors))
+    if ElementFilter is None:
+        return SoupStrainer(lambda name, attrs=None: rules.keeps(name, attrs))
+    return _TagFilter(rules)
@@ -0,0 +1,91 @@
+import asyncio
+import logging
+import os
+import random
+import threading
+import time
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+
+def host_key(url):
+    """Normalize a URL or netloc to the host we pace requests against"""
+    netloc = urlparse(url).netloc if '://' in url else url
+    host = netloc.lower().rsplit('@', 1)[-1].split(':', 1)[0]
+    if host.startswith('www.'):
+        host = host[4:]
+    return host
+
+
+class HostPolitenessScheduler:
+    """Per-host minimum-interval scheduler.
+
+    Each request reserves the next free slot for its host: the first request
+    to a host goes out immediately, and later ones are only delayed by
+    whatever remains of a (jittered) interval since that host was last hit.
+    Requests to different hosts never wait on each other.
+    """
+
+    def __init__(self, min_interval=2.0, max_interval=4.0, max_hosts=10000):
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.max_hosts = max_hosts
+        self._next_slot = {}
+        self._lock = threading.Lock()
+
+    def reserve(self, url, interval=None):
+        """Book the next slot for the URL's host and return the delay in seconds.
+
+        `interval` overrides the default (min, max) jitter range for callers
+        that deliberately back off harder, e.g. after being blocked.
+        """
+        low, high = interval or (self.min_interval, self.max_interval)
+        host = host_key(url)
+        now = time.monotonic()
+        with self._lock:
+            last = self._next_slot.get(host)
+            start = now if last is None else max(now, last + random.uniform(low, high))
+            self._next_slot[host] = start
+            if len(self._next_slot) > self.max_hosts:
+                self._prune(now)
+        delay = start - now
+        if delay > 0:
+            logger.info(f"Politeness delay for {host}: {delay:.2f}s")
+        return delay
+
+    def wait(self, url, interval=None):
+        """Block until the URL's host may be contacted again"""
+        delay = self.reserve(url, interval)
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+    async def wait_async(self, url, interval=None):
+        """Awaitable version of `wait` for the asyncio fetch layer"""
+        delay = self.reserve(url, interval)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return delay
+
+    def _prune(self, now):
+        # Hosts idle for longer than the widest interval carry no state worth keeping
+        horizon = now - max(self.max_interval, 60)
+        for host in [h for h, slot in self._next_slot.items() if slot < horizon]:
+            del self._next_slot[host]
+
+
+_default_scheduler = None
+_default_lock = threading.Lock()
+
+
+def get_default_scheduler():
+    """Process-wide scheduler so every scraper shares the same host history"""
+    global _default_scheduler
+    with _default_lock:
+        if _default_scheduler is None:
+            _default_scheduler = HostPolitenessScheduler(
+                min_interval=float(os.getenv('HOST_MIN_INTERVAL', '2')),
+                max_interval=float(os.getenv('HOST_MAX_INTERVAL', '4'))
+            )
+        return _default_scheduler
@@ -0,0 +1,122 @@
+import re
+from collections import namedtuple
+from urllib.parse import urlparse, urlencode, parse_qsl, urlunparse
+
+# Query parameters that only carry tracking/affiliate state, never product identity
+TRACKING_PARAMS = {
+    'gclid', 'fbclid', 'msclkid', 'dclid', 'yclid', 'igshid', 'mc_cid', 'mc_eid',
+    'ref', 'ref_', 'linkcode', 'creative', 'creativeasin', 'ascsubtag',
+    '_trksid', '_trkparms', 'mkevt', 'mkcid', 'mkrid', 'campid', 'toolid', 'customid',
+    'spm', 'scm', 'pvid', 'algo_pvid', 'algo_expid', 'btsid', 'ws_ab_test',
+    'clickid', 'wmlspartner', 'sourceid', 'affiliates_ad_id',
+}
+TRACKING_PREFIXES = ('utm_', 'pd_rd_', 'pf_rd_', 'aff_')
+
+AMAZON_ASIN = re.compile(
+    r'/(?:dp|gp/product|gp/aw/d|gp/offer-listing|exec/obidos/asin|o/asin)/([A-Z0-9]{10})(?=[/?#]|$)', re.I)
+EBAY_ITEM = re.compile(r'/itm/(?:[^/?#]+/)?(\d+)(?=[/?#]|$)')
+DARAZ_ITEM = re.compile(r'-i(\d+)(?:-s\d+)?\.html', re.I)
+ALIEXPRESS_ITEM = re.compile(r'/(?:item|i)/(?:[^/?#]+/)?(\d+)\.html', re.I)
+WALMART_ITEM = re.compile(r'/ip/(?:[^/?#]+/)?(\d+)(?=[/?#]|$)')
+
+
+class ProductKey(namedtuple('ProductKey', ['platform', 'product_id', 'marketplace'])):
+    """Stable identity of a product regardless of which URL variant was pasted.
+
+    `marketplace` is only set for platforms whose ids are scoped per regional
+    site (e.g. the same ASIN on amazon.com and amazon.co.uk lists different
+    offers); it is empty for platforms with global ids and for URL fallbacks.
+    """
+    __slots__ = ()
+
+    def __str__(self):
+        if self.marketplace:
+            return f"{self.platform}:{self.marketplace}:{self.product_id}"
+        return f"{self.platform}:{self.product_id}"
+
+
+def detect_platform(netloc):
+    """Detect known platform from netloc"""
+    netloc = netloc.lower()
+    if 'amazon.' in netloc:
+        return 'amazon'
+    if 'ebay.' in netloc:
+        return 'ebay'
+    if 'daraz.' in netloc:
+        return 'daraz'
+    if 'aliexpress' in netloc or 'taobao' in netloc or 'tmall' in netloc:
+        return 'aliexpress'
+    if 'walmart' in netloc:
+        return 'walmart'
+    # default to generic
+    return 'generic'
+
+
+def normalize_url(url):
+    """Normalize a URL: lowercase host, default port, sorted query, no fragment or tracking params"""
+    parsed = urlparse(url.strip())
+    scheme = parsed.scheme.lower()
+    netloc = parsed.netloc.lower()
+    if (scheme == 'http' and netloc.endswith(':80')) or (scheme == 'https' and netloc.endswith(':443')):
+        netloc = netloc.rsplit(':', 1)[0]
+    params = [(k, v) for k, v in parse_qsl(parsed.query, keep_blank_values=True)
+              if k.lower() not in TRACKING_PARAMS and not k.lower().startswith(TRACKING_PREFIXES)]
+    query = urlencode(sorted(params))
+    return urlunparse((scheme, netloc, parsed.path or '/', '', query, ''))
+
+
+def _marketplace(netloc):
+    host = netloc.lower().split(':', 1)[0]
+    for prefix in ('www.', 'smile.', 'm.'):
+        if host.startswith(prefix):
+            host = host[len(prefix):]
+    return host
+
+
+def extract_product_id(url, platform=None):
+    """Return the platform-native product id embedded in a URL, or None"""
+    parsed = urlparse(url)
+    platform = platform or detect_platform(parsed.netloc)
+    path = parsed.path
+    query = dict(parse_qsl(parsed.query))
+
+    if platform == 'amazon':
+        m = AMAZON_ASIN.search(path)
+        if m:
+            return m.group(1).upper()
+        asin = query.get('asin') or query.get('ASIN')
+        return asin.upper() if asin and len(asin) == 10 else None
+    if platform == 'ebay':
+        m = EBAY_ITEM.search(path)
+        if m:
+            return m.group(1)
+        return query.get('item') if query.get('item', '').isdigit() else None
+    if platform == 'daraz':
+        m = DARAZ_ITEM.search(path)
+        return m.group(1) if m else None
+    if platform == 'aliexpress':
+        m = ALIEXPRESS_ITEM.search(path)
+        if m:
+            return m.group(1)
+        return query.get('productId') if query.get('productId', '').isdigit() else None
+    if platform == 'walmart':
+        m = WALMART_ITEM.search(path)
+        return m.group(1) if m else None
+    return None
+
+
+def canonical_product_key(url):
+    """Map any URL variant of a product page to its ProductKey.
+
+    Known platforms key on their native id (ASIN, eBay item id, Daraz item id,
+    AliExpress/Walmart item id); everything else falls back to the
+    normalized URL so that tracking parameters and fragments don't split keys.
+    """
+    parsed = urlparse(url)
+    platform = detect_platform(parsed.netloc)
+    product_id = extract_product_id(url, platform)
+    if product_id is None:
+        return ProductKey(platform, normalize_url(url), '')
+    if platform in ('amazon', 'daraz', 'walmart'):
+        return ProductKey(platform, product_id, _marketplace(parsed.netloc))
+    return ProductKey(platform, product_id, '')
@@ -0,0 +1,208 @@
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from backend.async_fetcher import FetchResult
+from backend.product_identity import canonical_product_key
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                  'cache', 'http_responses.sqlite3')
+
+# Bodies are stored decoded, so transfer-level headers no longer describe them
+_DROPPED_HEADERS = {'content-encoding', 'content-length', 'transfer-encoding', 'connection', 'set-cookie'}
+
+
+def cache_key(url):
+    """Cache key for a URL: its canonical product identity, so URL variants share entries"""
+    return str(canonical_product_key(url))
+
+
+def parse_cache_control(value):
+    """Parse a Cache-Control header into a dict of lowercase directives"""
+    directives = {}
+    for part in (value or '').split(','):
+        part = part.strip()
+        if not part:
+            continue
+        name, _, arg = part.partition('=')
+        directives[name.strip().lower()] = arg.strip().strip('"') or True
+    return directives
+
+
+class ResponseCache:
+    """Persistent SQLite-backed HTTP response cache.
+
+    Entries hold the body plus headers, follow `Cache-Control`/`Expires` for
+    freshness and keep `ETag`/`Last-Modified` so stale entries can be
+    revalidated with a conditional request. Total body size is capped and
+    the least recently used entries are evicted first.
+    """
+
+    def __init__(self, path=DEFAULT_CACHE_PATH, default_ttl=3600, max_ttl=86400,
+                 max_bytes=256 * 1024 * 1024):
+        self.path = path
+        self.default_ttl = default_ttl
+        self.max_ttl = max_ttl
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self._lock = threading.Lock()
+        if path != ':memory:':
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('''
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                url TEXT NOT NULL,
+                status INTEGER NOT NULL,
+                headers TEXT NOT NULL,
+                body BLOB NOT NULL,
+                encoding TEXT,
+                etag TEXT,
+                last_modified TEXT,
+                stored_at REAL NOT NULL,
+                expires_at REAL NOT NULL,
+                last_access REAL NOT NULL,
+                size INTEGER NOT NULL
+            )''')
+        self._conn.execute('CREATE INDEX IF NOT EXISTS idx_responses_access ON responses(last_access)')
+        self._conn.commit()
+
+    def lookup(self, url):
+        """Return the cached entry for a URL or None.
+
+        Stale entries are returned too (with ``fresh`` False) so the caller
+        can revalidate them instead of downloading the body again.
+        """
+        key = cache_key(url)
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT url, status, headers, body, encoding, etag, last_modified, expires_at '
+                'FROM responses WHERE key = ?', (key,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            now = time.time()
+            self._conn.execute('UPDATE responses SET last_access = ? WHERE key = ?', (now, key))
+            self._conn.commit()
+        fresh = row[7] > now
+        if fresh:
+            self.hits += 1
+        return {
+            'key': key,
+            'url': row[0],
+            'status': row[1],
+            'headers': json.loads(row[2]),
+            'body': row[3],
+            'encoding': row[4],
+            'etag': row[5],
+            'last_modified': row[6],
+            'expires_at': row[7],
+            'fresh': fresh
+        }
+
+    def conditional_headers(self, entry):
+        """Validators to send when revalidating a stale entry"""
+        headers = {}
+        if entry and entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry and entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def to_response(self, entry):
+        return FetchResult(entry['url'], entry['status'], entry['body'], entry['headers'], entry['encoding'])
+
+    def store(self, url, status, headers, body, encoding=None):
+        """Store a 200 response unless the server forbids it; returns True if stored"""
+        headers = {k: v for k, v in dict(headers).items() if k.lower() not in _DROPPED_HEADERS}
+        lowered = {k.lower(): v for k, v in headers.items()}
+        cache_control = parse_cache_control(lowered.get('cache-control'))
+        if status != 200 or 'no-store' in cache_control:
+            return False
+
+        now = time.time()
+        expires_at = now + self._freshness_lifetime(cache_control, lowered, now)
+        size = len(body)
+        if size > self.max_bytes:
+            return False
+
+        with self._lock:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO responses '
+                '(key, url, status, headers, body, encoding, etag, last_modified, stored_at, expires_at, last_access, size) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                (cache_key(url), url, status, json.dumps(headers), sqlite3.Binary(body), encoding,
+                 lowered.get('etag'), lowered.get('last-modified'), now, expires_at, now, size))
+            self._evict()
+            self._conn.commit()
+        return True
+
+    def refresh(self, entry, headers):
+        """Extend a stale entry after a 304 Not Modified and return it"""
+        self.revalidations += 1
+        lowered = {k.lower(): v for k, v in dict(headers).items()}
+        now = time.time()
+        entry['expires_at'] = now + self._freshness_lifetime(
+            parse_cache_control(lowered.get('cache-control')), lowered, now)
+        entry['etag'] = lowered.get('etag', entry.get('etag'))
+        entry['last_modified'] = lowered.get('last-modified', entry.get('last_modified'))
+        with self._lock:
+            self._conn.execute(
+                'UPDATE responses SET expires_at = ?, etag = ?, last_modified = ?, last_access = ? WHERE key = ?',
+                (entry['expires_at'], entry['etag'], entry['last_modified'], now, entry['key']))
+            self._conn.commit()
+        return entry
+
+    def stats(self):
+        with self._lock:
+            count, total = self._conn.execute('SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses').fetchone()
+        return {'entries': count, 'bytes': total, 'hits': self.hits,
+                'misses': self.misses, 'revalidations': self.revalidations}
+
+    def clear(self):
+        with self._lock:
+            self._conn.execute('DELETE FROM responses')
+            self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def _freshness_lifetime(self, cache_control, headers, now):
+        if 'no-cache' in cache_control:
+            return 0
+        max_age = cache_control.get('max-age')
+        if max_age is not None:
+            try:
+                return min(max(int(max_age), 0), self.max_ttl)
+            except (TypeError, ValueError):
+                return 0
+        if headers.get('expires'):
+            try:
+                return min(max(parsedate_to_datetime(headers['expires']).timestamp() - now, 0), self.max_ttl)
+            except (TypeError, ValueError):
+                return 0
+        return self.default_ttl
+
+    def _evict(self):
+        # Caller holds the lock; drop least recently used entries over budget
+        total = self._conn.execute('SELECT COALESCE(SUM(size), 0) FROM responses').fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        rows = self._conn.execute('SELECT key, size FROM responses ORDER BY last_access ASC').fetchall()
+        evicted = []
+        for key, size in rows:
+            if total <= self.max_bytes:
+                break
+            evicted.append((key,))
+            total -= size
+        self._conn.executemany('DELETE FROM responses WHERE key = ?', evicted)
+        logger.info(f"Evicted {len(evicted)} cached response(s)")
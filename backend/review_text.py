@@ -0,0 +1,80 @@
+import re
+import string
+import numpy as np
+
+_KEEP = frozenset(string.ascii_letters)
+
+
+class _NormalizeTable(dict):
+    """`str.translate` table: keep ASCII letters, turn whitespace into spaces, drop the rest.
+
+    Entries are filled in on first sight of each code point, so the table
+    covers all of Unicode while only holding characters actually seen.
+    """
+
+    def __missing__(self, code):
+        char = chr(code)
+        value = code if char in _KEEP else (' ' if char.isspace() else None)
+        self[code] = value
+        return value
+
+
+_NORMALIZE = _NormalizeTable()
+
+
+def review_text(review):
+    """Text of a scraped review dict (or any other review value)"""
+    if isinstance(review, dict):
+        return review.get('text') or ''
+    return str(review) if review is not None else ''
+
+
+def normalize_text(lowered):
+    """Letters-only, single-spaced form of already lowercased text"""
+    return ' '.join(lowered.translate(_NORMALIZE).split())
+
+
+def keyword_pattern(keywords):
+    """One regex that finds any of the keywords (None for no keywords)"""
+    keywords = [keyword for keyword in keywords if keyword]
+    if not keywords:
+        return None
+    # Longest first, so overlapping keywords never hide each other
+    return re.compile('|'.join(map(re.escape, sorted(keywords, key=len, reverse=True))))
+
+
+class ReviewBatch:
+    """Per-review features computed in one pass, shared by every consumer.
+
+    Columns: `texts` (raw), `normalized` (lowercase letters and single
+    spaces, what the sentiment model sees), `lengths`, `unique_tokens`
+    (distinct whitespace-split words of the lowercased text) and
+    `keyword_hits` (whether the lowercased text contains any of `keywords`).
+    `sentiments` is filled in by SentimentAnalyzer.analyze_reviews.
+    Lowercased text and token lists are not kept.
+    """
+
+    def __init__(self, texts, keywords=()):
+        count = len(texts)
+        self.texts = texts
+        self.keywords = tuple(keywords)
+        self.normalized = []
+        self.lengths = np.empty(count, dtype=np.int64)
+        self.unique_tokens = np.empty(count, dtype=np.int64)
+        self.keyword_hits = np.zeros(count, dtype=bool)
+        self.sentiments = None
+        pattern = keyword_pattern(self.keywords)
+        for i, text in enumerate(texts):
+            lowered = text.lower()
+            self.lengths[i] = len(text)
+            self.unique_tokens[i] = len(set(lowered.split()))
+            if pattern is not None:
+                self.keyword_hits[i] = pattern.search(lowered) is not None
+            self.normalized.append(normalize_text(lowered))
+
+    @classmethod
+    def from_reviews(cls, reviews, keywords=()):
+        return cls([review_text(review) for review in reviews or ()], keywords=keywords)
+
+    def __len__(self):
+        return len(self.texts)
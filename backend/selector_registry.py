@@ -0,0 +1,66 @@
+import soupsieve as sv
+from selenium.webdriver.common.by import By
+
+
+class SelectorPlan:
+    """CSS selectors for one field, compiled once and reused for every page.
+
+    A single selector string (which may contain a comma list) matches in
+    document order; a list of selectors is tried in priority order.
+    """
+
+    def __init__(self, selectors):
+        self.selectors = [selectors] if isinstance(selectors, str) else list(selectors)
+        self.css = ', '.join(self.selectors)
+        self._compiled = [sv.compile(s) for s in self.selectors]
+
+    @property
+    def locator(self):
+        """Selenium locator tuple for `driver.find_element(*plan.locator)`.
+
+        Selenium matches a comma list in document order, so a priority list
+        of several selectors has no equivalent single locator.
+        """
+        if len(self.selectors) > 1:
+            raise ValueError(f"Priority-ordered selectors have no single Selenium locator: {self.selectors}")
+        return (By.CSS_SELECTOR, self.css)
+
+    def select_one(self, soup):
+        """First matching element in a BeautifulSoup tree, or None"""
+        for compiled in self._compiled:
+            element = compiled.select_one(soup)
+            if element is not None:
+                return element
+        return None
+
+    def candidates(self, soup):
+        """First match of each selector, in priority order"""
+        for compiled in self._compiled:
+            element = compiled.select_one(soup)
+            if element is not None:
+                yield element
+
+
+class SelectorRegistry:
+    """Compiled selector plans keyed by (platform, field)"""
+
+    def __init__(self):
+        self._plans = {}
+
+    def register(self, platform, field, selectors):
+        plan = self._plans[(platform, field)] = SelectorPlan(selectors)
+        return plan
+
+    def get(self, platform, field):
+        return self._plans.get((platform, field))
+
+    @classmethod
+    def from_platform_configs(cls, platform_configs):
+        """Compile `selectors` and `wait_for` entries of a platform config dict"""
+        registry = cls()
+        for platform, config in platform_configs.items():
+            for field, selectors in config.get('selectors', {}).items():
+                registry.register(platform, field, selectors)
+            if config.get('wait_for'):
+                registry.register(platform, 'wait_for', config['wait_for'])
+        return registry
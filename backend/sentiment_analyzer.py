@@ -1,200 +1,97 @@
-import re
 import numpy as np
-import pandas as pd
 from textblob import TextBlob
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.linear_model import LogisticRegression
-from sklearn.model_selection import train_test_split
-from sklearn.metrics import accuracy_score, classification_report
-import pickle
 import os
 import logging
+import threading
+import time
 from typing import Dict, List, Any
+from backend.linear_inference import LinearSentimentModel
+from backend.model_artifacts import DEFAULT_MODEL_DIR, load_artifacts
+from backend.review_text import ReviewBatch, normalize_text
+from backend.sentiment_cache import SentimentCache, sentiment_key
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 class SentimentAnalyzer:
-    def __init__(self):
+    def __init__(self, lazy=None, model_dir=None):
         self.model = None
         self.vectorizer = None
-        self.model_path = 'models/sentiment_model.pkl'
-        self.vectorizer_path = 'models/tfidf_vectorizer.pkl'
+        # Array-only copy of model + vectorizer used for batch scoring
+        self.scorer = None
+        self.model_version = 'lexicon'
+        # Resolved against the package, not the working directory
+        self.model_dir = model_dir or os.getenv('SENTIMENT_MODEL_DIR', DEFAULT_MODEL_DIR)
+        self.artifact_dir = os.path.join(self.model_dir, 'sentiment')
+        # Reviews whose top ML class probability is below this also get a
+        # TextBlob opinion. Off by default: reviews in words the model never
+        # saw score near the class prior (~0.37 with three classes), so any
+        # higher threshold sends most real reviews to TextBlob
+        self.confidence_threshold = float(os.getenv('SENTIMENT_CONFIDENCE_THRESHOLD', '0'))
+        # Without artifacts, either refuse to start or score with TextBlob only;
+        # the model is never trained here (see backend.build_sentiment_model)
+        self.require_model = os.getenv('SENTIMENT_REQUIRE_MODEL', '0') == '1'
+        # A failed load is retried after this many seconds (artifacts may be
+        # mid-publish, or built after the server started)
+        self.reload_interval = float(os.getenv('SENTIMENT_RELOAD_INTERVAL', '30'))
+        self._model_loaded = False
+        self._retry_at = 0.0
+        self._model_lock = threading.Lock()
         
-        # Create models directory if it doesn't exist
-        os.makedirs('models', exist_ok=True)
-        
-        # Load or train model
-        self._load_or_train_model()
+        if self.require_model and not os.path.exists(os.path.join(self.artifact_dir, 'meta.json')):
+            raise FileNotFoundError(
+                f"Sentiment model artifacts not found in {self.artifact_dir}; "
+                f"build them with `python -m backend.build_sentiment_model`")
+        if lazy is None:
+            lazy = os.getenv('SENTIMENT_LAZY_LOAD', '1') == '1'
+        if not lazy:
+            self.load_model()
+        self.setup_cache()
     
-    def _load_or_train_model(self):
-        """Load existing model or train a new one"""
+    def setup_cache(self):
+        """Memoize results per preprocessed text (SENTIMENT_CACHE_SIZE=0 disables)"""
+        self.cache = None
+        size = int(os.getenv('SENTIMENT_CACHE_SIZE', '10000'))
+        if size <= 0:
+            return
         try:
-            if os.path.exists(self.model_path) and os.path.exists(self.vectorizer_path):
-                logger.info("Loading existing sentiment model...")
-                with open(self.model_path, 'rb') as f:
-                    self.model = pickle.load(f)
-                with open(self.vectorizer_path, 'rb') as f:
-                    self.vectorizer = pickle.load(f)
-            else:
-                logger.info("Training new sentiment model...")
-                self._train_model()
+            self.cache = SentimentCache(max_entries=size, path=os.getenv('SENTIMENT_CACHE_PATH') or None)
         except Exception as e:
-            logger.error(f"Error loading model: {e}")
-            self._train_model()
+            logger.warning(f"Sentiment cache unavailable, continuing without it: {e}")
     
-    def _train_model(self):
-        """Train a sentiment analysis model using sample data"""
-        # Expanded training data with more variety and better examples
-        sample_data = [
-            # Positive reviews - Clear positive sentiment
-            ("This product is amazing! Highly recommend it.", "positive"),
-            ("Great quality and fast shipping.", "positive"),
-            ("Perfect product, exactly as described.", "positive"),
-            ("Excellent value for money.", "positive"),
-            ("Love it! Will buy again.", "positive"),
-            ("Good product overall.", "positive"),
-            ("Fantastic quality, exceeded expectations.", "positive"),
-            ("Best purchase I've made this year.", "positive"),
-            ("Outstanding product and service.", "positive"),
-            ("Highly satisfied with this purchase.", "positive"),
-            ("Works perfectly, no complaints.", "positive"),
-            ("Great deal, fast delivery.", "positive"),
-            ("Amazing product, will definitely buy again.", "positive"),
-            ("Superb quality and design.", "positive"),
-            ("Excellent customer service and product.", "positive"),
-            ("Wonderful product, very happy with purchase.", "positive"),
-            ("Top quality item, highly recommended.", "positive"),
-            ("Fantastic value, great quality.", "positive"),
-            ("Impressed with the quality and service.", "positive"),
-            ("Brilliant product, works exactly as expected.", "positive"),
-            ("Very pleased with this purchase.", "positive"),
-            ("Excellent product, fast shipping.", "positive"),
-            ("Great quality, would buy again.", "positive"),
-            ("Perfect fit and great quality.", "positive"),
-            ("Outstanding value for money.", "positive"),
-            
-            # Neutral reviews - Clear neutral sentiment
-            ("It's okay, nothing special.", "neutral"),
-            ("Average quality product.", "neutral"),
-            ("Not bad, but could be better.", "neutral"),
-            ("It's fine, does the job.", "neutral"),
-            ("Meets expectations.", "neutral"),
-            ("Decent product.", "neutral"),
-            ("Standard quality, nothing extraordinary.", "neutral"),
-            ("It works as expected.", "neutral"),
-            ("Average product for the price.", "neutral"),
-            ("Nothing wrong with it, but nothing special.", "neutral"),
-            ("It's a decent product.", "neutral"),
-            ("Works fine, could be better.", "neutral"),
-            ("Average experience overall.", "neutral"),
-            ("It does what it's supposed to do.", "neutral"),
-            ("Standard quality product.", "neutral"),
-            ("Fair quality for the price.", "neutral"),
-            ("It's acceptable, nothing more.", "neutral"),
-            ("Average build quality.", "neutral"),
-            ("Does the job adequately.", "neutral"),
-            ("Neither good nor bad.", "neutral"),
-            ("Standard fare.", "neutral"),
-            ("It's functional.", "neutral"),
-            ("Mediocre quality.", "neutral"),
-            ("Average performance.", "neutral"),
-            ("It's okay.", "neutral"),
-            
-            # Negative reviews - Clear negative sentiment
-            ("Terrible quality, waste of money.", "negative"),
-            ("Don't buy this, it's a scam.", "negative"),
-            ("Poor quality, broke after one day.", "negative"),
-            ("Worst purchase ever.", "negative"),
-            ("Completely disappointed.", "negative"),
-            ("Overpriced and low quality.", "negative"),
-            ("Fake product, not as advertised.", "negative"),
-            ("Avoid this seller at all costs.", "negative"),
-            ("This is junk, don't waste your money.", "negative"),
-            ("Very poor customer service.", "negative"),
-            ("Product arrived damaged.", "negative"),
-            ("Not worth the price.", "negative"),
-            ("Regret buying this item.", "negative"),
-            ("Awful product, avoid at all costs.", "negative"),
-            ("Cheap quality, breaks easily.", "negative"),
-            ("Waste of money, very disappointed.", "negative"),
-            ("Poor quality control.", "negative"),
-            ("Defective product, bad experience.", "negative"),
-            ("Terrible shipping and product quality.", "negative"),
-            ("Not recommended, poor value.", "negative"),
-            ("Disappointing purchase experience.", "negative"),
-            ("Low quality materials used.", "negative"),
-            ("Product doesn't work as described.", "negative"),
-            ("Very poor build quality.", "negative"),
-            ("Not worth buying, poor design.", "negative"),
-            ("Horrible product, complete waste.", "negative"),
-            ("Useless item, doesn't work.", "negative"),
-            ("Extremely disappointed with quality.", "negative"),
-            ("Bad experience, avoid this.", "negative"),
-            ("Poor value, not recommended.", "negative"),
-            ("Inferior quality product.", "negative"),
-            ("Failed to meet expectations.", "negative"),
-            ("Substandard materials used.", "negative"),
-            ("Doesn't work as advertised.", "negative"),
-            ("Poor construction quality.", "negative"),
-            ("Worst product I've ever bought.", "negative")
-        ]
-        
-        # Convert to DataFrame
-        df = pd.DataFrame(sample_data, columns=['text', 'sentiment'])
-        
-        # Prepare features and labels
-        X = df['text']
-        y = df['sentiment']
-        
-        # Create TF-IDF vectorizer
-        self.vectorizer = TfidfVectorizer(
-            max_features=1000,
-            stop_words='english',
-            ngram_range=(1, 2),
-            min_df=1
-        )
-        
-        # Transform text to features
-        X_tfidf = self.vectorizer.fit_transform(X)
-        
-        # Split data
-        X_train, X_test, y_train, y_test = train_test_split(
-            X_tfidf, y, test_size=0.2, random_state=42
-        )
-        
-        # Train model
-        self.model = LogisticRegression(random_state=42, max_iter=1000)
-        self.model.fit(X_train, y_train)
-        
-        # Evaluate model
-        y_pred = self.model.predict(X_test)
-        accuracy = accuracy_score(y_test, y_pred)
-        logger.info(f"Model accuracy: {accuracy:.2f}")
-        
-        # Save model
-        with open(self.model_path, 'wb') as f:
-            pickle.dump(self.model, f)
-        with open(self.vectorizer_path, 'wb') as f:
-            pickle.dump(self.vectorizer, f)
-        
-        logger.info("Model trained and saved successfully")
+    def load_model(self):
+        """Load the memory-mapped model artifacts once; uses TextBlob while they are unavailable"""
+        if self._model_loaded or time.monotonic() < self._retry_at:
+            return
+        with self._model_lock:
+            if self._model_loaded or time.monotonic() < self._retry_at:
+                return
+            try:
+                logger.info("Loading sentiment model artifacts...")
+                model, vectorizer, meta = load_artifacts(self.artifact_dir)
+            except Exception as e:
+                if self.require_model:
+                    raise
+                self._retry_at = time.monotonic() + self.reload_interval
+                logger.warning(f"Sentiment model unavailable, using TextBlob only "
+                               f"(retrying in {self.reload_interval:g}s): {e}")
+                return
+            self.model, self.vectorizer = model, vectorizer
+            try:
+                self.scorer = LinearSentimentModel.compile(model, vectorizer)
+            except TypeError as e:
+                logger.info(f"Scoring through sklearn: {e}")
+            # Identifies the model in cache keys, so rebuilding invalidates cached results
+            self.model_version = meta['fingerprint']
+            self._model_loaded = True
     
     def _preprocess_text(self, text):
         """Preprocess text for sentiment analysis"""
         if not text:
             return ""
         
-        # Convert to lowercase
-        text = text.lower()
-        
-        # Remove special characters and digits
-        text = re.sub(r'[^a-zA-Z\s]', '', text)
-        
-        # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text).strip()
-        
-        return text
+        # Lowercase, keep letters only, collapse whitespace
+        return normalize_text(text.lower())
     
     def _get_textblob_sentiment(self, text):
         """Get sentiment using TextBlob"""
@@ -213,6 +110,7 @@ class SentimentAnalyzer:
     
     def _get_ml_sentiment(self, text):
         """Get sentiment using trained ML model"""
+        self.load_model()
         try:
             if not self.model or not self.vectorizer:
                 return self._get_textblob_sentiment(text)
@@ -236,15 +134,90 @@ class SentimentAnalyzer:
         if not review_text or not review_text.strip():
             return 'neutral'
         
-        # Use both methods for better accuracy
-        ml_sentiment = self._get_ml_sentiment(review_text)
-        textblob_sentiment = self._get_textblob_sentiment(review_text)
+        return self.analyze_batch([review_text])[0]
+    
+    def analyze_batch(self, texts):
+        """Sentiment labels for many review texts with one transform and one predict"""
+        return self._classify(texts)[0]
+    
+    def _classify(self, texts, normalized=None):
+        """Return (labels, number of reviews that needed the TextBlob fallback).
+
+        `normalized` may carry the already preprocessed texts (see ReviewBatch).
+        """
+        labels = ['neutral'] * len(texts)
+        indices = [i for i, text in enumerate(texts) if text and text.strip()]
+        if not indices:
+            return labels, 0
+        
+        self.load_model()
+        if not self.model or not self.vectorizer:
+            for i in indices:
+                labels[i] = self._get_textblob_sentiment(texts[i])
+            return labels, len(indices)
+        
+        try:
+            if normalized is None:
+                processed = [self._preprocess_text(texts[i]) for i in indices]
+            else:
+                processed = [normalized[i] for i in indices]
+            cache = self.cache
+            if cache is None:
+                results = self._score([texts[i] for i in indices], processed)
+            else:
+                # Repeated reviews skip vectorization and inference entirely
+                version = f"{self.model_version}:{self.confidence_threshold}"
+                keys = [sentiment_key(version, text) for text in processed]
+                known = cache.get_many(keys)
+                pending = {}
+                for i, key, text in zip(indices, keys, processed):
+                    if key not in known and key not in pending:
+                        pending[key] = (texts[i], text)
+                if pending:
+                    raw, clean = zip(*pending.values())
+                    scored = dict(zip(pending, self._score(list(raw), list(clean))))
+                    cache.put_many(scored)
+                    known.update(scored)
+                results = [known[key] for key in keys]
+            
+            for i, (label, _) in zip(indices, results):
+                labels[i] = label
+            return labels, sum(1 for _, fallback in results if fallback)
+        except Exception as e:
+            logger.warning(f"Error in batch sentiment analysis, scoring reviews one by one: {e}")
+            for i in indices:
+                labels[i] = self._get_ml_sentiment(texts[i])
+            return labels, 0
+    
+    def _score(self, texts, processed):
+        """(label, used_fallback) per review with one transform and one predict"""
+        scorer = self.scorer
+        if scorer is not None:
+            features = processed
+        else:
+            scorer, features = self.model, self.vectorizer.transform(processed)
+        threshold = self.confidence_threshold
+        if threshold <= 0 or not hasattr(scorer, 'predict_proba'):
+            return [(label, False) for label in scorer.predict(features).tolist()]
         
-        # Combine results (prefer ML model, fallback to TextBlob)
-        return ml_sentiment
+        probabilities = scorer.predict_proba(features)
+        predicted = scorer.classes_[probabilities.argmax(axis=1)].tolist()
+        uncertain = (probabilities.max(axis=1) < threshold).tolist()
+        results = []
+        for text, label, ambiguous in zip(texts, predicted, uncertain):
+            if ambiguous:
+                # Only a decisive TextBlob polarity overrides the ML label
+                secondary = self._get_textblob_sentiment(text)
+                label = secondary if secondary != 'neutral' else label
+            results.append((label, ambiguous))
+        return results
     
-    def analyze_reviews(self, reviews):
-        """Analyze sentiment of multiple reviews"""
+    def cache_stats(self):
+        """Hit/miss counters of the sentiment cache (None when disabled)"""
+        return self.cache.stats() if self.cache else None
+    
+    def analyze_reviews(self, reviews, batch=None):
+        """Analyze sentiment of multiple reviews (`batch`: their ReviewBatch, if already built)"""
         if not reviews:
             return {
                 'positive': 0,
@@ -252,30 +225,26 @@ class SentimentAnalyzer:
                 'negative': 0,
                 'total_reviews': 0,
                 'sentiment_score': 0.0,
+                'fallback_reviews': 0,
                 'detailed_sentiments': []
             }
         
-        sentiments = []
-        detailed_sentiments = []
+        if batch is None:
+            batch = ReviewBatch.from_reviews(reviews)
+        review_texts = batch.texts
+        sentiments, fallback_count = self._classify(review_texts, batch.normalized)
         
-        for review in reviews:
-            if isinstance(review, dict):
-                review_text = review.get('text', '')
-            else:
-                review_text = str(review)
-            
-            sentiment = self.analyze_single_review(review_text)
-            sentiments.append(sentiment)
-            
-            detailed_sentiments.append({
-                'text': review_text[:100] + '...' if len(review_text) > 100 else review_text,
-                'sentiment': sentiment
-            })
+        detailed_sentiments = [{
+            'text': review_text[:100] + '...' if len(review_text) > 100 else review_text,
+            'sentiment': sentiment
+        } for review_text, sentiment in zip(review_texts[:5], sentiments)]
         
         # Count sentiments
-        positive_count = sentiments.count('positive')
-        neutral_count = sentiments.count('neutral')
-        negative_count = sentiments.count('negative')
+        labels = np.asarray(sentiments)
+        batch.sentiments = labels
+        positive_count = int(np.count_nonzero(labels == 'positive'))
+        neutral_count = int(np.count_nonzero(labels == 'neutral'))
+        negative_count = int(np.count_nonzero(labels == 'negative'))
         total_count = len(sentiments)
         
         # Calculate sentiment score (-1 to 1, where 1 is most positive)
@@ -290,5 +259,6 @@ class SentimentAnalyzer:
             'negative': negative_count,
             'total_reviews': total_count,
             'sentiment_score': sentiment_score,
-            'detailed_sentiments': detailed_sentiments[:5]  # Return first 5 detailed sentiments
+            'fallback_reviews': fallback_count,  # Low-confidence reviews also scored by TextBlob
+            'detailed_sentiments': detailed_sentiments  # First 5 detailed sentiments
         }
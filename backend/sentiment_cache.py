@@ -0,0 +1,105 @@
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+
+logger = logging.getLogger(__name__)
+
+
+def sentiment_key(model_version, processed_text):
+    """Cache key for a preprocessed review under a given model version"""
+    return hashlib.sha1(f"{model_version}\0{processed_text}".encode('utf-8')).hexdigest()
+
+
+class SentimentCache:
+    """Memoized sentiment results keyed by content hash.
+
+    A bounded in-memory LRU sits in front of an optional SQLite file so that
+    reviews seen in earlier runs skip vectorization and inference too.
+    Values are `(label, used_fallback)` tuples.
+    """
+
+    def __init__(self, max_entries=10000, path=None):
+        self.max_entries = max_entries
+        self.path = path
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn = None
+        if path:
+            if path != ':memory:':
+                os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+            self._conn = sqlite3.connect(path, check_same_thread=False)
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.execute('CREATE TABLE IF NOT EXISTS sentiments '
+                               '(key TEXT PRIMARY KEY, label TEXT NOT NULL, fallback INTEGER NOT NULL)')
+            self._conn.commit()
+
+    def get_many(self, keys):
+        """Return {key: value} for the keys that are cached"""
+        found = {}
+        with self._lock:
+            missing = []
+            for key in dict.fromkeys(keys):
+                value = self._entries.get(key)
+                if value is None:
+                    missing.append(key)
+                else:
+                    self._entries.move_to_end(key)
+                    found[key] = value
+            if missing and self._conn is not None:
+                for start in range(0, len(missing), 500):
+                    chunk = missing[start:start + 500]
+                    rows = self._conn.execute(
+                        f"SELECT key, label, fallback FROM sentiments WHERE key IN ({','.join('?' * len(chunk))})",
+                        chunk).fetchall()
+                    for key, label, fallback in rows:
+                        found[key] = (label, bool(fallback))
+                        self._remember(key, found[key])
+                        self.disk_hits += 1
+            for key in keys:
+                if key in found:
+                    self.hits += 1
+                else:
+                    self.misses += 1
+        return found
+
+    def put_many(self, items):
+        """Store {key: (label, used_fallback)}"""
+        with self._lock:
+            for key, value in items.items():
+                self._remember(key, value)
+            if self._conn is not None and items:
+                self._conn.executemany(
+                    'INSERT OR REPLACE INTO sentiments (key, label, fallback) VALUES (?, ?, ?)',
+                    [(key, label, int(fallback)) for key, (label, fallback) in items.items()])
+                self._conn.commit()
+
+    def stats(self):
+        with self._lock:
+            return {'entries': len(self._entries), 'hits': self.hits,
+                    'disk_hits': self.disk_hits, 'misses': self.misses}
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            if self._conn is not None:
+                self._conn.execute('DELETE FROM sentiments')
+                self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _remember(self, key, value):
+        # Caller holds the lock
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
@@ -0,0 +1,94 @@
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+
+class StrategyStats:
+    """Per-domain success rate and latency tracking for scrape strategies.
+
+    Strategies are ordered by expected cost to a success (mean attempt
+    latency divided by success rate), which is the optimal order for trying
+    independent fallbacks in sequence. Estimates start from per-strategy
+    priors, decay so they follow sites that change behaviour, and strategies
+    that keep failing are skipped. Every `explore_every` decisions for a
+    domain the least-sampled (or skipped) strategy is tried first so that
+    stale estimates get refreshed.
+    """
+
+    def __init__(self, priors=None, decay=0.95, latency_alpha=0.2, prior_weight=1.0,
+                 min_samples=5, skip_below=0.1, explore_every=20):
+        self.priors = priors or {}
+        self.decay = decay
+        self.latency_alpha = latency_alpha
+        self.prior_weight = prior_weight
+        self.min_samples = min_samples
+        self.skip_below = skip_below
+        self.explore_every = explore_every
+        self._domains = {}
+        self._decisions = {}
+        self._lock = threading.Lock()
+
+    def _prior(self, strategy):
+        return self.priors.get(strategy, (10.0, 0.5))
+
+    def _estimate(self, domain, strategy):
+        prior_latency, prior_success = self._prior(strategy)
+        stats = self._domains.get(domain, {}).get(strategy)
+        if not stats:
+            return prior_latency, prior_success, 0.0
+        trials = stats['trials']
+        success = (stats['successes'] + prior_success * self.prior_weight) / (trials + self.prior_weight)
+        return stats['latency'], success, trials
+
+    def expected_cost(self, domain, strategy):
+        """Seconds expected to be spent per successful scrape with this strategy"""
+        with self._lock:
+            latency, success, _ = self._estimate(domain, strategy)
+        return latency / max(success, 0.01)
+
+    def order(self, domain, strategies):
+        """Return the strategies to try for a domain, cheapest expected first"""
+        with self._lock:
+            estimates = {s: self._estimate(domain, s) for s in strategies}
+            decision = self._decisions.get(domain, 0) + 1
+            self._decisions[domain] = decision
+
+        def cost(strategy):
+            latency, success, _ = estimates[strategy]
+            return latency / max(success, 0.01)
+
+        ranked = sorted(strategies, key=cost)
+        kept = [s for s in ranked
+                if estimates[s][2] < self.min_samples or estimates[s][1] >= self.skip_below]
+        skipped = [s for s in ranked if s not in kept]
+        if not kept:
+            kept, skipped = ranked, []
+
+        if self.explore_every and decision % self.explore_every == 0 and len(ranked) > 1:
+            candidate = skipped[0] if skipped else min(ranked[1:], key=lambda s: estimates[s][2])
+            logger.info(f"Exploring strategy '{candidate}' for {domain}")
+            return [candidate] + [s for s in kept if s != candidate]
+
+        if skipped:
+            logger.info(f"Skipping strategies {skipped} for {domain}")
+        return kept
+
+    def record(self, domain, strategy, success, latency):
+        """Record the outcome and wall-clock latency of one strategy attempt"""
+        with self._lock:
+            per_domain = self._domains.setdefault(domain, {})
+            stats = per_domain.get(strategy)
+            if stats is None:
+                stats = per_domain[strategy] = {'trials': 0.0, 'successes': 0.0,
+                                                'latency': float(latency)}
+            stats['trials'] = stats['trials'] * self.decay + 1
+            stats['successes'] = stats['successes'] * self.decay + (1 if success else 0)
+            stats['latency'] += self.latency_alpha * (latency - stats['latency'])
+
+    def snapshot(self, domain):
+        """Current estimates for a domain, for logging and diagnostics"""
+        with self._lock:
+            strategies = set(self.priors) | set(self._domains.get(domain, {}))
+            return {s: dict(zip(('latency', 'success_rate', 'samples'), self._estimate(domain, s)))
+                    for s in sorted(strategies)}
@@ -0,0 +1,162 @@
+"""Out-of-core training of the sentiment model from a labeled review corpus.
+
+The corpus (CSV or JSONL with text/label columns) is streamed in chunks
+through hashed features and `SGDClassifier.partial_fit`, so memory stays
+flat however many reviews there are. Usually run through
+
+    python -m backend.build_sentiment_model --corpus reviews.jsonl
+"""
+import logging
+import os
+import pickle
+import shutil
+import zlib
+import numpy as np
+import pandas as pd
+from sklearn.linear_model import SGDClassifier
+from sklearn.metrics import accuracy_score
+from backend.model_artifacts import hashing_vectorizer, save_artifacts
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CLASSES = ('negative', 'neutral', 'positive')
+
+
+def iter_corpus(path, chunk_size=10000, text_column='text', label_column='sentiment'):
+    """Yield (texts, labels) chunk by chunk from a CSV or JSON-lines file"""
+    if path.endswith(('.jsonl', '.ndjson')):
+        reader = pd.read_json(path, lines=True, chunksize=chunk_size, dtype=False)
+    else:
+        reader = pd.read_csv(path, chunksize=chunk_size, usecols=[text_column, label_column], dtype=str)
+    with reader:
+        for frame in reader:
+            frame = frame[[text_column, label_column]].dropna()
+            yield frame[text_column].astype(str).tolist(), frame[label_column].astype(str).tolist()
+
+
+def in_holdout(text, percent):
+    """Stable split by content hash, so every epoch and every resume agree"""
+    return zlib.crc32(text.encode('utf-8')) % 100 < percent
+
+
+class StreamingTrainer:
+    """SGD logistic regression over hashed n-grams, trained chunk by chunk.
+
+    With `idf` a first pass over the corpus counts document frequencies
+    into a fixed-width array; the classifier pass then reuses that idf.
+    `fit` checkpoints every `checkpoint_every` chunks into `<output>.checkpoint/`
+    (the current model's artifacts plus the pickled trainer state, so an
+    interrupted run can `resume`). `output` itself, which may be the served
+    model directory, is only written once training and evaluation finish.
+    """
+
+    def __init__(self, classes=DEFAULT_CLASSES, n_features=2 ** 20, idf=True, holdout=5,
+                 max_holdout=50000, alpha=1e-5, chunk_size=10000, text_column='text', label_column='sentiment'):
+        self.classes = np.asarray(sorted(classes), dtype=object)
+        self.holdout = holdout
+        self.max_holdout = max_holdout
+        self.reader_options = {'chunk_size': chunk_size, 'text_column': text_column, 'label_column': label_column}
+        self.vectorizer = hashing_vectorizer(n_features=n_features, idf=idf, stop_words='english', ngram_range=(1, 2))
+        self.estimator = SGDClassifier(loss='log_loss', alpha=alpha, random_state=42)
+        self.use_idf = idf
+        self.idf = None
+        self.epoch = 0
+        self.chunk = 0
+        self.trained_rows = 0
+        self.skipped_rows = 0
+        self.holdout_texts = []
+        self.holdout_labels = []
+
+    def _hashed(self, texts):
+        steps = getattr(self.vectorizer, 'named_steps', None)
+        return steps['hashing'].transform(texts) if steps else self.vectorizer.transform(texts)
+
+    def _split(self, texts, labels):
+        known = set(self.classes.tolist())
+        train_texts, train_labels = [], []
+        for text, label in zip(texts, labels):
+            if label not in known:
+                self.skipped_rows += 1
+            elif in_holdout(text, self.holdout):
+                if self.epoch == 0 and len(self.holdout_texts) < self.max_holdout:
+                    self.holdout_texts.append(text)
+                    self.holdout_labels.append(label)
+            else:
+                train_texts.append(text)
+                train_labels.append(label)
+        return train_texts, train_labels
+
+    def fit_idf(self, path):
+        """Smoothed idf from document frequencies of the training rows"""
+        n_features = self._hashed(['']).shape[1]
+        df = np.zeros(n_features, dtype=np.int64)
+        documents = 0
+        for texts, labels in iter_corpus(path, **self.reader_options):
+            texts = [text for text in texts if not in_holdout(text, self.holdout)]
+            if texts:
+                # Hashed rows hold each column at most once, so counts are document frequencies
+                df += np.bincount(self._hashed(texts).indices, minlength=n_features)
+                documents += len(texts)
+        self.idf = np.log((1 + documents) / (1 + df)) + 1
+        self.vectorizer.named_steps['tfidf'].idf_ = self.idf
+        logger.info(f"Document frequencies counted over {documents} reviews")
+
+    def fit(self, path, output, epochs=1, checkpoint_every=50, resume=False):
+        """Train on the corpus at `path` and write artifacts to `output`; returns (meta, holdout accuracy)"""
+        checkpoint_dir = f"{output}.checkpoint"
+        state_path = os.path.join(checkpoint_dir, 'state.pkl')
+        start = (0, 0)
+        if resume and os.path.exists(state_path):
+            with open(state_path, 'rb') as f:
+                self.__dict__.update(pickle.load(f))
+            if self.idf is not None:
+                self.vectorizer.named_steps['tfidf'].idf_ = self.idf
+            start = (self.epoch, self.chunk)
+            logger.info(f"Resuming at epoch {self.epoch + 1}, chunk {self.chunk}")
+        elif self.use_idf:
+            self.fit_idf(path)
+
+        for epoch in range(start[0], epochs):
+            for chunk, (texts, labels) in enumerate(iter_corpus(path, **self.reader_options)):
+                if (epoch, chunk) < start:
+                    continue
+                self.epoch, self.chunk = epoch, chunk
+                texts, labels = self._split(texts, labels)
+                if texts:
+                    self.estimator.partial_fit(self.vectorizer.transform(texts), labels, classes=self.classes)
+                    self.trained_rows += len(texts)
+                if checkpoint_every and (chunk + 1) % checkpoint_every == 0:
+                    self.checkpoint(checkpoint_dir)
+
+        if not hasattr(self.estimator, 'coef_'):
+            raise ValueError(f"No trainable rows with labels {list(self.classes)} in {path}")
+        accuracy = self.evaluate()
+        meta = save_artifacts(self.estimator, self.vectorizer, output)
+        shutil.rmtree(checkpoint_dir, ignore_errors=True)
+        logger.info(f"Trained on {self.trained_rows} reviews ({self.skipped_rows} skipped), "
+                    f"held-out accuracy: {accuracy if accuracy is None else round(accuracy, 4)}")
+        return meta, accuracy
+
+    def evaluate(self):
+        """Accuracy on the held-out reviews (None when there are none)"""
+        if not self.holdout_texts or not hasattr(self.estimator, 'coef_'):
+            return None
+        predicted = self.estimator.predict(self.vectorizer.transform(self.holdout_texts))
+        return accuracy_score(self.holdout_labels, predicted)
+
+    def checkpoint(self, checkpoint_dir):
+        """Write the current model (as artifacts under `model/`) and trainer state to `checkpoint_dir`"""
+        if not hasattr(self.estimator, 'coef_'):
+            return
+        os.makedirs(checkpoint_dir, exist_ok=True)
+        save_artifacts(self.estimator, self.vectorizer, os.path.join(checkpoint_dir, 'model'))
+        state_path = os.path.join(checkpoint_dir, 'state.pkl')
+        state = {name: getattr(self, name) for name in (
+            'estimator', 'idf', 'trained_rows', 'skipped_rows', 'holdout_texts', 'holdout_labels')}
+        # Resume after this chunk
+        state.update(epoch=self.epoch, chunk=self.chunk + 1)
+        with open(f"{state_path}.tmp", 'wb') as f:
+            pickle.dump(state, f)
+        os.replace(f"{state_path}.tmp", state_path)
+        logger.info(f"Checkpoint at epoch {self.epoch + 1}, chunk {self.chunk + 1}: "
+                    f"{self.trained_rows} reviews, held-out accuracy {self.evaluate()}")
@@ -0,0 +1,113 @@
+import json
+import re
+
+# <script type="application/ld+json"> blocks, matched on raw bytes or text
+# so structured data can be read without building a DOM
+_JSONLD_SCRIPT = (
+    re.compile(r'<script\b[^>]*\btype\s*=\s*["\']?application/ld\+json["\']?[^>]*>(.*?)</script\s*>',
+               re.I | re.S),
+    re.compile(rb'<script\b[^>]*\btype\s*=\s*["\']?application/ld\+json["\']?[^>]*>(.*?)</script\s*>',
+               re.I | re.S),
+)
+
+# Fields a Product schema must fill for the DOM pass to be skipped
+PRODUCT_FIELDS = ('title', 'price', 'rating', 'review_count', 'reviews')
+
+
+def iter_jsonld(content):
+    """Yield every JSON-LD node in a page, flattening lists and @graph"""
+    pattern = _JSONLD_SCRIPT[isinstance(content, (bytes, bytearray))]
+    for match in pattern.finditer(content):
+        raw = match.group(1).strip()
+        if isinstance(raw, bytes):
+            raw = raw.decode('utf-8', errors='replace')
+        if raw.startswith('<!--'):
+            raw = raw[4:].rsplit('-->', 1)[0]
+        try:
+            payload = json.loads(raw)
+        except ValueError:
+            continue
+        stack = payload if isinstance(payload, list) else [payload]
+        for node in stack:
+            if not isinstance(node, dict):
+                continue
+            yield node
+            graph = node.get('@graph')
+            if isinstance(graph, list):
+                yield from (n for n in graph if isinstance(n, dict))
+
+
+def _is_product(node):
+    kind = node.get('@type') or node.get('type')
+    kinds = kind if isinstance(kind, list) else [kind]
+    return any(isinstance(k, str) and k.lower() == 'product' for k in kinds)
+
+
+def product_from_jsonld(node):
+    """Map a schema.org Product node to the scraper's data dict, or None without a name"""
+    name = node.get('name') or node.get('headline')
+    if not isinstance(name, str) or not name.strip():
+        return None
+    data = {
+        'title': name.strip(),
+        'price': None,
+        'rating': None,
+        'review_count': None,
+        'seller': None,
+        'reviews': []
+    }
+
+    offers = node.get('offers') or {}
+    if isinstance(offers, list):
+        offers = offers[0] if offers and isinstance(offers[0], dict) else {}
+    if isinstance(offers, dict):
+        price_val = offers.get('price') or offers.get('lowPrice')
+        if price_val:
+            try:
+                data['price'] = f"${float(str(price_val)):.2f}"
+            except ValueError:
+                data['price'] = str(price_val)
+        seller = offers.get('seller')
+        if isinstance(seller, dict) and seller.get('name'):
+            data['seller'] = seller['name']
+
+    agg = node.get('aggregateRating') or {}
+    if isinstance(agg, dict):
+        try:
+            if agg.get('ratingValue'):
+                data['rating'] = float(agg['ratingValue'])
+        except (TypeError, ValueError):
+            pass
+        try:
+            count = agg.get('reviewCount') or agg.get('ratingCount')
+            if count:
+                data['review_count'] = int(count)
+        except (TypeError, ValueError):
+            pass
+
+    raw_reviews = node.get('review') or node.get('reviews') or []
+    if isinstance(raw_reviews, dict):
+        raw_reviews = [raw_reviews]
+    if isinstance(raw_reviews, list):
+        for rv in raw_reviews[:5]:
+            if not isinstance(rv, dict):
+                continue
+            text = rv.get('reviewBody') or rv.get('description') or rv.get('name')
+            if text:
+                data['reviews'].append({'text': text})
+    return data
+
+
+def extract_jsonld_product(content):
+    """First named Product found in the page's JSON-LD, or None"""
+    for node in iter_jsonld(content):
+        if _is_product(node):
+            data = product_from_jsonld(node)
+            if data:
+                return data
+    return None
+
+
+def missing_fields(data):
+    """Product fields that structured data left empty"""
+    return [f for f in PRODUCT_FIELDS if data.get(f) in (None, '', [])]
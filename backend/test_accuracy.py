@@ -5,19 +5,21 @@ Comprehensive accuracy test for the AI Product Trust & Sentiment Analyzer
 
 import sys
 import os
+import tempfile
+from backend.build_sentiment_model import build
 from backend.sentiment_analyzer import SentimentAnalyzer
 from backend.trust_scorer import TrustScorer
 from backend.scraper import ProductScraper
 from sklearn.metrics import accuracy_score, classification_report, confusion_matrix
 import numpy as np
 
-def test_sentiment_model_accuracy():
+def test_sentiment_model_accuracy(analyzer=None):
     """Test the accuracy of the sentiment analysis model"""
     print("=" * 60)
     print("SENTIMENT ANALYSIS MODEL ACCURACY TEST")
     print("=" * 60)
     
-    analyzer = SentimentAnalyzer()
+    analyzer = analyzer or SentimentAnalyzer()
     
     # Test data with known labels
     test_data = [
@@ -197,6 +199,33 @@ def test_scraper_accuracy():
     
     return detection_accuracy
 
+def test_feature_pipeline_parity():
+    """Compare accuracy of the TF-IDF and hashed feature pipelines trained on the same data"""
+    print("\n" + "=" * 60)
+    print("FEATURE PIPELINE PARITY TEST")
+    print("=" * 60)
+    
+    pipelines = [
+        ("TF-IDF vocabulary", {'features': 'tfidf'}),
+        ("Hashing + idf", {'features': 'hashing'}),
+        ("Hashing, no idf", {'features': 'hashing', 'idf': False}),
+    ]
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, options in pipelines:
+            model_dir = os.path.join(tmp, options['features'] + ('' if options.get('idf', True) else '-noidf'))
+            build(os.path.join(model_dir, 'sentiment'), **options)
+            print(f"\n--- {name} ---")
+            analyzer = SentimentAnalyzer(lazy=False, model_dir=model_dir)
+            results[name] = test_sentiment_model_accuracy(analyzer)
+    
+    print("\nFeature pipeline accuracy:")
+    baseline = results[pipelines[0][0]]
+    for name, accuracy in results.items():
+        print(f"  {name:20s} {accuracy:.2%} ({accuracy - baseline:+.2%} vs TF-IDF)")
+    
+    return results
+
 def overall_system_accuracy():
     """Calculate overall system accuracy"""
     print("\n" + "=" * 60)
@@ -237,4 +266,7 @@ def overall_system_accuracy():
     return overall_acc
 
 if __name__ == "__main__":
-    overall_system_accuracy()
+    if '--features' in sys.argv:
+        test_feature_pipeline_parity()
+    else:
+        overall_system_accuracy()
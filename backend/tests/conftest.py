@@ -0,0 +1,7 @@
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def no_response_cache(monkeypatch):
+    """Keep every ProductScraper built by the suite off the on-disk response cache"""
+    monkeypatch.setenv('RESPONSE_CACHE_ENABLED', '0')
@@ -0,0 +1,60 @@
+import unittest
+from pathlib import Path
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from backend.response_cache import ResponseCache
+from backend.scraper import ProductScraper
+
+FIXTURES = Path(__file__).parent / 'fixtures'
+
+
+class TestAsyncScraping(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        async def product(request):
+            return web.Response(text=(FIXTURES / 'amazon_sample.html').read_text(encoding='utf-8'),
+                                content_type='text/html')
+
+        async def blocked(request):
+            return web.Response(text='<html>Please solve this captcha</html>', content_type='text/html')
+
+        app = web.Application()
+        app.router.add_get('/sample-amazon-product', product)
+        app.router.add_get('/blocked', blocked)
+        self.server = TestServer(app, host='127.0.0.1')
+        await self.server.start_server()
+
+        self.scraper = ProductScraper()
+        self.scraper.allow_fallback = False
+        self.scraper.async_fetcher.scheduler = None
+        self.scraper.response_cache = ResponseCache(':memory:')
+        self.scraper.scrape_with_selenium = lambda url, platform: None
+        del self.scraper.scrape_strategies['advanced']
+
+    async def asyncTearDown(self):
+        await self.server.close()
+
+    def _url(self, path):
+        return str(self.server.make_url(path))
+
+    async def test_scrape_product_async(self):
+        data = await self.scraper.scrape_product_async(self._url('/sample-amazon-product'))
+        self.assertIn('Sample Amazon Product', data['title'])
+        self.assertEqual(data['price'], '$29.99')
+        self.assertEqual(data['review_count'], 123)
+
+    async def test_scrape_many_async_keeps_order_and_isolates_failures(self):
+        urls = [self._url('/sample-amazon-product'), self._url('/blocked'),
+                self._url('/sample-amazon-product')]
+        results = await self.scraper.scrape_many_async(urls)
+        self.assertEqual(len(results), 3)
+        self.assertEqual(results[0]['url'], urls[0])
+        self.assertIsInstance(results[1], RuntimeError)
+        self.assertEqual(results[2]['rating'], 4.5)
+
+    async def test_fetch_many_returns_status(self):
+        results = await self.scraper.async_fetcher.fetch_many([self._url('/missing')])
+        self.assertEqual(results[0].status_code, 404)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,47 @@
+import os
+import unittest
+from backend.async_fetcher import FetchResult
+from backend.block_detector import NOT_BLOCKED, classify, classify_response
+
+FIXTURES = os.path.join(os.path.dirname(__file__), 'fixtures')
+
+AMAZON_CAPTCHA = (b'<html><head><title dir="ltr">Amazon.com</title></head><body>'
+                  b'<form action="/errors/validateCaptcha"><h4>Enter the characters you see below</h4>'
+                  b'</form></body></html>')
+
+
+class TestBlockDetector(unittest.TestCase):
+    def test_fixture_product_pages_are_not_blocked(self):
+        for name in sorted(os.listdir(FIXTURES)):
+            with open(os.path.join(FIXTURES, name), 'rb') as f:
+                self.assertEqual(classify(f.read()), NOT_BLOCKED, name)
+
+    def test_bare_robot_and_verify_are_not_markers(self):
+        page = (b'<html><head><title>Robot Vacuum Cleaner</title></head><body>'
+                b'<span>Verified Purchase</span> Please verify your address.</body></html>')
+        self.assertFalse(classify(page).blocked)
+
+    def test_body_marker(self):
+        verdict = classify(AMAZON_CAPTCHA)
+        self.assertTrue(verdict.blocked)
+        self.assertEqual(verdict.reason, 'body')
+
+    def test_title_marker(self):
+        verdict = classify(b'<html><head><title>Access Denied</title></head><body></body></html>')
+        self.assertEqual((verdict.blocked, verdict.reason, verdict.marker), (True, 'title', 'access denied'))
+
+    def test_text_input_matches_bytes(self):
+        self.assertEqual(classify(AMAZON_CAPTCHA.decode()), classify(AMAZON_CAPTCHA))
+
+    def test_status_and_headers(self):
+        self.assertEqual(classify(b'', 429).reason, 'status')
+        verdict = classify(b'<html></html>', 403, {'CF-Mitigated': 'challenge'})
+        self.assertEqual((verdict.reason, verdict.marker), ('header', 'cf-mitigated'))
+
+    def test_classify_response(self):
+        response = FetchResult('https://www.amazon.com/dp/B00TEST123', 200, AMAZON_CAPTCHA, {})
+        self.assertTrue(classify_response(response).blocked)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,113 @@
+import unittest
+from unittest import mock
+from backend.driver_pool import WebDriverPool, DriverPoolTimeout
+
+
+class FakeDriver:
+    def __init__(self):
+        self.alive = True
+        self.quit_called = False
+        self.cookies_cleared = 0
+        self.visited = []
+
+    @property
+    def current_url(self):
+        if not self.alive:
+            raise RuntimeError("session deleted")
+        return self.visited[-1] if self.visited else 'data:,'
+
+    def delete_all_cookies(self):
+        self.cookies_cleared += 1
+
+    def execute_script(self, script):
+        return None
+
+    def get(self, url):
+        self.visited.append(url)
+
+    def quit(self):
+        self.quit_called = True
+
+
+class TestWebDriverPool(unittest.TestCase):
+    def setUp(self):
+        self.launched = []
+
+        def factory():
+            driver = FakeDriver()
+            self.launched.append(driver)
+            return driver
+
+        self.pool = WebDriverPool(factory, size=2, max_uses=3, checkout_timeout=0.2)
+
+    def test_driver_is_reused_and_reset(self):
+        driver = self.pool.checkout()
+        self.pool.checkin(driver)
+        self.assertIs(self.pool.checkout(), driver)
+        self.assertEqual(len(self.launched), 1)
+        self.assertEqual(driver.cookies_cleared, 1)
+        self.assertEqual(driver.visited[-1], 'about:blank')
+
+    def test_pool_is_bounded(self):
+        self.pool.checkout()
+        self.pool.checkout()
+        with self.assertRaises(DriverPoolTimeout):
+            self.pool.checkout()
+        self.assertEqual(len(self.launched), 2)
+
+    def test_unhealthy_driver_is_replaced(self):
+        driver = self.pool.checkout()
+        self.pool.checkin(driver)
+        driver.alive = False
+        replacement = self.pool.checkout()
+        self.assertIsNot(replacement, driver)
+        self.assertTrue(driver.quit_called)
+
+    def test_discard_and_max_uses(self):
+        driver = self.pool.checkout()
+        self.pool.checkin(driver, discard=True)
+        self.assertTrue(driver.quit_called)
+
+        driver = self.pool.checkout()
+        for _ in range(2):
+            self.pool.checkin(driver)
+            self.assertIs(self.pool.checkout(), driver)
+        self.pool.checkin(driver)
+        self.assertTrue(driver.quit_called)
+        self.assertEqual(self.pool.stats()['created'], 0)
+
+    def test_warm_and_close(self):
+        self.assertEqual(self.pool.warm(), 2)
+        self.assertEqual(self.pool.stats()['idle'], 2)
+        self.pool.close()
+        self.assertTrue(all(d.quit_called for d in self.launched))
+
+
+class TestScraperDriverPool(unittest.TestCase):
+    def test_pool_does_not_keep_scraper_alive(self):
+        import gc
+        import weakref
+        from backend.scraper import ProductScraper
+
+        scraper = ProductScraper()
+        pool = scraper.driver_pool
+        ref = weakref.ref(scraper)
+        del scraper
+        gc.collect()
+        self.assertIsNone(ref())
+        # Collecting the owner closes its pool
+        self.assertTrue(pool._closed)
+
+    def test_politeness_delay_is_taken_before_checkout(self):
+        from backend.scraper import ProductScraper
+
+        scraper = ProductScraper()
+        events = []
+        scraper.politeness = mock.Mock(wait=lambda url: events.append('wait'))
+        scraper.driver_pool = mock.Mock(checkout=lambda: events.append('checkout') or FakeDriver())
+        scraper.scrape_with_selenium('https://www.amazon.com/dp/B000000000', 'amazon')
+        self.assertEqual(events[:2], ['wait', 'checkout'])
+
+
+if __name__ == '__main__':
+    unittest.main()
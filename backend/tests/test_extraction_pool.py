@@ -0,0 +1,52 @@
+import asyncio
+import os
+import unittest
+from backend.extraction_pool import ExtractionPool
+from backend.scraper import ProductScraper
+
+FIXTURES = os.path.join(os.path.dirname(__file__), 'fixtures')
+
+
+class TestExtractionPool(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.pool = ExtractionPool(workers=2, timeout=60)
+        cls.pids = cls.pool.warm()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.pool.close()
+
+    def load(self, name):
+        with open(os.path.join(FIXTURES, name), 'rb') as f:
+            return f.read()
+
+    def test_warm_starts_every_worker(self):
+        self.assertEqual(len(self.pids), 2)
+        self.assertNotIn(os.getpid(), self.pids)
+        # Warming again reuses the same processes
+        self.assertEqual(self.pool.warm(), self.pids)
+
+    def test_matches_in_process_extraction(self):
+        inline = ProductScraper.for_extraction()
+        for name, platform in [('amazon_sample.html', 'amazon'), ('ebay_item.html', 'ebay')]:
+            html = self.load(name)
+            self.assertEqual(self.pool.extract(html, platform), inline.extract_data(html, platform))
+            self.assertEqual(self.pool.extract(html.decode('utf-8'), platform), inline.extract_data(html, platform))
+
+    def test_errors_propagate(self):
+        with self.assertRaises(ValueError):
+            self.pool.extract(b'<html></html>', 'amazon')
+
+    def test_async(self):
+        html = self.load('ebay_sample.html')
+        results = asyncio.run(self._extract_many(html))
+        self.assertEqual(len(results), 4)
+        self.assertTrue(all(r == results[0] for r in results))
+
+    async def _extract_many(self, html):
+        return await asyncio.gather(*(self.pool.extract_async(html, 'ebay') for _ in range(4)))
+
+
+if __name__ == '__main__':
+    unittest.main()
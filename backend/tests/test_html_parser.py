@@ -0,0 +1,42 @@
+import os
+import unittest
+from unittest import mock
+from backend.html_parser import ENGINES, parse_html, resolve_engine
+from backend.scraper import ProductScraper
+
+FIXTURES = os.path.join(os.path.dirname(__file__), 'fixtures')
+CASES = [
+    ('amazon_sample.html', 'amazon', 'https://www.amazon.com/dp/B00TEST123'),
+    ('amazon_product.html', 'amazon', 'https://www.amazon.com/dp/B00TEST123'),
+    ('ebay_sample.html', 'ebay', 'https://www.ebay.com/itm/999999'),
+    ('ebay_item.html', 'ebay', 'https://www.ebay.com/itm/999999'),
+    ('aliexpress_sample.html', 'aliexpress', 'https://www.aliexpress.com/item/12345.html'),
+]
+
+
+class TestHtmlParser(unittest.TestCase):
+    def test_unknown_engine_falls_back(self):
+        self.assertIn(resolve_engine('no-such-parser'), ENGINES)
+
+    def test_parse_html(self):
+        soup = parse_html('<html><head><title>T</title></head></html>', 'html.parser')
+        self.assertEqual(soup.title.string, 'T')
+
+    def test_engines_extract_the_same_data(self):
+        scraper = ProductScraper()
+        for name, platform, url in CASES:
+            with open(os.path.join(FIXTURES, name), encoding='utf-8') as f:
+                html = f.read()
+            results = {}
+            for engine in ENGINES:
+                if resolve_engine(engine) != engine:
+                    continue
+                with mock.patch.object(scraper, 'get_parser_engine', return_value=engine):
+                    results[engine] = scraper.extract_data(html, platform, url)
+            baseline = results.pop('html.parser')
+            for engine, data in results.items():
+                self.assertEqual(data, baseline, f"{name} with {engine}")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,53 @@
+import os
+import unittest
+import numpy as np
+from backend.build_sentiment_model import TRAINING_SAMPLES, train_model
+from backend.linear_inference import LinearSentimentModel
+from backend.model_artifacts import DEFAULT_MODEL_DIR, load_artifacts
+from backend.sentiment_analyzer import SentimentAnalyzer
+
+TEXTS = [text for text, _ in TRAINING_SAMPLES] + [
+    "This product is absolutely amazing! Best purchase ever!",
+    "Cheap materials, very poor build quality.",
+    "It's okay, nothing special about it.",
+    "Produit très bon, livraison rapide",
+    "unseen vocabulary entirely",
+    "",
+    "great great great great product",
+]
+
+
+class TestLinearInference(unittest.TestCase):
+    def assertParity(self, model, vectorizer):
+        compiled = LinearSentimentModel.compile(model, vectorizer)
+        matrix = vectorizer.transform(TEXTS)
+        self.assertEqual(compiled.predict(TEXTS).tolist(), model.predict(matrix).tolist())
+        np.testing.assert_allclose(compiled.predict_proba(TEXTS), model.predict_proba(matrix), atol=1e-12)
+
+    def test_shipped_model_parity(self):
+        model, vectorizer, _ = load_artifacts(os.path.join(DEFAULT_MODEL_DIR, 'sentiment'))
+        self.assertParity(model, vectorizer)
+
+    def test_hashing_models_parity(self):
+        for idf in (True, False):
+            model, vectorizer, _ = train_model(features='hashing', n_features=2 ** 12, idf=idf)
+            self.assertParity(model, vectorizer)
+
+    def test_binary_model_parity(self):
+        samples = [(text, label) for text, label in TRAINING_SAMPLES if label != 'neutral']
+        model, vectorizer, _ = train_model(samples)
+        self.assertEqual(model.coef_.shape[0], 1)
+        self.assertParity(model, vectorizer)
+
+    def test_analyzer_scores_through_compiled_model(self):
+        analyzer = SentimentAnalyzer(lazy=False)
+        analyzer.cache = None
+        self.assertIsInstance(analyzer.scorer, LinearSentimentModel)
+        processed = [analyzer._preprocess_text(text) for text in TEXTS]
+        compiled = analyzer._score(TEXTS, processed)
+        analyzer.scorer = None
+        self.assertEqual(analyzer._score(TEXTS, processed), compiled)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+import json
+import os
+import pickle
+import tempfile
+import unittest
+import numpy as np
+from backend.build_sentiment_model import train_model
+from backend.model_artifacts import DEFAULT_MODEL_DIR, load_artifacts, save_artifacts
+from backend.sentiment_analyzer import SentimentAnalyzer
+
+TEXTS = ['great product love it', 'terrible waste of money', 'its okay nothing special', 'unseen words only']
+
+
+class TestModelArtifacts(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.directory = os.path.join(self.tmp.name, 'sentiment')
+        analyzer = SentimentAnalyzer(lazy=False)
+        # Round-trip through pickle so the reference objects are ordinary in-memory sklearn estimators
+        self.model = pickle.loads(pickle.dumps(analyzer.model))
+        self.vectorizer = pickle.loads(pickle.dumps(analyzer.vectorizer))
+
+    def test_round_trip_predictions_match(self):
+        meta = save_artifacts(self.model, self.vectorizer, self.directory)
+        model, vectorizer, loaded = load_artifacts(self.directory)
+        self.assertEqual(loaded['fingerprint'], meta['fingerprint'])
+        self.assertIsInstance(model.coef_, np.memmap)
+        self.assertIsInstance(vectorizer.idf_, np.memmap)
+        expected = self.model.predict_proba(self.vectorizer.transform(TEXTS))
+        np.testing.assert_allclose(model.predict_proba(vectorizer.transform(TEXTS)), expected)
+        self.assertEqual(model.predict(vectorizer.transform(TEXTS)).tolist(),
+                         self.model.predict(self.vectorizer.transform(TEXTS)).tolist())
+
+    def test_hashing_features_round_trip_without_vocabulary(self):
+        for idf in (True, False):
+            model, vectorizer, _ = train_model(features='hashing', n_features=2 ** 12, idf=idf)
+            meta = save_artifacts(model, vectorizer, self.directory)
+            self.assertEqual(meta['features'], 'hashing')
+            self.assertFalse(os.path.exists(os.path.join(self.directory, 'vocabulary.npy')))
+            self.assertEqual(os.path.exists(os.path.join(self.directory, 'idf.npy')), idf)
+            loaded_model, loaded_vectorizer, _ = load_artifacts(self.directory)
+            np.testing.assert_allclose(loaded_model.predict_proba(loaded_vectorizer.transform(TEXTS)),
+                                       model.predict_proba(vectorizer.transform(TEXTS)))
+
+    def test_shipped_artifacts_keep_their_fingerprint(self):
+        directory = os.path.join(DEFAULT_MODEL_DIR, 'sentiment')
+        with open(os.path.join(directory, 'meta.json')) as f:
+            shipped = json.load(f)['fingerprint']
+        model, vectorizer, _ = load_artifacts(directory)
+        self.assertEqual(save_artifacts(model, vectorizer, self.directory)['fingerprint'], shipped)
+
+    def test_save_replaces_existing_model_without_leftovers(self):
+        save_artifacts(self.model, self.vectorizer, self.directory)
+        meta = save_artifacts(self.model, self.vectorizer, self.directory)
+        self.assertEqual(load_artifacts(self.directory)[2]['fingerprint'], meta['fingerprint'])
+        self.assertEqual(os.listdir(self.tmp.name), ['sentiment'])
+
+    def test_mixed_artifacts_are_rejected(self):
+        save_artifacts(self.model, self.vectorizer, self.directory)
+        coef = np.load(os.path.join(self.directory, 'coef.npy'))
+        np.save(os.path.join(self.directory, 'coef.npy'), coef * 2)
+        with self.assertRaises(ValueError):
+            load_artifacts(self.directory)
+
+    def test_unknown_format_is_rejected(self):
+        save_artifacts(self.model, self.vectorizer, self.directory)
+        meta_path = os.path.join(self.directory, 'meta.json')
+        with open(meta_path) as f:
+            meta = json.load(f)
+        meta['format'] = 999
+        with open(meta_path, 'w') as f:
+            json.dump(meta, f)
+        with self.assertRaises(ValueError):
+            load_artifacts(self.directory)
+
+    def test_model_dir_does_not_depend_on_cwd(self):
+        cwd = os.getcwd()
+        self.addCleanup(os.chdir, cwd)
+        os.chdir(self.tmp.name)
+        analyzer = SentimentAnalyzer()
+        self.assertEqual(analyzer.artifact_dir, os.path.join(DEFAULT_MODEL_DIR, 'sentiment'))
+        self.assertFalse(os.path.exists(os.path.join(self.tmp.name, 'models')))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,42 @@
+import os
+import unittest
+from backend.benchmark_extraction import build_page, legacy_scan
+from backend.html_parser import parse_html
+from backend.page_scan import scan_page
+
+FIXTURES = os.path.join(os.path.dirname(__file__), 'fixtures')
+
+
+class TestPageScan(unittest.TestCase):
+    def assertMatchesLegacy(self, html):
+        soup = parse_html(html, 'html.parser')
+        found = scan_page(soup)
+        self.assertEqual((found.price_text, found.seller, [r['text'] for r in found.reviews]),
+                         legacy_scan(soup))
+
+    def test_fixtures_match_legacy_sweeps(self):
+        for name in sorted(os.listdir(FIXTURES)):
+            with open(os.path.join(FIXTURES, name), encoding='utf-8') as f:
+                self.assertMatchesLegacy(f.read())
+
+    def test_large_page_matches_legacy_sweeps(self):
+        self.assertMatchesLegacy(build_page(size_mb=0.2, reviews=5))
+
+    def test_seller_priority_and_empty_matches(self):
+        soup = parse_html('<span class="brand">Acme</span><span class="seller-name"></span>'
+                          '<b class="x seller-name">Late</b><a id="sellerProfileTriggerId">Store</a>',
+                          'html.parser')
+        self.assertEqual(scan_page(soup).seller, 'Store')
+        soup = parse_html('<span class="seller-name"></span><b class="seller-name">Late</b>'
+                          '<span class="brand">Acme</span>', 'html.parser')
+        self.assertEqual(scan_page(soup).seller, 'Acme')
+
+    def test_price_skipped_when_not_wanted(self):
+        soup = parse_html('<title>T</title><p>only $5.00</p>', 'html.parser')
+        self.assertIsNone(scan_page(soup, want_price=False).price_text)
+        self.assertEqual(scan_page(soup).price_text, '$5.00')
+        self.assertEqual(scan_page(soup).title, 'T')
+
+
+if __name__ == '__main__':
+    unittest.main()
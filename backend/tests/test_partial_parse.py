@@ -0,0 +1,84 @@
+import os
+import unittest
+from unittest import mock
+from backend.html_parser import parse_html
+from backend.partial_parse import build_parse_filter, selector_rules
+from backend.scraper import ProductScraper
+
+FIXTURES = os.path.join(os.path.dirname(__file__), 'fixtures')
+
+PAGE = ('<html><head><title>Page</title><style>p {}</style><script>var x = "$1.00";</script>'
+        '<script type="application/ld+json">{"@type": "Product"}</script></head><body>'
+        '<nav><a>$2.00</a><svg><path d="M0"/></svg></nav>'
+        '<div id="centerCol"><h1 id="productTitle">Widget</h1><script>track()</script></div>'
+        '<div id="reviewsMedley"><span class="a-size-base">12 ratings</span></div>'
+        '<span class="a-size-base">elsewhere</span></body></html>')
+
+
+class TestPartialParse(unittest.TestCase):
+    def test_selector_rules(self):
+        rules = selector_rules(['#a .b, h1[itemprop="name"]', 'div.x > span:first-child'])
+        self.assertIn((None, frozenset(['a']), frozenset(), ()), rules)
+        self.assertIn((None, frozenset(), frozenset(['b']), ()), rules)
+        self.assertIn(('h1', frozenset(), frozenset(), (('itemprop', 'name'),)), rules)
+        self.assertIn(('div', frozenset(), frozenset(['x']), ()), rules)
+        self.assertIn(('span', frozenset(), frozenset(), ()), rules)
+
+    def test_keeps_only_metadata_and_selected_subtrees(self):
+        parse_filter = build_parse_filter(['#productTitle', '#reviewsMedley .a-size-base'])
+        for engine in ('html.parser', 'lxml'):
+            soup = parse_html(PAGE, engine, parse_filter)
+            self.assertEqual(soup.title.string, 'Page')
+            self.assertIsNone(soup.find('style'))
+            self.assertIsNone(soup.find('svg'))
+            self.assertEqual([s.get('type') for s in soup.find_all('script')], ['application/ld+json'])
+            self.assertEqual(soup.select_one('#reviewsMedley .a-size-base').get_text(), '12 ratings')
+            self.assertNotIn('$2.00', soup.get_text())
+
+    def test_fixtures_extract_the_same_as_full_parse(self):
+        scraper = ProductScraper()
+        cases = [('amazon_sample.html', 'amazon'), ('amazon_product.html', 'amazon'),
+                 ('ebay_sample.html', 'ebay'), ('ebay_item.html', 'ebay')]
+        for name, platform in cases:
+            with open(os.path.join(FIXTURES, name), encoding='utf-8') as f:
+                html = f.read()
+            partial = scraper.extract_data(html, platform)
+            with mock.patch.dict(scraper.parse_filters, clear=True):
+                full = scraper.extract_data(html, platform)
+            self.assertEqual(partial, full, name)
+
+    def test_falls_back_to_full_parse_without_title(self):
+        scraper = ProductScraper()
+        html = '<html><head><title>Other layout</title></head><body>' + 'x' * 100 + \
+               '<p>$9.99</p></body></html>'
+        data = scraper.extract_data(html, 'amazon')
+        self.assertEqual(data['price'], '$9.99')
+
+    def test_finds_price_outside_containers_without_full_parse(self):
+        scraper = ProductScraper()
+        with open(os.path.join(FIXTURES, 'daraz_price_outside.html'), encoding='utf-8') as f:
+            html = f.read()
+        strained = parse_html(html, 'lxml', scraper.parse_filters['daraz'])
+        self.assertNotIn('$24.50', strained.get_text())
+
+        with mock.patch('backend.scraper.parse_html', wraps=parse_html) as parse:
+            data = scraper.extract_data(html, 'daraz')
+        self.assertEqual(parse.call_count, 1)
+        self.assertEqual(data['title'], 'Wireless Earbuds with Charging Case')
+        self.assertEqual(data['price'], '$24.50')
+        self.assertEqual(data['seller'], 'SoundHub Official')
+        with mock.patch.dict(scraper.parse_filters, clear=True):
+            self.assertEqual(scraper.extract_data(html, 'daraz'), data)
+
+    def test_missing_seller_does_not_trigger_full_parse(self):
+        scraper = ProductScraper()
+        html = ('<html><head><title>Item</title></head><body><h1 id="productTitle">Lamp</h1>'
+                '<span class="a-price"><span class="a-offscreen">$12.00</span></span>'
+                + 'x' * 100 + '</body></html>')
+        with mock.patch('backend.scraper.parse_html', wraps=parse_html) as parse:
+            data = scraper.extract_data(html, 'amazon')
+        self.assertEqual(parse.call_count, 1)
+        self.assertEqual((data['title'], data['price'], data['seller']), ('Lamp', '$12.00', None))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,40 @@
+import asyncio
+import unittest
+from backend.politeness import HostPolitenessScheduler, host_key
+
+
+class TestHostPolitenessScheduler(unittest.TestCase):
+    def setUp(self):
+        self.scheduler = HostPolitenessScheduler(min_interval=1.0, max_interval=1.0)
+
+    def test_host_key_normalization(self):
+        self.assertEqual(host_key('https://www.Amazon.com/dp/B00TEST123'), 'amazon.com')
+        self.assertEqual(host_key('https://user@daraz.pk:443/products/x'), 'daraz.pk')
+        self.assertEqual(host_key('www.ebay.com'), 'ebay.com')
+
+    def test_first_hit_is_immediate(self):
+        self.assertEqual(self.scheduler.reserve('https://www.amazon.com/dp/A'), 0)
+
+    def test_same_host_is_spaced(self):
+        self.scheduler.reserve('https://www.amazon.com/dp/A')
+        second = self.scheduler.reserve('https://amazon.com/dp/B')
+        third = self.scheduler.reserve('https://amazon.com/dp/C')
+        self.assertGreater(second, 0.9)
+        self.assertGreater(third, second + 0.9)
+
+    def test_different_hosts_do_not_wait(self):
+        self.scheduler.reserve('https://www.amazon.com/dp/A')
+        self.assertEqual(self.scheduler.reserve('https://www.daraz.pk/products/x'), 0)
+        self.assertEqual(self.scheduler.reserve('https://www.ebay.com/itm/1'), 0)
+
+    def test_interval_override(self):
+        self.scheduler.reserve('https://www.amazon.com/dp/A')
+        self.assertGreater(self.scheduler.reserve('https://www.amazon.com/dp/A', (5, 5)), 4.9)
+
+    def test_wait_async_for_new_host(self):
+        delay = asyncio.run(self.scheduler.wait_async('https://www.walmart.com/ip/1'))
+        self.assertEqual(delay, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
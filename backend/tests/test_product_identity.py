@@ -0,0 +1,43 @@
+import unittest
+from backend.product_identity import (ProductKey, canonical_product_key, extract_product_id,
+                                      normalize_url)
+
+
+class TestProductIdentity(unittest.TestCase):
+    def test_amazon_variants_collapse(self):
+        variants = [
+            'https://www.amazon.com/dp/B08N5KWB9H',
+            'https://amazon.com/gp/product/B08N5KWB9H',
+            'https://www.amazon.com/Some-Title/dp/B08N5KWB9H/ref=sr_1_1?keywords=x&th=1',
+            'https://smile.amazon.com/dp/b08n5kwb9h#customerReviews',
+        ]
+        keys = {canonical_product_key(url) for url in variants}
+        self.assertEqual(keys, {ProductKey('amazon', 'B08N5KWB9H', 'amazon.com')})
+
+    def test_amazon_marketplaces_stay_distinct(self):
+        self.assertNotEqual(canonical_product_key('https://www.amazon.com/dp/B08N5KWB9H'),
+                            canonical_product_key('https://www.amazon.co.uk/dp/B08N5KWB9H'))
+
+    def test_ebay_item_ignores_tracking(self):
+        a = canonical_product_key('https://www.ebay.com/itm/403726040284?hash=item5e&_trkparms=abc')
+        b = canonical_product_key('https://ebay.com/itm/Some-Listing-Title/403726040284')
+        self.assertEqual(a, b)
+        self.assertEqual(str(a), 'ebay:403726040284')
+
+    def test_other_platforms(self):
+        self.assertEqual(extract_product_id('https://www.daraz.pk/products/airpods-i123456789-s987.html'),
+                         '123456789')
+        self.assertEqual(extract_product_id('https://www.aliexpress.com/item/1005001634193080.html?spm=a2g0o'),
+                         '1005001634193080')
+        self.assertEqual(extract_product_id('https://www.walmart.com/ip/Some-Thing/55443322'), '55443322')
+        self.assertEqual(str(canonical_product_key('https://www.daraz.pk/products/x-i42.html')),
+                         'daraz:daraz.pk:42')
+
+    def test_generic_fallback_is_normalized_url(self):
+        key = canonical_product_key('https://Shop.Example.com/p/widget?utm_source=x&color=red#top')
+        self.assertEqual(key, ProductKey('generic', 'https://shop.example.com/p/widget?color=red', ''))
+        self.assertEqual(normalize_url('https://a.com/p?b=2&fbclid=z&a=1'), 'https://a.com/p?a=1&b=2')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,107 @@
+import time
+import unittest
+from backend.politeness import HostPolitenessScheduler
+from backend.response_cache import ResponseCache, cache_key, parse_cache_control
+from backend.scraper import ProductScraper
+
+PAGE = b'<html><head><title>Cached</title></head><body>' + b'x' * 200 + b'</body></html>'
+
+
+class FakeResponse:
+    def __init__(self, status_code, content=b'', headers=None):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+        self.encoding = 'utf-8'
+
+    @property
+    def text(self):
+        return self.content.decode(self.encoding)
+
+
+class FakeSession:
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.headers = {}
+        self.calls = []
+
+    def get(self, url, timeout=None, headers=None):
+        self.calls.append(headers or {})
+        return self.responses.pop(0)
+
+
+class TestResponseCache(unittest.TestCase):
+    def setUp(self):
+        self.cache = ResponseCache(':memory:', default_ttl=60, max_bytes=1000)
+
+    def test_url_variants_share_cache_key(self):
+        self.assertEqual(cache_key('https://www.amazon.com/Some-Title/dp/B00TEST123?ref=sr_1&th=1'),
+                         cache_key('https://amazon.com/gp/product/B00TEST123'))
+
+    def test_parse_cache_control(self):
+        self.assertEqual(parse_cache_control('public, max-age=300, no-cache'),
+                         {'public': True, 'max-age': '300', 'no-cache': True})
+
+    def test_store_and_fresh_lookup(self):
+        self.assertTrue(self.cache.store('https://a.com/p', 200, {'Content-Encoding': 'gzip'}, PAGE))
+        entry = self.cache.lookup('https://a.com/p#frag')
+        self.assertTrue(entry['fresh'])
+        self.assertNotIn('Content-Encoding', entry['headers'])
+        self.assertEqual(self.cache.to_response(entry).content, PAGE)
+
+    def test_no_store_is_honored(self):
+        self.assertFalse(self.cache.store('https://a.com/p', 200, {'Cache-Control': 'no-store'}, PAGE))
+        self.assertIsNone(self.cache.lookup('https://a.com/p'))
+
+    def test_stale_entry_keeps_validators(self):
+        self.cache.store('https://a.com/p', 200, {'Cache-Control': 'max-age=0', 'ETag': '"v1"',
+                                                  'Last-Modified': 'Wed, 01 Jan 2025 00:00:00 GMT'}, PAGE)
+        entry = self.cache.lookup('https://a.com/p')
+        self.assertFalse(entry['fresh'])
+        self.assertEqual(self.cache.conditional_headers(entry),
+                         {'If-None-Match': '"v1"', 'If-Modified-Since': 'Wed, 01 Jan 2025 00:00:00 GMT'})
+        self.cache.refresh(entry, {'Cache-Control': 'max-age=120'})
+        self.assertTrue(self.cache.lookup('https://a.com/p')['fresh'])
+
+    def test_lru_eviction(self):
+        self.cache.max_bytes = len(PAGE) * 2
+        self.cache.store('https://a.com/1', 200, {}, PAGE)
+        time.sleep(0.01)
+        self.cache.store('https://a.com/2', 200, {}, PAGE)
+        time.sleep(0.01)
+        self.cache.lookup('https://a.com/1')
+        time.sleep(0.01)
+        self.cache.store('https://a.com/3', 200, {}, PAGE)
+        self.assertIsNotNone(self.cache.lookup('https://a.com/1'))
+        self.assertIsNone(self.cache.lookup('https://a.com/2'))
+        self.assertLessEqual(self.cache.stats()['bytes'], len(PAGE) * 2)
+
+
+class TestScraperResponseCache(unittest.TestCase):
+    def setUp(self):
+        self.scraper = ProductScraper()
+        self.scraper.response_cache = ResponseCache(':memory:')
+        self.scraper.politeness = HostPolitenessScheduler(min_interval=0, max_interval=0)
+
+    def test_fresh_hit_skips_network(self):
+        self.scraper.session = FakeSession([FakeResponse(200, PAGE)])
+        first = self.scraper.scrape_with_anti_bot('https://shop.example.com/item/1')
+        second = self.scraper.scrape_with_anti_bot('https://shop.example.com/item/1')
+        self.assertEqual(first.content, second.content)
+        self.assertEqual(len(self.scraper.session.calls), 1)
+
+    def test_304_revalidation_reuses_body(self):
+        self.scraper.session = FakeSession([
+            FakeResponse(200, PAGE, {'Cache-Control': 'no-cache', 'ETag': '"abc"'}),
+            FakeResponse(304, b'', {'ETag': '"abc"'})
+        ])
+        self.scraper.scrape_with_anti_bot('https://shop.example.com/item/2')
+        revalidated = self.scraper.scrape_with_anti_bot('https://shop.example.com/item/2')
+        self.assertEqual(self.scraper.session.calls[1], {'If-None-Match': '"abc"'})
+        self.assertEqual(revalidated.status_code, 200)
+        self.assertEqual(revalidated.content, PAGE)
+        self.assertEqual(self.scraper.response_cache.stats()['revalidations'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
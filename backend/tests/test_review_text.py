@@ -0,0 +1,68 @@
+import re
+import unittest
+from backend.review_text import ReviewBatch, normalize_text
+from backend.sentiment_analyzer import SentimentAnalyzer
+from backend.trust_scorer import TrustScorer
+
+TEXTS = [
+    "Great!! product\t\n works 100%  ",
+    "İstanbul café — naïve test",
+    "",
+    "   ",
+    "Don't   buy\x1cthis, it's a SCAM",
+    "This is a long and detailed review about the battery life, screen and the packaging.",
+]
+
+
+def regex_preprocess(text):
+    text = re.sub(r'[^a-zA-Z\s]', '', text.lower())
+    return re.sub(r'\s+', ' ', text).strip()
+
+
+def reference_quality_score(scorer, reviews):
+    # The per-review loops TrustScorer used before ReviewBatch
+    texts = [r.get('text', '') if isinstance(r, dict) else str(r) for r in reviews]
+    score = sum(len(t) > 50 for t in texts) / len(texts) * 0.3
+    suspicious = 0
+    for text in (t.lower() for t in texts):
+        suspicious += len(set(text.split())) < 5
+        suspicious += any(k in text for k in scorer.suspicious_keywords)
+    return max(0.0, min(1.0, score - suspicious / len(texts) * 0.4))
+
+
+class TestReviewText(unittest.TestCase):
+    def test_normalize_matches_regex_preprocessing(self):
+        for text in TEXTS:
+            self.assertEqual(normalize_text(text.lower()), regex_preprocess(text))
+
+    def test_batch_columns(self):
+        reviews = [{'text': TEXTS[0]}, {'text': None}, TEXTS[4]]
+        batch = ReviewBatch.from_reviews(reviews, keywords=['scam', "don't buy"])
+        self.assertEqual(batch.texts, [TEXTS[0], '', TEXTS[4]])
+        self.assertEqual(batch.unique_tokens.tolist(), [4, 0, 6])
+        self.assertEqual(batch.keyword_hits.tolist(), [False, False, True])
+        self.assertEqual(batch.normalized[2], 'dont buy this its a scam')
+        self.assertEqual(batch.lengths.tolist(), [len(TEXTS[0]), 0, len(TEXTS[4])])
+
+    def test_trust_scorer_consumes_batch(self):
+        scorer = TrustScorer()
+        reviews = [{'text': text} for text in TEXTS] * 3
+        expected = reference_quality_score(scorer, reviews)
+        self.assertAlmostEqual(scorer.calculate_review_quality_score(reviews), expected)
+        self.assertAlmostEqual(scorer.calculate_review_quality_score(reviews, batch=scorer.review_batch(reviews)),
+                               expected)
+        # A batch built without the scorer's keywords is rebuilt rather than trusted
+        self.assertAlmostEqual(scorer.calculate_review_quality_score(reviews, batch=ReviewBatch.from_reviews(reviews)),
+                               expected)
+
+    def test_analyzer_consumes_batch(self):
+        analyzer = SentimentAnalyzer()
+        reviews = [{'text': text} for text in TEXTS]
+        batch = ReviewBatch.from_reviews(reviews)
+        result = analyzer.analyze_reviews(reviews, batch=batch)
+        self.assertEqual(result, analyzer.analyze_reviews(reviews))
+        self.assertEqual(batch.sentiments.tolist(), analyzer.analyze_batch(TEXTS))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,38 @@
+import unittest
+from backend.html_parser import parse_html
+from backend.scraper import ProductScraper
+from backend.selector_registry import SelectorPlan, SelectorRegistry
+
+HTML = ('<html><body><span class="b">second</span><h1 class="a">first</h1>'
+        '<span class="c"></span></body></html>')
+
+
+class TestSelectorRegistry(unittest.TestCase):
+    def setUp(self):
+        self.soup = parse_html(HTML, 'html.parser')
+
+    def test_string_matches_in_document_order(self):
+        self.assertEqual(SelectorPlan('.a, .b').select_one(self.soup).get_text(), 'second')
+
+    def test_list_matches_in_priority_order(self):
+        plan = SelectorPlan(['.missing', '.a', '.b'])
+        self.assertEqual(plan.select_one(self.soup).get_text(), 'first')
+        self.assertEqual([e.get_text() for e in plan.candidates(self.soup)], ['first', 'second'])
+
+    def test_locator(self):
+        self.assertEqual(SelectorPlan('.a, .b').locator, ('css selector', '.a, .b'))
+        self.assertEqual(SelectorPlan(['.a']).locator, ('css selector', '.a'))
+        with self.assertRaises(ValueError):
+            SelectorPlan(['.a', '.b']).locator
+
+    def test_scraper_compiles_platform_configs(self):
+        scraper = ProductScraper()
+        self.assertEqual(scraper.selectors.get('amazon', 'wait_for').css, '#productTitle')
+        for platform, config in scraper.platform_configs.items():
+            for field, css in config['selectors'].items():
+                self.assertEqual(scraper.selectors.get(platform, field).css, css)
+        self.assertIsNone(SelectorRegistry().get('amazon', 'title'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,100 @@
+import tempfile
+import unittest
+from backend.sentiment_analyzer import SentimentAnalyzer
+
+REVIEWS = [
+    "This product is amazing! Highly recommend it.",
+    "Terrible quality, broke after one day.",
+    "It's okay, nothing special.",
+    "",
+    "   ",
+    "Great value, fast shipping, would buy again!!",
+    "Don't waste your money on this junk.",
+    "12345 !!!",
+]
+
+# Ordinary reviews in vocabulary the bundled model was not trained on
+UNSEEN_REVIEWS = [
+    "Battery lasts two days on a single charge, screen is bright.",
+    "Arrived a week late and the box was crushed.",
+    "The strap broke within a month of light use.",
+    "Fits my phone snugly, buttons are easy to press.",
+    "Customer support never answered my emails.",
+    "Setup took five minutes, instructions were clear.",
+    "Keeps coffee hot for hours, lid does not leak.",
+    "Stopped charging after two weeks.",
+]
+
+
+class TestSentimentBatch(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.analyzer = SentimentAnalyzer()
+
+    def test_batch_matches_single_review_path(self):
+        expected = [self.analyzer.analyze_single_review(text) for text in REVIEWS]
+        self.assertEqual(self.analyzer.analyze_batch(REVIEWS), expected)
+
+    def test_analyze_reviews_counts(self):
+        reviews = [{'text': t} for t in REVIEWS] * 30
+        result = self.analyzer.analyze_reviews(reviews)
+        labels = [self.analyzer.analyze_single_review(t) for t in REVIEWS] * 30
+        self.assertEqual(result['total_reviews'], len(reviews))
+        for label in ('positive', 'neutral', 'negative'):
+            self.assertEqual(result[label], labels.count(label))
+            self.assertIsInstance(result[label], int)
+        self.assertAlmostEqual(result['sentiment_score'],
+                               (labels.count('positive') - labels.count('negative')) / len(labels))
+        self.assertEqual(len(result['detailed_sentiments']), 5)
+
+    def test_without_model_uses_textblob(self):
+        with tempfile.TemporaryDirectory() as empty:
+            analyzer = SentimentAnalyzer(model_dir=empty)
+            self.assertEqual(analyzer.analyze_batch(['I love it, wonderful!', '']), ['positive', 'neutral'])
+        self.assertIsNone(analyzer.model)
+
+    def test_default_does_not_fall_back_on_unseen_reviews(self):
+        analyzer = SentimentAnalyzer()
+        result = analyzer.analyze_reviews(UNSEEN_REVIEWS)
+        self.assertEqual(result['fallback_reviews'], 0)
+        self.assertEqual(analyzer.analyze_batch(UNSEEN_REVIEWS),
+                         [analyzer._get_ml_sentiment(text) for text in UNSEEN_REVIEWS])
+
+    def test_fallback_rate_on_unseen_reviews_tracks_threshold(self):
+        analyzer = SentimentAnalyzer(lazy=False)
+        processed = [analyzer._preprocess_text(text) for text in UNSEEN_REVIEWS]
+        confidence = analyzer.scorer.predict_proba(processed).max(axis=1)
+        # Unseen words leave the model close to the three-class prior
+        self.assertLess(confidence.min(), 0.4)
+        for threshold in (0.4, 0.45, 0.6):
+            analyzer.confidence_threshold = threshold
+            analyzer.cache = None
+            _, fallbacks = analyzer._classify(UNSEEN_REVIEWS)
+            self.assertEqual(fallbacks, int((confidence < threshold).sum()))
+
+    def test_threshold_zero_is_plain_ml(self):
+        analyzer = SentimentAnalyzer()
+        analyzer.confidence_threshold = 0
+        ml = [analyzer._get_ml_sentiment(t) if t.strip() else 'neutral' for t in REVIEWS]
+        self.assertEqual(analyzer._classify(REVIEWS), (ml, 0))
+
+    def test_low_confidence_reviews_use_textblob(self):
+        analyzer = SentimentAnalyzer()
+        analyzer.confidence_threshold = 1.0
+        labels, fallbacks = analyzer._classify(REVIEWS)
+        self.assertEqual(fallbacks, 6)
+        for text, label in zip(REVIEWS, labels):
+            if text.strip():
+                secondary = analyzer._get_textblob_sentiment(text)
+                if secondary != 'neutral':
+                    self.assertEqual(label, secondary)
+                else:
+                    self.assertEqual(label, analyzer._get_ml_sentiment(text))
+        self.assertEqual(analyzer.analyze_reviews(REVIEWS)['fallback_reviews'], 6)
+
+    def test_empty(self):
+        self.assertEqual(self.analyzer.analyze_reviews([])['total_reviews'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,58 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+from backend.sentiment_analyzer import SentimentAnalyzer
+from backend.sentiment_cache import SentimentCache, sentiment_key
+
+
+class TestSentimentCache(unittest.TestCase):
+    def test_lru_is_bounded(self):
+        cache = SentimentCache(max_entries=2)
+        cache.put_many({'a': ('positive', False), 'b': ('negative', False)})
+        cache.get_many(['a'])
+        cache.put_many({'c': ('neutral', True)})
+        self.assertEqual(cache.get_many(['a', 'b', 'c']), {'a': ('positive', False), 'c': ('neutral', True)})
+        self.assertEqual(cache.stats()['entries'], 2)
+        self.assertEqual((cache.stats()['hits'], cache.stats()['misses']), (3, 1))
+
+    def test_disk_tier_survives_restart(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'sentiment.sqlite3')
+            first = SentimentCache(path=path)
+            first.put_many({'k': ('positive', True)})
+            first.close()
+            second = SentimentCache(path=path)
+            self.assertEqual(second.get_many(['k']), {'k': ('positive', True)})
+            self.assertEqual(second.stats()['disk_hits'], 1)
+            second.close()
+
+    def test_key_depends_on_model_version(self):
+        self.assertNotEqual(sentiment_key('v1', 'great product'), sentiment_key('v2', 'great product'))
+
+
+class TestSentimentAnalyzerCache(unittest.TestCase):
+    def test_repeated_reviews_skip_inference(self):
+        analyzer = SentimentAnalyzer()
+        analyzer.cache = SentimentCache()
+        reviews = ['Great product', 'GREAT product!!', 'Terrible, broke in a day', 'Great product']
+        first = analyzer.analyze_reviews(reviews)
+        self.assertEqual(analyzer.cache_stats()['misses'], 4)
+        self.assertEqual(analyzer.cache_stats()['entries'], 2)
+        with mock.patch.object(analyzer, '_score', side_effect=AssertionError('inference ran')):
+            second = analyzer.analyze_reviews(reviews)
+        self.assertEqual(second, first)
+        self.assertEqual(analyzer.cache_stats()['hits'], 4)
+
+    def test_cached_labels_match_uncached(self):
+        reviews = ['Love it, works perfectly', 'Meh, average at best', 'Worst purchase ever', '']
+        cached = SentimentAnalyzer()
+        cached.cache = SentimentCache()
+        plain = SentimentAnalyzer()
+        plain.cache = None
+        self.assertEqual(cached.analyze_batch(reviews), plain.analyze_batch(reviews))
+        self.assertEqual(cached.analyze_batch(reviews), plain.analyze_batch(reviews))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+from backend import build_sentiment_model
+from backend.model_artifacts import load_artifacts
+from backend.sentiment_analyzer import SentimentAnalyzer
+
+
+class TestSentimentLoading(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def env(self, **values):
+        patcher = mock.patch.dict(os.environ, values)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_model_loads_on_first_use(self):
+        analyzer = SentimentAnalyzer()
+        self.assertIsNone(analyzer.model)
+        self.assertEqual(analyzer.analyze_single_review('Terrible quality, waste of money.'), 'negative')
+        self.assertIsNotNone(analyzer.model)
+        self.assertNotEqual(analyzer.model_version, 'lexicon')
+
+    def test_missing_artifacts_fall_back_without_training(self):
+        self.env(SENTIMENT_MODEL_DIR=self.tmp.name)
+        with mock.patch.object(build_sentiment_model, 'train_model') as train:
+            analyzer = SentimentAnalyzer()
+            self.assertEqual(analyzer.analyze_batch(['I love it, wonderful!', '']), ['positive', 'neutral'])
+        train.assert_not_called()
+        self.assertIsNone(analyzer.model)
+        self.assertEqual(analyzer.model_version, 'lexicon')
+        self.assertEqual(os.listdir(self.tmp.name), [])
+
+    def test_failed_load_is_retried_after_interval(self):
+        self.env(SENTIMENT_MODEL_DIR=self.tmp.name, SENTIMENT_RELOAD_INTERVAL='60')
+        analyzer = SentimentAnalyzer()
+        analyzer.load_model()
+        self.assertIsNone(analyzer.model)
+        # Artifacts published after the failed attempt are picked up once the interval passes
+        with mock.patch('builtins.print'):
+            build_sentiment_model.main(['--output', os.path.join(self.tmp.name, 'sentiment')])
+        analyzer.load_model()
+        self.assertIsNone(analyzer.model)
+        analyzer._retry_at = 0.0
+        analyzer.load_model()
+        self.assertIsNotNone(analyzer.model)
+
+    def test_missing_artifacts_fail_fast_when_required(self):
+        self.env(SENTIMENT_MODEL_DIR=self.tmp.name, SENTIMENT_REQUIRE_MODEL='1')
+        with self.assertRaises(FileNotFoundError):
+            SentimentAnalyzer()
+
+    def test_build_command_writes_loadable_artifacts(self):
+        output = os.path.join(self.tmp.name, 'sentiment')
+        with mock.patch('builtins.print'):
+            build_sentiment_model.main(['--output', output])
+        model, vectorizer, meta = load_artifacts(output)
+        self.assertEqual(set(model.classes_), {'positive', 'neutral', 'negative'})
+
+        self.env(SENTIMENT_MODEL_DIR=self.tmp.name, SENTIMENT_REQUIRE_MODEL='1')
+        analyzer = SentimentAnalyzer(lazy=False)
+        self.assertEqual(analyzer.model_version, meta['fingerprint'])
+
+
+if __name__ == '__main__':
+    unittest.main()
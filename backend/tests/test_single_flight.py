@@ -0,0 +1,59 @@
+import threading
+import time
+import unittest
+from backend.single_flight import SingleFlight
+
+
+class TestSingleFlight(unittest.TestCase):
+    def setUp(self):
+        self.flight = SingleFlight()
+
+    def _run_concurrently(self, count, key, fn):
+        results, errors = [], []
+
+        def worker():
+            try:
+                results.append(self.flight.do(key, fn))
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker) for _ in range(count)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join(5)
+        return results, errors
+
+    def test_concurrent_calls_share_one_execution(self):
+        calls = []
+
+        def slow():
+            calls.append(1)
+            time.sleep(0.2)
+            return {'title': 'Shared'}
+
+        results, errors = self._run_concurrently(8, 'amazon:amazon.com:B00TEST123', slow)
+        self.assertEqual(errors, [])
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(len(results), 8)
+        self.assertTrue(all(r[0] == {'title': 'Shared'} for r in results))
+        self.assertEqual(sum(1 for r in results if r[1]), 7)
+        self.assertEqual(self.flight.in_flight(), 0)
+
+    def test_errors_propagate_to_waiters(self):
+        def failing():
+            time.sleep(0.2)
+            raise RuntimeError("scrape failed")
+
+        results, errors = self._run_concurrently(4, 'k', failing)
+        self.assertEqual(results, [])
+        self.assertEqual(len(errors), 4)
+
+    def test_sequential_calls_run_again(self):
+        counter = iter(range(10))
+        self.assertEqual(self.flight.do('k', lambda: next(counter)), (0, False))
+        self.assertEqual(self.flight.do('k', lambda: next(counter)), (1, False))
+
+
+if __name__ == '__main__':
+    unittest.main()
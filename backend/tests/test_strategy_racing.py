@@ -0,0 +1,58 @@
+import time
+import unittest
+from advanced_anti_bot_scraper import AdvancedAntiBotScraper
+from backend.politeness import HostPolitenessScheduler
+
+
+class TestStrategyRacing(unittest.TestCase):
+    def setUp(self):
+        self.scraper = AdvancedAntiBotScraper(race=True, hedge_delay=0.1)
+        self.scraper.politeness = HostPolitenessScheduler(min_interval=0, max_interval=0)
+        self.sessions = []
+        self.starts = []
+
+    def _strategy(self, name, duration, status):
+        def run(url, session=None, paced=True):
+            self.sessions.append((name, session, paced))
+            self.starts.append(time.monotonic())
+            time.sleep(duration)
+            return ('<html>' + name + '</html>' if status == 'SUCCESS' else None), status
+        return run
+
+    def test_first_success_wins_without_waiting_for_slow_strategies(self):
+        self.scraper.scrape_with_stealth_requests = self._strategy('stealth', 0.3, 'ANTI_BOT')
+        self.scraper.scrape_with_delayed_requests = self._strategy('delayed', 0.05, 'SUCCESS')
+        self.scraper.scrape_with_proxy_behavior = self._strategy('proxy', 3.0, 'SUCCESS')
+
+        started = time.monotonic()
+        content, status = self.scraper.scrape_with_multiple_strategies('https://www.daraz.pk/products/x-i1.html')
+        elapsed = time.monotonic() - started
+
+        self.assertEqual(status, 'SUCCESS')
+        self.assertEqual(content, '<html>delayed</html>')
+        self.assertLess(elapsed, 1.5)
+        # Each racer got its own session and skipped the per-strategy pacing
+        racer_sessions = [session for _, session, _ in self.sessions]
+        self.assertEqual(len(set(map(id, racer_sessions))), len(racer_sessions))
+        self.assertTrue(all(paced is False for _, _, paced in self.sessions))
+
+    def test_racers_are_distinct_and_paced_per_host(self):
+        self.scraper.politeness = HostPolitenessScheduler(min_interval=0.2, max_interval=0.2)
+        for attr in ('scrape_with_stealth_requests', 'scrape_with_delayed_requests', 'scrape_with_proxy_behavior'):
+            setattr(self.scraper, attr, self._strategy(attr, 0.01, 'HTTP_503'))
+        self.scraper.scrape_with_racing_strategies('https://www.ebay.com/itm/1', hedge_delay=0)
+        # One request per distinct strategy, spaced by the host interval despite a zero hedge delay
+        self.assertEqual(sorted(name for name, _, _ in self.sessions),
+                         ['scrape_with_delayed_requests', 'scrape_with_proxy_behavior', 'scrape_with_stealth_requests'])
+        gaps = [later - earlier for earlier, later in zip(self.starts, self.starts[1:])]
+        self.assertTrue(all(gap >= 0.18 for gap in gaps), gaps)
+
+    def test_all_failures_reported(self):
+        for attr in ('scrape_with_stealth_requests', 'scrape_with_delayed_requests', 'scrape_with_proxy_behavior'):
+            setattr(self.scraper, attr, self._strategy(attr, 0.01, 'HTTP_503'))
+        self.assertEqual(self.scraper.scrape_with_racing_strategies('https://www.ebay.com/itm/1'),
+                         (None, 'ALL_STRATEGIES_FAILED'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,64 @@
+import unittest
+from backend.scraper import ProductScraper
+from backend.strategy_stats import StrategyStats
+
+PRIORS = {'requests': (3.0, 0.5), 'selenium': (12.0, 0.6), 'advanced': (45.0, 0.4)}
+STRATEGIES = ['selenium', 'requests', 'advanced']
+
+
+class TestStrategyStats(unittest.TestCase):
+    def setUp(self):
+        self.stats = StrategyStats(priors=PRIORS, explore_every=0)
+
+    def test_priors_put_cheap_strategy_first(self):
+        self.assertEqual(self.stats.order('amazon.com', STRATEGIES), ['requests', 'selenium', 'advanced'])
+
+    def test_failing_strategy_is_demoted_then_skipped(self):
+        for _ in range(3):
+            self.stats.record('daraz.pk', 'requests', False, 4.0)
+        self.assertEqual(self.stats.order('daraz.pk', STRATEGIES)[0], 'selenium')
+        for _ in range(20):
+            self.stats.record('daraz.pk', 'requests', False, 4.0)
+        self.assertNotIn('requests', self.stats.order('daraz.pk', STRATEGIES))
+        # Other domains keep their own history
+        self.assertEqual(self.stats.order('ebay.com', STRATEGIES)[0], 'requests')
+
+    def test_periodic_exploration_retries_skipped_strategy(self):
+        stats = StrategyStats(priors=PRIORS, explore_every=3)
+        for _ in range(30):
+            stats.record('daraz.pk', 'requests', False, 2.0)
+        orders = [stats.order('daraz.pk', STRATEGIES) for _ in range(3)]
+        self.assertNotIn('requests', orders[0])
+        self.assertEqual(orders[2][0], 'requests')
+
+    def test_never_skips_everything(self):
+        for strategy in STRATEGIES:
+            for _ in range(30):
+                self.stats.record('x.com', strategy, False, 1.0)
+        self.assertEqual(sorted(self.stats.order('x.com', STRATEGIES)), sorted(STRATEGIES))
+
+
+class TestScraperStrategyOrdering(unittest.TestCase):
+    def test_scrape_product_prefers_working_cheap_strategy(self):
+        scraper = ProductScraper()
+        calls = []
+
+        def fake(name, result):
+            def run(url, platform):
+                calls.append(name)
+                return dict(result) if result else None
+            return run
+
+        scraper.scrape_strategies = {
+            'requests': fake('requests', {'title': 'Widget', 'price': '$5.00'}),
+            'selenium': fake('selenium', None),
+            'advanced': fake('advanced', None)
+        }
+        data = scraper.scrape_product('https://www.ebay.com/itm/123456')
+        self.assertEqual(calls, ['requests'])
+        self.assertEqual(data['platform'], 'ebay')
+        self.assertEqual(scraper.strategy_stats.snapshot('ebay.com')['requests']['samples'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
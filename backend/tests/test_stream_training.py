@@ -0,0 +1,99 @@
+import itertools
+import json
+import os
+import tempfile
+import unittest
+import pandas as pd
+from unittest import mock
+from backend.model_artifacts import load_artifacts
+from backend.sentiment_analyzer import SentimentAnalyzer
+from backend.stream_training import StreamingTrainer, in_holdout, iter_corpus
+
+WORDS = {
+    'positive': ['amazing', 'excellent', 'great', 'perfect', 'love', 'fantastic'],
+    'neutral': ['okay', 'average', 'decent', 'standard', 'fine', 'acceptable'],
+    'negative': ['terrible', 'awful', 'broken', 'waste', 'poor', 'disappointing'],
+}
+THINGS = ['product', 'quality', 'shipping', 'price', 'seller', 'packaging', 'battery', 'screen']
+
+
+def corpus_rows():
+    rows = []
+    for label, words in WORDS.items():
+        for word, thing, other in itertools.product(words, THINGS, words):
+            rows.append({'text': f"{word} {thing}, {other} overall", 'sentiment': label})
+    rows.append({'text': 'label outside the known classes', 'sentiment': 'spam'})
+    return rows
+
+
+class TestStreamTraining(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.rows = corpus_rows()
+        self.jsonl = os.path.join(self.tmp.name, 'reviews.jsonl')
+        with open(self.jsonl, 'w') as f:
+            for row in self.rows:
+                f.write(json.dumps(row) + '\n')
+        self.csv = os.path.join(self.tmp.name, 'reviews.csv')
+        pd.DataFrame(self.rows).to_csv(self.csv, index=False)
+        self.output = os.path.join(self.tmp.name, 'model', 'sentiment')
+
+    def trainer(self, **options):
+        return StreamingTrainer(n_features=2 ** 12, chunk_size=50, holdout=10, **options)
+
+    def test_csv_and_jsonl_stream_in_chunks(self):
+        for path in (self.jsonl, self.csv):
+            chunks = list(iter_corpus(path, chunk_size=50))
+            self.assertTrue(all(len(texts) <= 50 for texts, _ in chunks))
+            self.assertEqual(sum(len(texts) for texts, _ in chunks), len(self.rows))
+
+    def test_trains_servable_artifacts_with_holdout_accuracy(self):
+        trainer = self.trainer()
+        meta, accuracy = trainer.fit(self.jsonl, self.output, epochs=2, checkpoint_every=0)
+        self.assertGreater(accuracy, 0.9)
+        self.assertEqual(trainer.skipped_rows, 2)
+        held_out = sum(in_holdout(row['text'], 10) for row in self.rows if row['sentiment'] != 'spam')
+        self.assertEqual(len(trainer.holdout_texts), held_out)
+        self.assertEqual(trainer.trained_rows, 2 * (len(self.rows) - 1 - held_out))
+
+        model, vectorizer, loaded = load_artifacts(self.output)
+        self.assertEqual((loaded['features'], loaded['fingerprint']), ('hashing', meta['fingerprint']))
+        analyzer = SentimentAnalyzer(lazy=False, model_dir=os.path.dirname(self.output))
+        analyzer.confidence_threshold = 0
+        self.assertEqual(analyzer.analyze_batch(['excellent battery, great overall', 'awful screen, poor overall']),
+                         ['positive', 'negative'])
+
+    def test_checkpoints_allow_resume(self):
+        checkpoint = f"{self.output}.checkpoint"
+        passes = []
+
+        def interrupted(*args, **kwargs):
+            # The first pass counts document frequencies; stop the training pass midway
+            passes.append(1)
+            for number, chunk in enumerate(iter_corpus(*args, **kwargs)):
+                if len(passes) == 2 and number == 3:
+                    raise KeyboardInterrupt
+                yield chunk
+
+        with mock.patch('backend.stream_training.iter_corpus', side_effect=interrupted):
+            with self.assertRaises(KeyboardInterrupt):
+                self.trainer().fit(self.csv, self.output, checkpoint_every=2)
+        self.assertTrue(os.path.exists(os.path.join(checkpoint, 'state.pkl')))
+        self.assertTrue(os.path.exists(os.path.join(checkpoint, 'model', 'meta.json')))
+        # The (possibly served) output directory only receives the finished model
+        self.assertFalse(os.path.exists(self.output))
+
+        resumed = self.trainer()
+        _, accuracy = resumed.fit(self.csv, self.output, checkpoint_every=2, resume=True)
+        self.assertIsNotNone(accuracy)
+        self.assertFalse(os.path.exists(checkpoint))
+        self.assertTrue(os.path.exists(os.path.join(self.output, 'meta.json')))
+        complete = self.trainer()
+        complete.fit(self.csv, os.path.join(self.tmp.name, 'complete'), checkpoint_every=0)
+        self.assertEqual(resumed.trained_rows, complete.trained_rows)
+        self.assertEqual(len(resumed.holdout_texts), len(complete.holdout_texts))
+
+
+if __name__ == '__main__':
+    unittest.main()
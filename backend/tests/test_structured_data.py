@@ -0,0 +1,51 @@
+import os
+import unittest
+from unittest import mock
+from backend.scraper import ProductScraper
+from backend.structured_data import extract_jsonld_product, iter_jsonld, missing_fields
+
+FIXTURES = os.path.join(os.path.dirname(__file__), 'fixtures')
+
+
+def load(name):
+    with open(os.path.join(FIXTURES, name), 'rb') as f:
+        return f.read()
+
+
+class TestStructuredData(unittest.TestCase):
+    def test_reads_bytes_and_text(self):
+        raw = load('amazon_sample.html')
+        data = extract_jsonld_product(raw)
+        self.assertEqual(data, extract_jsonld_product(raw.decode('utf-8')))
+        self.assertEqual(data['price'], '$29.99')
+        self.assertEqual((data['rating'], data['review_count']), (4.5, 123))
+        self.assertEqual(data['reviews'], [{'text': 'Great!'}])
+        self.assertEqual(missing_fields(data), [])
+
+    def test_graph_and_invalid_blocks(self):
+        html = ('<script type="application/ld+json">{not json</script>'
+                '<script type=application/ld+json>{"@graph": [{"@type": "WebPage"},'
+                '{"@type": ["Product"], "name": "Graph Product", "offers": [{"price": "5"}]}]}</script>')
+        self.assertEqual(len(list(iter_jsonld(html))), 3)
+        data = extract_jsonld_product(html)
+        self.assertEqual((data['title'], data['price']), ('Graph Product', '$5.00'))
+        self.assertEqual(missing_fields(data), ['rating', 'review_count', 'reviews'])
+
+    def test_complete_schema_skips_dom(self):
+        scraper = ProductScraper()
+        with mock.patch('backend.scraper.parse_html') as parse:
+            data = scraper.extract_data(load('amazon_sample.html'), 'amazon', 'https://www.amazon.com/dp/B00TEST123')
+        parse.assert_not_called()
+        self.assertIn('Sample Amazon Product', data['title'])
+
+    def test_partial_schema_fills_only_missing_fields(self):
+        scraper = ProductScraper()
+        html = load('ebay_item.html').replace(b'US $19.99', b'US $99.99')
+        data = scraper.extract_data(html, 'ebay', 'https://www.ebay.com/itm/999999')
+        self.assertEqual(data['title'], 'Test eBay Item Name')
+        self.assertEqual(data['price'], '$19.99')
+        self.assertEqual(data['seller'], 'TestEbaySeller')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,6 +2,8 @@ import re
 import math
 from typing import Dict, Any, List
 import logging
+import numpy as np
+from backend.review_text import ReviewBatch
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -103,45 +105,31 @@ class TrustScorer:
             else:
                 return 0.5  # Default trust for unknown domains
     
-    def calculate_review_quality_score(self, reviews):
+    def review_batch(self, reviews):
+        """Review features with this scorer's suspicious-keyword hits, for sharing across stages"""
+        return ReviewBatch.from_reviews(reviews, keywords=self.suspicious_keywords)
+    
+    def calculate_review_quality_score(self, reviews, batch=None):
         """Calculate quality score based on review characteristics"""
         if not reviews:
             return 0.0
         
+        if batch is None or batch.keywords != tuple(self.suspicious_keywords):
+            batch = self.review_batch(reviews)
         quality_score = 0.0
-        total_reviews = len(reviews)
+        total_reviews = len(batch)
         
         # Check for review length and detail
-        detailed_reviews = 0
-        for review in reviews:
-            if isinstance(review, dict):
-                text = review.get('text', '')
-            else:
-                text = str(review)
-            
-            if len(text) > 50:  # Detailed reviews
-                detailed_reviews += 1
+        detailed_reviews = int(np.count_nonzero(batch.lengths > 50))
         
         # Reward detailed reviews
         if total_reviews > 0:
             detail_ratio = detailed_reviews / total_reviews
             quality_score += detail_ratio * 0.3
         
-        # Check for suspicious patterns
-        suspicious_patterns = 0
-        for review in reviews:
-            if isinstance(review, dict):
-                text = review.get('text', '').lower()
-            else:
-                text = str(review).lower()
-            
-            # Check for repetitive content
-            if len(set(text.split())) < 5:  # Very short reviews
-                suspicious_patterns += 1
-            
-            # Check for suspicious keywords
-            if any(keyword in text for keyword in self.suspicious_keywords):
-                suspicious_patterns += 1
+        # Check for suspicious patterns: very short / repetitive reviews and suspicious keywords
+        suspicious_patterns = int(np.count_nonzero(batch.unique_tokens < 5)) + \
+            int(np.count_nonzero(batch.keyword_hits))
         
         if total_reviews > 0:
             suspicious_ratio = suspicious_patterns / total_reviews
@@ -229,12 +217,13 @@ class TrustScorer:
         except (ValueError, TypeError):
             return 0.5
     
-    def calculate_trust_score(self, product_data, sentiment_data, domain=None):
+    def calculate_trust_score(self, product_data, sentiment_data, domain=None, review_batch=None):
         """Calculate overall trust score"""
         try:
             # Get individual component scores
             domain_score = self.calculate_domain_trust_score(product_data.get('url', ''))
-            review_quality_score = self.calculate_review_quality_score(product_data.get('reviews', []))
+            review_quality_score = self.calculate_review_quality_score(
+                product_data.get('reviews', []), batch=review_batch)
             rating_consistency_score = self.calculate_rating_consistency_score(
                 product_data.get('rating'), 
                 product_data.get('review_count'), 
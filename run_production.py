@@ -1,5 +1,4 @@
-from waitress import serve
-from app import app
+import os
 import logging
 
 # Configure logging
@@ -10,7 +9,17 @@ logging.basicConfig(
 logger = logging.getLogger('waitress')
 
 if __name__ == '__main__':
+    # Kept under the main guard: spawned extraction workers re-import this
+    # module as __mp_main__ and must not build the app (scraper, browsers, models)
+    # Parse pages in worker processes so request threads never hold the GIL on CPU work
+    os.environ.setdefault('EXTRACTION_WORKERS', str(os.cpu_count() or 2))
+    from waitress import serve
+    from app import app, scraper
+    
     logger.info('Starting production server...')
+    # Launch browsers once up front so requests never pay Chrome startup cost
+    scraper.warm_driver_pool()
+    scraper.warm_extraction_pool()
     # Configure Waitress with reasonable defaults
     serve(
         app,